@@ -0,0 +1,139 @@
+"""Loading and application of branching ratio sets for depletion chains"""
+
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+import openmc.deplete
+import yaml
+
+from ndmanager.env import NDMANAGER_CONFIG
+
+BranchingRatios = Dict[str, Dict[str, Dict[str, float]]]
+
+BRANCHING_RATIOS_VERSION = 1
+PACKAGED_BRANCHING_RATIOS = Path(__file__).parents[1] / "branching_ratios"
+USER_BRANCHING_RATIOS = NDMANAGER_CONFIG / "branching_ratios"
+
+
+def list_branching_ratios() -> Dict[str, Path]:
+    """List the available branching ratio sets. Sets registered by the user
+    take precedence over the sets shipped with NDManager.
+
+    Returns:
+        Dict[str, Path]: A dictionnary mapping set names to their files
+    """
+    sets = {}
+    for directory in (PACKAGED_BRANCHING_RATIOS, USER_BRANCHING_RATIOS):
+        if directory.exists():
+            sets |= {p.stem: p for p in sorted(directory.glob("*.yml"))}
+    return sets
+
+
+def read_branching_ratios(path: str | Path) -> BranchingRatios:
+    """Read and validate a branching ratio file. The file must have a `version`
+    field and a `reactions` field, mapping reactions to parent nuclides to
+    target nuclides to branching ratios.
+
+    Args:
+        path (str | Path): Path to the branching ratio file
+
+    Raises:
+        ValueError: The file is not a valid branching ratio file
+
+    Returns:
+        BranchingRatios: The branching ratios
+    """
+    with open(path, encoding="utf-8") as f:
+        content = yaml.safe_load(f)
+    if not isinstance(content, dict) or "reactions" not in content:
+        raise ValueError(f"{path} is not a branching ratio file")
+    if content.get("version") != BRANCHING_RATIOS_VERSION:
+        raise ValueError(
+            f"Unsupported branching ratio file version in {path}: "
+            f"{content.get('version')}"
+        )
+    ratios = {}
+    for reaction, parents in content["reactions"].items():
+        ratios[reaction] = {}
+        for parent, targets in parents.items():
+            ratios[reaction][parent] = {t: float(br) for t, br in targets.items()}
+    return ratios
+
+
+@lru_cache
+def _load(path: Path, mtime: float) -> BranchingRatios:
+    # mtime is only part of the cache key, so that edited files are read again
+    return read_branching_ratios(path)
+
+
+def load_branching_ratios(name: str | Path) -> BranchingRatios:
+    """Load a branching ratio set, either by name or by path. Loaded sets are
+    cached for the lifetime of the process, and should not be modified.
+
+    Args:
+        name (str | Path): The name of a registered set or a path to a file
+
+    Raises:
+        KeyError: No set with this name exists
+
+    Returns:
+        BranchingRatios: The branching ratios
+    """
+    sets = list_branching_ratios()
+    if str(name) in sets:
+        path = sets[str(name)]
+    elif Path(name).is_file():
+        path = Path(name).absolute()
+    else:
+        raise KeyError(f"Unknown branching ratio set: {name}")
+    return _load(path, path.stat().st_mtime)
+
+
+def register_branching_ratios(path: str | Path, name: str | None = None) -> Path:
+    """Register a user defined branching ratio set, so that it can be loaded by
+    name.
+
+    Args:
+        path (str | Path): Path to the branching ratio file
+        name (str | None, optional): Name of the set. Defaults to None, in
+                                     which case the file name is used.
+
+    Returns:
+        Path: Path to the registered file
+    """
+    read_branching_ratios(path)
+    name = Path(path).stem if name is None else name
+    USER_BRANCHING_RATIOS.mkdir(parents=True, exist_ok=True)
+    target = USER_BRANCHING_RATIOS / f"{name}.yml"
+    shutil.copyfile(path, target)
+    return target
+
+
+def apply_branching_ratios(
+    chain: openmc.deplete.Chain, ratios: BranchingRatios
+) -> openmc.deplete.Chain:
+    """Apply a branching ratio set to a depletion chain. The set is first
+    restricted to the parent and target nuclides present in the chain in a
+    single pass, so that sets written for larger chains can be applied to
+    reduced chains.
+
+    Args:
+        chain (openmc.deplete.Chain): The depletion chain, modified in place
+        ratios (BranchingRatios): The branching ratios
+
+    Returns:
+        openmc.deplete.Chain: The depletion chain
+    """
+    nuclides = chain.nuclide_dict
+    for reaction, parents in ratios.items():
+        applicable = {}
+        for parent, targets in parents.items():
+            if parent not in nuclides or not targets.keys() <= nuclides.keys():
+                continue
+            if any(r.type == reaction for r in chain[parent].reactions):
+                applicable[parent] = dict(targets)
+        if applicable:
+            chain.set_branch_ratios(applicable, reaction=reaction, strict=False)
+    return chain
@@ -0,0 +1,237 @@
+"""Doppler broadening of pointwise cross sections, without NJOY"""
+
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Iterable, Set
+
+import h5py
+import numpy as np
+from scipy.special import erf
+
+from ndmanager.API.cow import reflink
+from ndmanager.API.utils import iter_temperature_nodes
+
+K_BOLTZMANN = 8.617333262e-5  # eV/K
+# Broadening kernels are truncated at this distance in reduced velocity units,
+# the neglected tail is smaller than exp(-16)
+CUTOFF = 4.0
+# Maximum number of (target energy, source segment) pairs held in memory at once
+BLOCK_SIZE = 1 << 20
+
+REACTION_NODE = re.compile(r"^reactions/reaction_\d+$")
+
+
+def _moments(z1: np.ndarray, z2: np.ndarray) -> np.ndarray:
+    """Compute the integrals of z^k exp(-z^2) between z1 and z2 for k = 0..4
+
+    Args:
+        z1 (np.ndarray): The lower bounds
+        z2 (np.ndarray): The upper bounds
+
+    Returns:
+        np.ndarray: The integrals, with shape (5, len(z1))
+    """
+    e1, e2 = np.exp(-(z1**2)), np.exp(-(z2**2))
+    h = np.empty((5,) + z1.shape)
+    h[0] = 0.5 * np.sqrt(np.pi) * (erf(z2) - erf(z1))
+    h[1] = 0.5 * (e1 - e2)
+    for k in range(2, 5):
+        h[k] = 0.5 * ((k - 1) * h[k - 2] + z1 ** (k - 1) * e1 - z2 ** (k - 1) * e2)
+    return h
+
+
+# Binomial coefficients C(m, k) for m, k = 0..4
+_BINOMIAL = np.array(
+    [[1, 0, 0, 0, 0], [1, 1, 0, 0, 0], [1, 2, 1, 0, 0], [1, 3, 3, 1, 0], [1, 4, 6, 4, 1]],
+    dtype=float,
+)
+
+
+def _integrate(
+    lower: np.ndarray, upper: np.ndarray, poly: np.ndarray, y: np.ndarray, sign: int
+) -> np.ndarray:
+    """Integrate p(x) exp(-(x - sign * y)^2) over x > 0 for each y, where p is
+    a piecewise polynomial of degree 4.
+
+    Args:
+        lower (np.ndarray): The lower bounds of the pieces of p
+        upper (np.ndarray): The upper bounds of the pieces of p
+        poly (np.ndarray): The coefficients of each piece, with shape (n, 5)
+        y (np.ndarray): The sorted reduced velocities to compute the integral at
+        sign (int): 1 or -1
+
+    Returns:
+        np.ndarray: The integrals
+    """
+    shift = sign * y
+    first = np.searchsorted(upper, shift - CUTOFF, side="right")
+    last = np.searchsorted(lower, shift + CUTOFF, side="left")
+    counts = np.maximum(last - first, 0)
+    result = np.zeros(len(y))
+
+    # Split the target velocities in blocks of bounded memory usage
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(y):
+        limit = (ends[start - 1] if start else 0) + BLOCK_SIZE
+        stop = max(start + 1, int(np.searchsorted(ends, limit, side="right")))
+        n = counts[start:stop]
+        if n.sum() == 0:
+            start = stop
+            continue
+        target = np.repeat(np.arange(start, stop), n)
+        offsets = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+        piece = first[target] + offsets
+
+        s = shift[target]
+        z1 = np.clip(lower[piece] - s, -CUTOFF, CUTOFF)
+        z2 = np.clip(upper[piece] - s, -CUTOFF, CUTOFF)
+        h = _moments(z1, z2)
+        # Expand p(z + s) = sum_k q_k z^k
+        p = poly[piece]
+        powers = s[:, None] ** np.arange(5)
+        q = np.zeros_like(p)
+        for m in range(5):
+            for k in range(m + 1):
+                q[:, k] += _BINOMIAL[m, k] * p[:, m] * powers[:, m - k]
+        values = np.einsum("ik,ki->i", q, h)
+        result[start:stop] = np.bincount(target - start, values, minlength=stop - start)
+        start = stop
+    return result
+
+
+def broaden(
+    energy: np.ndarray, xs: np.ndarray, awr: float, dT: float, emax: float = np.inf
+) -> np.ndarray:
+    """Doppler broaden a linearly interpolable cross section with the exact
+    free gas kernel, as done by the SIGMA1 method of NJOY's BROADR module. The
+    cross section is integrated analytically over each interval of the energy
+    grid. It is assumed to follow a 1/v law below the first energy point, and
+    to be constant above the last one. Broadening a cross section already
+    broadened to a temperature T0 by dT gives the cross section at T0 + dT.
+
+    Args:
+        energy (np.ndarray): The energy grid in eV
+        xs (np.ndarray): The cross section values
+        awr (float): The atomic weight ratio of the target nuclide
+        dT (float): The temperature increase in Kelvin
+        emax (float, optional): The cross section is only broadened below
+                                this energy in eV. Defaults to np.inf.
+
+    Returns:
+        np.ndarray: The broadened cross section, on the same energy grid
+    """
+    energy = np.asarray(energy, dtype=float)
+    xs = np.asarray(xs, dtype=float)
+    alpha = awr / (K_BOLTZMANN * dT)
+    x = np.sqrt(alpha * energy)
+
+    # Pieces of x^2 * sigma(x) as polynomials in x: a 1/v extension, a*x^2 +
+    # b*x^4 over each interval where sigma is linear in E, and a constant
+    # extension
+    n = len(energy)
+    poly = np.zeros((n + 1, 5))
+    poly[0, 1] = xs[0] * x[0]
+    de = np.diff(energy)
+    slope = np.divide(np.diff(xs), de, out=np.zeros(n - 1), where=de > 0)
+    poly[1:n, 2] = xs[:-1] - slope * energy[:-1]
+    poly[1:n, 4] = slope / alpha
+    poly[n, 2] = xs[-1]
+    lower = np.concatenate(([0.0], x))
+    upper = np.concatenate((x, [np.inf]))
+
+    broadened = xs.copy()
+    todo = np.flatnonzero((energy < emax) & (x > 0))
+    y = x[todo]
+    integral = _integrate(lower, upper, poly, y, 1)
+    low = y < CUTOFF
+    integral[low] -= _integrate(lower, upper, poly, y[low], -1)
+    broadened[todo] = integral / (np.sqrt(np.pi) * y**2)
+    return broadened
+
+
+def broaden_file(
+    path: str | Path, temperatures: Iterable[int], emax: float = np.inf
+) -> Set[int]:
+    """Add temperatures to an OpenMC HDF5 neutron data file by Doppler
+    broadening the cross sections of its lowest temperature. The new
+    temperatures share the energy grid of the lowest temperature. Unresolved
+    resonance probability tables are copied from the lowest temperature.
+
+    Args:
+        path (str | Path): Path to the HDF5 file
+        temperatures (Iterable[int]): The temperatures to add in Kelvin
+        emax (float, optional): Cross sections are only broadened below this
+                                energy in eV. Defaults to np.inf.
+
+    Raises:
+        ValueError: A temperature is lower than the lowest temperature of the file
+
+    Returns:
+        Set[int]: The temperatures added to the file
+    """
+    path = Path(path)
+    with h5py.File(path, "r") as f:
+        group = list(f.values())[0]
+        existing = {int(t[:-1]) for t in group["kTs"]}
+    base = min(existing)
+    new = set(temperatures) - existing
+    for t in new:
+        if t <= base:
+            raise ValueError(
+                f"Cannot broaden {path} to {t}K, its lowest temperature is {base}K"
+            )
+    if not new:
+        return new
+
+    # The temperatures are added to a copy of the file, which then replaces
+    # it: the file is never left partially broadened, and the files sharing
+    # its data are not modified
+    tmppath = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if not reflink(path, tmppath):
+        shutil.copy2(path, tmppath)
+    try:
+        with h5py.File(tmppath, "r+") as f:
+            _add_temperatures(f, base, new, emax)
+        os.replace(tmppath, path)
+    finally:
+        tmppath.unlink(missing_ok=True)
+    return new
+
+
+def _add_temperatures(f: h5py.File, base: int, new: Set[int], emax: float) -> None:
+    """Add temperatures to an open OpenMC HDF5 neutron data file, see
+    `broaden_file`
+
+    Args:
+        f (h5py.File): The file, open for writing
+        base (int): The temperature to broaden from in Kelvin
+        new (Set[int]): The temperatures to add in Kelvin
+        emax (float): Cross sections are only broadened below this energy in eV
+    """
+    group = list(f.values())[0]
+    awr = group.attrs["atomic_weight_ratio"]
+    energy = group[f"energy/{base}K"][...]
+    for path, node_temperatures in list(iter_temperature_nodes(group)):
+        if base not in node_temperatures:
+            continue
+        node = group[path]
+        source = node[f"{base}K"]
+        for t in sorted(new):
+            name = f"{t}K"
+            if path == "kTs":
+                node.create_dataset(name, data=K_BOLTZMANN * t)
+            elif REACTION_NODE.match(path) and "xs" in source:
+                dataset = source["xs"]
+                idx = int(dataset.attrs.get("threshold_idx", 0))
+                full = np.zeros(len(energy))
+                full[idx:] = dataset[...]
+                xs = broaden(energy, full, awr, t - base, emax)
+                target = node.create_group(name)
+                target.create_dataset("xs", data=xs[idx:])
+                for key, value in dataset.attrs.items():
+                    target["xs"].attrs[key] = value
+            else:
+                f.copy(source, node, name=name)
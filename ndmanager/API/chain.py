@@ -0,0 +1,292 @@
+"""Parallel parsing of the ENDF6 tapes used to build depletion chains"""
+
+import os
+import pickle
+from functools import partial
+from io import StringIO
+from pathlib import Path
+from types import FunctionType
+from typing import Any, Callable, Iterable, List, Tuple
+
+import openmc
+import openmc.data
+import openmc.deplete
+from tqdm import tqdm
+
+from ndmanager.API.endf6_index import update_index
+from ndmanager.API.hashing import compute_file_sha1
+from ndmanager.API.pool import imap
+from ndmanager.env import NDMANAGER_CACHE
+
+# Chain.from_endf only reads the MF1/MT451 header and the MF3 Q values of
+# neutron tapes, the rest of the tape can be skipped.
+NEUTRON_CHAIN_MF = (" 0", " 1", " 3")
+
+
+def read_decay(tape: str | Path) -> openmc.data.Decay:
+    """Parse the decay data of an ENDF6 decay tape
+
+    Args:
+        tape (str | Path): Path to an ENDF6 decay tape
+
+    Returns:
+        openmc.data.Decay: The decay data
+    """
+    return openmc.data.Decay(tape)
+
+
+def read_fpy(tape: str | Path) -> openmc.data.FissionProductYields:
+    """Parse the fission product yields of an ENDF6 NFPY tape
+
+    Args:
+        tape (str | Path): Path to an ENDF6 NFPY tape
+
+    Returns:
+        openmc.data.FissionProductYields: The fission product yields
+    """
+    return openmc.data.FissionProductYields(tape)
+
+
+def read_neutron_sections(tape: str | Path) -> str:
+    """Read the sections of a neutron ENDF6 tape needed to build a depletion
+    chain, i.e. the MF1 and MF3 files and the control records.
+
+    Args:
+        tape (str | Path): Path to a neutron ENDF6 tape
+
+    Returns:
+        str: A valid ENDF6 tape containing only the MF1 and MF3 files
+    """
+    with open(tape, "r", encoding="utf-8") as f:
+        lines = [f.readline()]
+        lines.extend(line for line in f if line[70:72] in NEUTRON_CHAIN_MF)
+    return "".join(lines)
+
+
+def cache_path(parser: Callable, sha1: str) -> Path:
+    """Path to the cached result of a parsing function for a given tape. Cached
+    results are keyed by the SHA1 of the tape and by the OpenMC version, since
+    they are pickled OpenMC objects.
+
+    Args:
+        parser (Callable): The parsing function
+        sha1 (str): The SHA1 of the ENDF6 tape
+
+    Returns:
+        Path: Path to the cache file
+    """
+    return NDMANAGER_CACHE / "chain" / openmc.__version__ / parser.__name__ / sha1
+
+
+def cached_parse(parser: Callable, tape: str | Path, sha1: str | None = None) -> Any:
+    """Apply a parsing function to a tape, reading the result from the cache if
+    it has already been computed for an identical tape.
+
+    Args:
+        parser (Callable): The parsing function
+        tape (str | Path): Path to an ENDF6 tape
+        sha1 (str | None, optional): The SHA1 of the tape, computed if None.
+                                     Defaults to None.
+
+    Returns:
+        Any: The parsed tape
+    """
+    if sha1 is None:
+        sha1 = compute_file_sha1(tape)
+    path = cache_path(parser, sha1)
+    if path.exists():
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    result = parser(tape)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmppath, "wb") as f:
+        pickle.dump(result, f)
+    os.replace(tmppath, path)
+    return result
+
+
+def _cached_task(parser: Callable, task: Tuple[Path, str | None]) -> Any:
+    """Apply `cached_parse` to a tape and its SHA1
+
+    Args:
+        parser (Callable): The parsing function
+        task (Tuple[Path, str | None]): The path to the tape and its SHA1
+
+    Returns:
+        Any: The parsed tape
+    """
+    return cached_parse(parser, *task)
+
+
+def parse_tapes(
+    parser: Callable,
+    tapes: List[Path],
+    desc: str,
+    processes: int = 1,
+    cache: bool = True,
+) -> List:
+    """Apply a parsing function to a list of tapes using a pool of processes
+
+    Args:
+        parser (Callable): The parsing function
+        tapes (List[Path]): The list of tapes to parse
+        desc (str): Description for the tqdm bar
+        processes (int, optional): Number of concurrent processes. Defaults to 1.
+        cache (bool, optional): Use the on-disk cache of parsed tapes, keyed by
+                                the SHA1 of the tapes read from the header
+                                index of their sublibrary. Defaults to True.
+
+    Returns:
+        List: The parsed tapes, in the same order as the input
+    """
+    tasks = tapes
+    if cache:
+        # The header indexes are loaded once, and the SHA1 of each tape is
+        # handed to the workers. SHA1 of tapes missing from the index are
+        # computed by the workers.
+        indexes = {}
+        tasks = []
+        for tape in tapes:
+            tape = Path(tape)
+            if tape.parent not in indexes:
+                indexes[tape.parent] = update_index(tape.parent)
+            entry = indexes[tape.parent].get(tape.name, {})
+            tasks.append((tape, entry.get("sha1")))
+        parser = partial(_cached_task, parser)
+    bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
+    pbar = tqdm(total=len(tasks), bar_format=bar_format, desc=desc)
+    if processes == 1:
+        results = []
+        for task in tasks:
+            results.append(parser(task))
+            pbar.update()
+    else:
+        chunksize = max(1, len(tasks) // (4 * processes))
+        results = []
+        for result in imap(parser, tasks, processes, chunksize):
+            results.append(result)
+            pbar.update()
+    pbar.close()
+    return results
+
+
+def _passthrough(cls: type) -> type:
+    """Wrap a data class so that calling it on an existing instance returns
+    that instance instead of parsing it again
+
+    Args:
+        cls (type): The data class
+
+    Returns:
+        type: The wrapped class
+    """
+
+    class Passthrough(cls):
+        # __init__ is not called since the returned object is not an instance
+        # of Passthrough
+        def __new__(klass, obj, *args, **kwargs):
+            if isinstance(obj, cls):
+                return obj
+            return cls(obj, *args, **kwargs)
+
+    return Passthrough
+
+
+class _Overlay:
+    """Read-only view of a module with some of its attributes replaced"""
+
+    def __init__(self, module: Any, **overrides: Any):
+        self._module = module
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._module, name)
+
+
+def supports_preparsed() -> bool:
+    """Check that OpenMC's Chain.from_endf builds its Decay and
+    FissionProductYields objects through `openmc.data`, which is what
+    `from_preparsed` relies on. This holds for OpenMC 0.15.
+
+    Returns:
+        bool: Whether `from_preparsed` can be used
+    """
+    code = openmc.deplete.Chain.from_endf.__func__.__code__
+    return {"openmc", "data", "Decay", "FissionProductYields"} <= set(code.co_names)
+
+
+def from_preparsed(
+    decay: List[openmc.data.Decay],
+    nfpy: List[openmc.data.FissionProductYields],
+    neutron: List[StringIO],
+    reactions: List[str],
+) -> openmc.deplete.Chain:
+    """Run OpenMC's Chain.from_endf on already parsed Decay and
+    FissionProductYields objects in place of decay and NFPY tapes.
+    Chain.from_endf builds these objects itself from the tapes it is given,
+    which would parse the tapes again in the main process. A copy of the
+    function is called with its `openmc` global replaced by an overlay, so
+    that `openmc.data` itself is left untouched.
+
+    Args:
+        decay (List[openmc.data.Decay]): The parsed decay data
+        nfpy (List[openmc.data.FissionProductYields]): The parsed NFPY data
+        neutron (List[StringIO]): The neutron tapes
+        reactions (List[str]): Transmutation reactions to include
+
+    Returns:
+        openmc.deplete.Chain: The depletion chain
+    """
+    func = openmc.deplete.Chain.from_endf.__func__
+    data = _Overlay(
+        openmc.data,
+        Decay=_passthrough(openmc.data.Decay),
+        FissionProductYields=_passthrough(openmc.data.FissionProductYields),
+    )
+    namespace = func.__globals__ | {"openmc": _Overlay(openmc, data=data)}
+    from_endf = FunctionType(
+        func.__code__, namespace, func.__name__, func.__defaults__, func.__closure__
+    )
+    from_endf.__kwdefaults__ = func.__kwdefaults__
+    return from_endf(openmc.deplete.Chain, decay, nfpy, neutron, reactions)
+
+
+def chain_from_endf(
+    decay: Iterable[Path],
+    nfpy: Iterable[Path],
+    neutron: Iterable[Path],
+    reactions: Iterable[str],
+    processes: int = 1,
+    cache: bool = True,
+) -> openmc.deplete.Chain:
+    """Build a depletion chain from ENDF6 tapes. The decay and fission product
+    yield data are parsed in parallel and handed to OpenMC's Chain.from_endf,
+    which then only has to assemble the chain. Parsed tapes are cached on disk,
+    so that rebuilding a chain from the same tapes does not read them again.
+    With OpenMC versions that `from_preparsed` does not support, the tapes are
+    given to Chain.from_endf as is.
+
+    Args:
+        decay (Iterable[Path]): Paths to the decay tapes
+        nfpy (Iterable[Path]): Paths to the neutron fission product yield tapes
+        neutron (Iterable[Path]): Paths to the neutron tapes
+        reactions (Iterable[str]): Transmutation reactions to include
+        processes (int, optional): Number of concurrent processes. Defaults to 1.
+        cache (bool, optional): Use the on-disk cache of parsed tapes.
+                                Defaults to True.
+
+    Returns:
+        openmc.deplete.Chain: The depletion chain
+    """
+    if not supports_preparsed():
+        # Let OpenMC parse the tapes itself
+        decay, nfpy, neutron = list(decay), list(nfpy), list(neutron)
+        return openmc.deplete.Chain.from_endf(decay, nfpy, neutron, list(reactions))
+    args = (processes, cache)
+    decay = parse_tapes(read_decay, list(decay), "Decay  ", *args)
+    nfpy = parse_tapes(read_fpy, list(nfpy), "NFPY   ", *args)
+    neutron = parse_tapes(read_neutron_sections, list(neutron), "Neutron", *args)
+    neutron = [StringIO(text) for text in neutron]
+    return from_preparsed(decay, nfpy, neutron, list(reactions))
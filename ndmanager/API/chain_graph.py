@@ -0,0 +1,322 @@
+"""A compact graph representation of depletion chains for fast reductions"""
+
+from typing import Callable, Dict, Iterable, List, Set
+
+import numpy as np
+import openmc.deplete
+
+DECAY = 0
+REACTION = 1
+FISSION = 2
+
+
+class ChainGraph:
+    """A compact representation of the transmutation graph of a depletion chain.
+    Nuclides are indexed in the order of the chain and edges are stored in the
+    compressed sparse row (CSR) format, so that traversals are vectorized.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        half_lives: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        kinds: np.ndarray,
+    ) -> None:
+        """Instanciate a graph from its CSR representation
+
+        Args:
+            names (List[str]): The names of the nuclides
+            half_lives (np.ndarray): The half-lives of the nuclides in seconds,
+                                     infinite for stable nuclides
+            indptr (np.ndarray): The CSR row pointers, edges going out of nuclide
+                                 `i` are stored in `indices[indptr[i]:indptr[i+1]]`
+            indices (np.ndarray): The CSR column indices, i.e. edge targets
+            kinds (np.ndarray): The kind of each edge: DECAY, REACTION or FISSION
+        """
+        self.names = np.asarray(names)
+        self.index = {name: i for i, name in enumerate(names)}
+        self.half_lives = np.asarray(half_lives, dtype=float)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.kinds = np.asarray(kinds, dtype=np.int8)
+
+    @classmethod
+    def from_chain(cls, chain: openmc.deplete.Chain) -> "ChainGraph":
+        """Build the graph of an OpenMC depletion chain. Edges are created for
+        decay modes, transmutation reactions and fission product yields.
+
+        Args:
+            chain (openmc.deplete.Chain): The depletion chain
+
+        Returns:
+            ChainGraph: The graph of the chain
+        """
+        names = [nuclide.name for nuclide in chain.nuclides]
+        index = {name: i for i, name in enumerate(names)}
+        half_lives = np.full(len(names), np.inf)
+        indptr = np.zeros(len(names) + 1, dtype=np.int64)
+        indices = []
+        kinds = []
+        for i, nuclide in enumerate(chain.nuclides):
+            if nuclide.half_life is not None:
+                half_lives[i] = nuclide.half_life
+
+            targets = {}
+            for mode in nuclide.decay_modes:
+                targets.setdefault(mode.target, DECAY)
+            for reaction in nuclide.reactions:
+                targets.setdefault(reaction.target, REACTION)
+            if nuclide.yield_data is not None:
+                for product in nuclide.yield_data.products:
+                    targets.setdefault(product, FISSION)
+
+            for target, kind in targets.items():
+                if target in index:
+                    indices.append(index[target])
+                    kinds.append(kind)
+            indptr[i + 1] = len(indices)
+        return cls(names, half_lives, indptr, indices, kinds)
+
+    def __len__(self) -> int:
+        """The number of nuclides in the graph
+
+        Returns:
+            int: The number of nuclides
+        """
+        return len(self.names)
+
+    def mask(self, nuclides: Iterable[str]) -> np.ndarray:
+        """Boolean mask of a set of nuclides
+
+        Args:
+            nuclides (Iterable[str]): Names of the nuclides
+
+        Raises:
+            KeyError: A nuclide is not in the graph
+
+        Returns:
+            np.ndarray: The mask
+        """
+        mask = np.zeros(len(self), dtype=bool)
+        for nuclide in nuclides:
+            if nuclide not in self.index:
+                raise KeyError(f"{nuclide} is not in the chain")
+            mask[self.index[nuclide]] = True
+        return mask
+
+    def half_life_mask(self, half_life: float) -> np.ndarray:
+        """Boolean mask of the nuclides that are stable or have a half-life
+        greater than a threshold
+
+        Args:
+            half_life (float): The half-life threshold in seconds
+
+        Returns:
+            np.ndarray: The mask
+        """
+        return self.half_lives > half_life
+
+    def successors(self, frontier: np.ndarray, kinds: Iterable[int]) -> np.ndarray:
+        """Boolean mask of the direct successors of a set of nuclides
+
+        Args:
+            frontier (np.ndarray): Boolean mask of the nuclides
+            kinds (Iterable[int]): Kinds of edges to follow
+
+        Returns:
+            np.ndarray: The mask of successors
+        """
+        nodes = np.flatnonzero(frontier)
+        starts = self.indptr[nodes]
+        counts = self.indptr[nodes + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        edges = offsets + np.arange(counts.sum())
+        edges = edges[np.isin(self.kinds[edges], list(kinds))]
+
+        successors = np.zeros(len(self), dtype=bool)
+        successors[self.indices[edges]] = True
+        return successors
+
+    def distances(
+        self,
+        initial: Iterable[str],
+        level: int | None = None,
+        kinds: Iterable[int] = (DECAY, REACTION, FISSION),
+    ) -> np.ndarray:
+        """Compute the number of transmutation steps needed to reach every nuclide
+        of the chain from a set of initial nuclides, using a breadth-first search.
+
+        Args:
+            initial (Iterable[str]): Names of the initial nuclides
+            level (int | None, optional): Maximum depth of the search.
+                                          Defaults to None, i.e. no limit.
+            kinds (Iterable[int], optional): Kinds of edges to follow.
+                                             Defaults to all kinds.
+
+        Returns:
+            np.ndarray: The distances, -1 for nuclides that are not reached
+        """
+        distances = np.full(len(self), -1, dtype=np.int64)
+        frontier = self.mask(initial)
+        depth = 0
+        while frontier.any():
+            distances[frontier] = depth
+            if level is not None and depth >= level:
+                break
+            frontier = self.successors(frontier, kinds) & (distances < 0)
+            depth += 1
+        return distances
+
+    def reachable(
+        self,
+        initial: Iterable[str],
+        level: int | None = None,
+        kinds: Iterable[int] = (DECAY, REACTION, FISSION),
+    ) -> np.ndarray:
+        """Boolean mask of the nuclides reachable from a set of initial nuclides
+
+        Args:
+            initial (Iterable[str]): Names of the initial nuclides
+            level (int | None, optional): Maximum depth of the search.
+                                          Defaults to None, i.e. no limit.
+            kinds (Iterable[int], optional): Kinds of edges to follow.
+                                             Defaults to all kinds.
+
+        Returns:
+            np.ndarray: The mask
+        """
+        return self.distances(initial, level, kinds) >= 0
+
+    def reduce(
+        self, chain: openmc.deplete.Chain, mask: np.ndarray
+    ) -> openmc.deplete.Chain:
+        """Reduce a chain to the nuclides selected by a mask. Removed nuclides
+        are collapsed into their decay daughters: decay modes, reactions and
+        fission yields leading to a removed nuclide lead to the kept nuclides
+        it decays to instead, with branching ratios multiplied along the decay
+        paths, e.g. U238(n,gamma) leads to Np239 when U239 is removed. Decay
+        modes and reactions whose target never decays to a kept nuclide are
+        kept without target, as done by OpenMC, so that destruction rates are
+        preserved.
+
+        Args:
+            chain (openmc.deplete.Chain): The chain this graph was built from
+            mask (np.ndarray): Boolean mask of the nuclides to keep
+
+        Returns:
+            openmc.deplete.Chain: The reduced chain
+        """
+        keep = set(self.names[mask])
+        routes = {}
+
+        def route(name: str | None) -> Dict[str | None, float]:
+            return _decay_targets(chain, name, keep, routes, set())
+
+        collapsed = openmc.deplete.Chain()
+        for nuclide in chain.nuclides:
+            if nuclide.name in keep:
+                nuclide = _collapse_nuclide(nuclide, route)
+            collapsed.add_nuclide(nuclide)
+        return collapsed.reduce(sorted(keep), level=0)
+
+
+def _decay_targets(
+    chain: openmc.deplete.Chain,
+    name: str | None,
+    keep: Set[str],
+    routes: Dict[str, Dict[str | None, float]],
+    visiting: Set[str],
+) -> Dict[str | None, float]:
+    """Compute the kept nuclides that a nuclide decays to, following the decay
+    modes of removed nuclides
+
+    Args:
+        chain (openmc.deplete.Chain): The full chain
+        name (str | None): The name of the nuclide
+        keep (Set[str]): The names of the kept nuclides
+        routes (Dict[str, Dict[str | None, float]]): The targets already
+                                                     computed for removed nuclides
+        visiting (Set[str]): The removed nuclides of the current decay path
+
+    Returns:
+        Dict[str | None, float]: The fraction of the nuclide leading to each
+                                 kept nuclide, None for the fraction that does
+                                 not lead to any
+    """
+    if name in keep:
+        return {name: 1.0}
+    if name in routes:
+        return routes[name]
+    if name not in chain.nuclide_dict or name in visiting:
+        return {None: 1.0}
+
+    visiting.add(name)
+    targets = {}
+    for mode in chain[name].decay_modes:
+        for target, fraction in _decay_targets(
+            chain, mode.target, keep, routes, visiting
+        ).items():
+            targets[target] = targets.get(target, 0.0) + mode.branching_ratio * fraction
+    visiting.discard(name)
+    routes[name] = targets or {None: 1.0}
+    return routes[name]
+
+
+def _collapse_nuclide(
+    nuclide: openmc.deplete.Nuclide,
+    route: Callable[[str | None], Dict[str | None, float]],
+) -> openmc.deplete.Nuclide:
+    """Copy a nuclide, leading its decay modes, reactions and fission yields
+    to kept nuclides
+
+    Args:
+        nuclide (openmc.deplete.Nuclide): The nuclide
+        route (Callable[[str | None], Dict[str | None, float]]): The kept nuclides
+                                                                 each nuclide decays
+                                                                 to, see
+                                                                 `_decay_targets`
+
+    Returns:
+        openmc.deplete.Nuclide: The copy
+    """
+    new = openmc.deplete.Nuclide(nuclide.name)
+    new.half_life = nuclide.half_life
+    new.decay_energy = nuclide.decay_energy
+    new.sources = nuclide.sources.copy()
+    if hasattr(nuclide, "_fpy"):
+        new._fpy = nuclide._fpy  # pylint: disable=protected-access
+
+    modes = {}
+    for mode in nuclide.decay_modes:
+        for target, fraction in route(mode.target).items():
+            key = (mode.type, target)
+            modes[key] = modes.get(key, 0.0) + mode.branching_ratio * fraction
+    for (kind, target), branching_ratio in modes.items():
+        new.add_decay_mode(kind, target, branching_ratio)
+
+    # Reactions leading to the same nuclide are merged, with their
+    # branching-weighted Q value
+    reactions = {}
+    for reaction in nuclide.reactions:
+        for target, fraction in route(reaction.target).items():
+            br = reaction.branching_ratio * fraction
+            total, q = reactions.get((reaction.type, target), (0.0, 0.0))
+            reactions[reaction.type, target] = (total + br, q + br * reaction.Q)
+    for (kind, target), (branching_ratio, q) in reactions.items():
+        if branching_ratio > 0:
+            q /= branching_ratio
+        new.add_reaction(kind, target, q, branching_ratio)
+
+    if nuclide.yield_data is not None:
+        yields = {}
+        for energy, table in nuclide.yield_data.items():
+            yields[energy] = {}
+            for product, value in zip(table.products, table.yields):
+                for target, fraction in route(product).items():
+                    if target is not None:
+                        previous = yields[energy].get(target, 0.0)
+                        yields[energy][target] = previous + value * fraction
+        new.yield_data = openmc.deplete.FissionYieldDistribution(yields)
+    return new
@@ -0,0 +1,455 @@
+"""Collapse of pointwise cross sections from OpenMC HDF5 neutron data files to
+multigroup cross sections"""
+
+import re
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+import h5py
+import numpy as np
+
+REACTION_NODE = re.compile(r"^reaction_(\d+)$")
+FISSION_MTS = {18, 19, 20, 21, 38}
+# Parameters of the Watt spectrum of thermal fission of U235, in eV and 1/eV
+WATT_A = 0.988e6
+WATT_B = 2.249e-6
+
+
+def load_spectrum(spectrum: str | Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Tabulate a weighting spectrum, assumed linearly interpolable in energy.
+
+    Args:
+        spectrum (str | Path): Either "flat" for a constant spectrum, "1/E" for a
+                               1/E spectrum, or the path to a text file with
+                               energies in eV and flux values in two columns
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The energies in eV and the flux values
+    """
+    if spectrum == "flat":
+        energy = np.array([1e-5, 2e7])
+        return energy, np.ones(2)
+    if spectrum == "1/E":
+        # 200 points per decade keep the interpolation error below 2e-5
+        energy = np.logspace(-5, np.log10(2e7), 2461)
+        return energy, 1 / energy
+    energy, flux = np.loadtxt(spectrum, unpack=True)
+    order = np.argsort(energy, kind="stable")
+    return energy[order], flux[order]
+
+
+def _tabulate_spectrum(
+    pdf: Callable[[np.ndarray], np.ndarray], groups: np.ndarray, emax: float = np.inf
+) -> np.ndarray:
+    """Compute the fraction of the neutrons of an energy distribution emitted
+    in each group, by integrating its probability density on a fine grid.
+
+    Args:
+        pdf (Callable[[np.ndarray], np.ndarray]): The unnormalized density
+        groups (np.ndarray): The ascending group boundaries in eV
+        emax (float, optional): No neutron is emitted above this energy in eV.
+                                Defaults to np.inf.
+
+    Returns:
+        np.ndarray: The normalized fractions, for groups in ascending energy order
+    """
+    energy = np.unique(np.concatenate((np.logspace(-5, 8, 13001), groups)))
+    values = np.where(energy <= emax, pdf(energy), 0.0)
+    cdf = np.concatenate(
+        ([0.0], np.cumsum(np.diff(energy) * (values[1:] + values[:-1]) / 2))
+    )
+    chi = np.diff(np.interp(groups, energy, cdf))
+    total = chi.sum()
+    return chi / total if total > 0 else chi
+
+
+def watt_spectrum(
+    groups: np.ndarray, a: float = WATT_A, b: float = WATT_B
+) -> np.ndarray:
+    """Compute the fraction of fission neutrons emitted in each group according
+    to a Watt spectrum.
+
+    Args:
+        groups (np.ndarray): The ascending group boundaries in eV
+        a (float, optional): The a parameter of the spectrum in eV. Defaults to WATT_A.
+        b (float, optional): The b parameter of the spectrum in 1/eV. Defaults to WATT_B.
+
+    Returns:
+        np.ndarray: The normalized fractions, for groups in ascending energy order
+    """
+    return _tabulate_spectrum(
+        lambda e: np.exp(-e / a) * np.sinh(np.sqrt(b * e)), groups
+    )
+
+
+def _union_grid(groups: np.ndarray, *grids: np.ndarray) -> np.ndarray:
+    """Merge energy grids and group boundaries, restricted to the group structure
+
+    Args:
+        groups (np.ndarray): The ascending group boundaries
+        *grids (np.ndarray): The energy grids to merge
+
+    Returns:
+        np.ndarray: The merged grid
+    """
+    union = np.unique(np.concatenate((groups,) + grids))
+    return union[(union >= groups[0]) & (union <= groups[-1])]
+
+
+def _segment_integrals(
+    union: np.ndarray, energy: np.ndarray, xs: np.ndarray, flux: np.ndarray
+) -> np.ndarray:
+    """Integrate exactly the product of a cross section and a flux over each
+    segment of a grid on which both are linear.
+
+    Args:
+        union (np.ndarray): The grid, containing the cross section energy grid
+        energy (np.ndarray): The energy grid of the cross section
+        xs (np.ndarray): The cross section values
+        flux (np.ndarray): The flux values on the grid
+
+    Returns:
+        np.ndarray: The integral over each segment
+    """
+    x = np.interp(union, energy, xs)
+    return (
+        np.diff(union)
+        * (
+            2 * x[:-1] * flux[:-1]
+            + x[:-1] * flux[1:]
+            + x[1:] * flux[:-1]
+            + 2 * x[1:] * flux[1:]
+        )
+        / 6
+    )
+
+
+def _evaluate_yield(dataset: h5py.Dataset, energy: np.ndarray) -> np.ndarray:
+    """Evaluate a product yield stored in an OpenMC HDF5 file
+
+    Args:
+        dataset (h5py.Dataset): The yield dataset
+        energy (np.ndarray): The energies to evaluate the yield at
+
+    Raises:
+        ValueError: The yield is not tabulated nor polynomial
+
+    Returns:
+        np.ndarray: The yield values
+    """
+    kind = np.bytes_(dataset.attrs["type"]).decode()
+    if kind == "Tabulated1D":
+        x, y = dataset[...]
+        return np.interp(energy, x, y)
+    if kind == "Polynomial":
+        return np.polynomial.polynomial.polyval(energy, dataset[...])
+    raise ValueError(f"Unsupported yield type: {kind}")
+
+
+def _neutron_products(reaction: h5py.Group) -> Iterator[h5py.Group]:
+    """Iterate over the neutron products of a reaction
+
+    Args:
+        reaction (h5py.Group): The reaction group
+
+    Yields:
+        h5py.Group: The product groups whose particle is a neutron
+    """
+    for name, product in reaction.items():
+        if not name.startswith("product_"):
+            continue
+        if np.bytes_(product.attrs["particle"]).decode() == "neutron":
+            yield product
+
+
+def _neutron_yield(reaction: h5py.Group, energy: np.ndarray) -> np.ndarray | None:
+    """Compute the total number of neutrons emitted by a reaction
+
+    Args:
+        reaction (h5py.Group): The reaction group
+        energy (np.ndarray): The energies to evaluate the yield at
+
+    Returns:
+        np.ndarray | None: The yield values, None if the reaction emits no neutron
+    """
+    total = None
+    for product in _neutron_products(reaction):
+        value = _evaluate_yield(product["yield"], energy)
+        total = value if total is None else total + value
+    return total
+
+
+def _tabular_spectra(
+    distribution: h5py.Group, groups: np.ndarray, incident: np.ndarray
+) -> np.ndarray:
+    """Compute the fraction of the neutrons emitted in each group by a
+    tabulated outgoing energy distribution, interpolating linearly between
+    the incident energies of the table as OpenMC does when sampling it.
+
+    Args:
+        distribution (h5py.Group): The "continuous" energy distribution group
+        groups (np.ndarray): The ascending group boundaries in eV
+        incident (np.ndarray): The incident energies in eV
+
+    Returns:
+        np.ndarray: The fractions, indexed by incident energy and ascending
+                    destination group
+    """
+    table = distribution["energy"][...]
+    dataset = distribution["distribution"]
+    pairs = dataset[...]
+    offsets = list(dataset.attrs["offsets"]) + [pairs.shape[1]]
+    cdfs = np.empty((len(table), len(groups)))
+    for j in range(len(table)):
+        eout, _, cdf = pairs[:, offsets[j] : offsets[j + 1]]
+        cdfs[j] = np.interp(groups, eout, cdf / cdf[-1])
+    if len(table) == 1:
+        return np.tile(np.diff(cdfs[0]), (len(incident), 1))
+    j = np.clip(np.searchsorted(table, incident, side="right") - 1, 0, len(table) - 2)
+    r = np.clip((incident - table[j]) / (table[j + 1] - table[j]), 0.0, 1.0)
+    cdf = (1 - r[:, None]) * cdfs[j] + r[:, None] * cdfs[j + 1]
+    return np.diff(cdf, axis=1)
+
+
+def _emission_spectra(
+    product: h5py.Group, groups: np.ndarray, incident: np.ndarray
+) -> np.ndarray | None:
+    """Compute the fraction of the neutrons of a product emitted in each group
+    from its energy distribution. Tabulated, Maxwell, evaporation and Watt
+    distributions are supported.
+
+    Args:
+        product (h5py.Group): The product group
+        groups (np.ndarray): The ascending group boundaries in eV
+        incident (np.ndarray): The incident energies in eV
+
+    Returns:
+        np.ndarray | None: The fractions, indexed by incident energy and
+                           ascending destination group, None if the
+                           distribution is not supported
+    """
+    if "distribution_0" not in product or "distribution_1" in product:
+        return None
+    distribution = product["distribution_0"]
+    if np.bytes_(distribution.attrs["type"]).decode() != "uncorrelated":
+        return None
+    if "energy" not in distribution:
+        return None
+    distribution = distribution["energy"]
+    kind = np.bytes_(distribution.attrs["type"]).decode()
+    if kind == "continuous":
+        return _tabular_spectra(distribution, groups, incident)
+    if kind not in ("maxwell", "evaporation", "watt"):
+        return None
+
+    u = float(distribution.attrs["u"])
+    spectra = np.zeros((len(incident), len(groups) - 1))
+    for i, e in enumerate(incident):
+        if kind == "watt":
+            a = float(_evaluate_yield(distribution["a"], e))
+            b = float(_evaluate_yield(distribution["b"], e))
+
+            def pdf(x, a=a, b=b):
+                return np.exp(-x / a) * np.sinh(np.sqrt(b * x))
+
+        else:
+            theta = float(_evaluate_yield(distribution["theta"], e))
+            power = 0.5 if kind == "maxwell" else 1.0
+
+            def pdf(x, theta=theta, power=power):
+                return x**power * np.exp(-x / theta)
+
+        spectra[i] = _tabulate_spectrum(pdf, groups, e - u)
+    return spectra
+
+
+def _elastic_matrix(
+    union: np.ndarray, weights: np.ndarray, groups: np.ndarray, alpha: float
+) -> np.ndarray:
+    """Compute the group-to-group elastic transfer integrals for an isotropic
+    scattering in the center of mass frame on a target at rest: a neutron of
+    energy E is scattered uniformly between alpha * E and E. Each segment of
+    the grid is scattered as a whole from its midpoint.
+
+    Args:
+        union (np.ndarray): The integration grid
+        weights (np.ndarray): The integral of the reaction rate over each segment
+        groups (np.ndarray): The ascending group boundaries
+        alpha (float): The maximum relative energy loss, ((A - 1) / (A + 1))^2
+
+    Returns:
+        np.ndarray: The transfer integrals, indexed by ascending source and
+                    destination groups
+    """
+    ngroups = len(groups) - 1
+    mid = (union[1:] + union[:-1]) / 2
+    source = np.searchsorted(groups, mid, side="right") - 1
+    density = weights / ((1 - alpha) * mid)
+
+    # The overlap of [x, E] with a destination group below x is its full
+    # width, and x - lower for the group that holds x: the overlap with
+    # [alpha * E, E] is the difference of both
+    def coverage(x):
+        # Neutrons scattered below the group structure are lost
+        x = np.maximum(x, groups[0])
+        dest = np.clip(np.searchsorted(groups, x, side="right") - 1, 0, ngroups - 1)
+        index = source * ngroups + dest
+        partial = np.bincount(
+            index, density * (x - groups[dest]), minlength=ngroups**2
+        ).reshape(ngroups, ngroups)
+        total = np.bincount(index, density, minlength=ngroups**2).reshape(
+            ngroups, ngroups
+        )
+        # Density of segments whose x lies above each destination group
+        above = np.cumsum(total[:, ::-1], axis=1)[:, ::-1]
+        above = np.concatenate((above[:, 1:], np.zeros((ngroups, 1))), axis=1)
+        return partial + above * np.diff(groups)
+
+    return coverage(mid) - coverage(alpha * mid)
+
+
+def collapse_file(
+    path: str | Path,
+    groups: Iterable[float],
+    spectrum: Tuple[np.ndarray, np.ndarray],
+    temperatures: Iterable[int] | None = None,
+) -> Dict[str, Any]:
+    """Collapse the cross sections of an OpenMC HDF5 neutron data file to a
+    group structure. Cross sections are weighted by a spectrum, and integrated
+    exactly assuming both are linearly interpolable in energy.
+    The elastic scattering matrix assumes isotropic scattering in the center
+    of mass frame on a target at rest. Other scattering reactions are kept in
+    their group, with their neutron multiplicity, and a warning is issued.
+    The fission spectrum is computed from the energy distributions of the
+    fission neutrons in the file, weighted by the nu-fission rate of each
+    group. The Watt spectrum of thermal fission of U235 replaces the
+    distributions that are not supported, with a warning.
+
+    Args:
+        path (str | Path): Path to the HDF5 file
+        groups (Iterable[float]): The ascending group boundaries in eV
+        spectrum (Tuple[np.ndarray, np.ndarray]): The weighting spectrum, see
+                                                  `load_spectrum`
+        temperatures (Iterable[int] | None, optional): The temperatures to collapse,
+                                                       all temperatures of the file
+                                                       if None. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The name and atomic weight ratio of the nuclide, the
+                        temperatures, and the multigroup data: "total",
+                        "absorption", "scatter", "fission", "nu-fission" and
+                        "chi", with groups in descending energy order as
+                        expected by OpenMC
+    """
+    groups = np.asarray(groups, dtype=float)
+    ngroups = len(groups) - 1
+    flux_energy, flux_values = spectrum
+
+    with h5py.File(path, "r") as f:
+        group = list(f.values())[0]
+        awr = float(group.attrs["atomic_weight_ratio"])
+        alpha = ((awr - 1) / (awr + 1)) ** 2
+        available = sorted(int(t[:-1]) for t in group["kTs"])
+        if temperatures is not None:
+            available = [t for t in available if t in set(temperatures)]
+
+        data = {
+            "name": group.name[1:],
+            "awr": awr,
+            "temperatures": available,
+            "fissionable": False,
+        }
+        keys = ["total", "absorption", "scatter", "fission", "nu-fission", "chi"]
+        for key in keys:
+            if key == "scatter":
+                data[key] = np.zeros((len(available), ngroups, ngroups))
+            else:
+                data[key] = np.zeros((len(available), ngroups))
+        in_group = set()
+        unsupported = set()
+
+        for i, t in enumerate(available):
+            energy = group[f"energy/{t}K"][...]
+            union = _union_grid(groups, energy, flux_energy)
+            flux = np.interp(union, flux_energy, flux_values)
+            mid = (union[1:] + union[:-1]) / 2
+            source = np.searchsorted(groups, mid, side="right") - 1
+
+            def integrate(xs):
+                weights = _segment_integrals(union, energy, xs, flux)
+                return weights, np.bincount(source, weights, minlength=ngroups)
+
+            _, norm = integrate(np.ones(len(energy)))
+            norm[norm == 0] = 1.0
+
+            for name, reaction in group["reactions"].items():
+                match = REACTION_NODE.match(name)
+                if match is None or reaction.attrs.get("redundant", 0):
+                    continue
+                if f"{t}K" not in reaction:
+                    continue
+                mt = int(match.group(1))
+                dataset = reaction[f"{t}K/xs"]
+                xs = np.zeros(len(energy))
+                xs[int(dataset.attrs.get("threshold_idx", 0)) :] = dataset[...]
+
+                weights, rate = integrate(xs)
+                data["total"][i] += rate
+                multiplicity = _neutron_yield(reaction, energy)
+                if mt == 2:
+                    data["scatter"][i] += _elastic_matrix(union, weights, groups, alpha)
+                elif mt in FISSION_MTS:
+                    data["fissionable"] = True
+                    data["absorption"][i] += rate
+                    data["fission"][i] += rate
+                    for product in _neutron_products(reaction):
+                        nu = xs * _evaluate_yield(product["yield"], energy)
+                        _, nu_rate = integrate(nu)
+                        # Fission neutrons of each group are emitted from the
+                        # mean incident energy of the nu-fission rate
+                        _, moment = integrate(nu * energy)
+                        incident = (groups[1:] + groups[:-1]) / 2
+                        np.divide(moment, nu_rate, out=incident, where=nu_rate > 0)
+                        spectra = _emission_spectra(product, groups, incident)
+                        if spectra is None:
+                            unsupported.add(mt)
+                            spectra = np.tile(watt_spectrum(groups), (ngroups, 1))
+                        data["nu-fission"][i] += nu_rate
+                        data["chi"][i] += nu_rate @ spectra
+                elif multiplicity is not None:
+                    in_group.add(mt)
+                    data["scatter"][i] += np.diag(integrate(xs * multiplicity)[1])
+                else:
+                    data["absorption"][i] += rate
+
+            for key in keys:
+                if key == "scatter":
+                    data[key][i] /= norm[:, None]
+                elif key == "chi":
+                    total = data[key][i].sum()
+                    if total > 0:
+                        data[key][i] /= total
+                else:
+                    data[key][i] /= norm
+
+    if in_group:
+        mts = ", ".join(str(mt) for mt in sorted(in_group))
+        warnings.warn(
+            f"{data['name']}: scattering reactions MT={mts} are kept in their "
+            "group, their energy loss is neglected"
+        )
+    if unsupported:
+        mts = ", ".join(str(mt) for mt in sorted(unsupported))
+        warnings.warn(
+            f"{data['name']}: unsupported energy distribution of the fission "
+            f"neutrons of MT={mts}, the Watt spectrum of thermal fission of "
+            "U235 is used instead"
+        )
+
+    # OpenMC orders groups by descending energy
+    for key in keys:
+        data[key] = data[key][:, ::-1]
+        if key == "scatter":
+            data[key] = data[key][:, :, ::-1]
+    return data
@@ -0,0 +1,98 @@
+"""Copy-on-write copies of HDF5 libraries using reflinks or hardlinks"""
+
+import os
+import shutil
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, Windows
+    fcntl = None
+
+# The FICLONE ioctl of Linux, supported by Btrfs, XFS, OCFS2 and bcachefs
+FICLONE = 0x40049409
+
+
+def reflink(source: str | Path, target: str | Path) -> bool:
+    """Create a reflink, i.e. a copy of a file that shares its data blocks with
+    the original until either is modified
+
+    Args:
+        source (str | Path): Path to the file to copy
+        target (str | Path): Path to the copy
+
+    Returns:
+        bool: Whether the reflink was created
+    """
+    if fcntl is None:
+        return False
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            success = False
+        else:
+            success = True
+    if not success:
+        os.unlink(target)
+        return False
+    shutil.copystat(source, target)
+    return True
+
+
+def cow_copy(source: str | Path, target: str | Path) -> str:
+    """Copy a file without duplicating its data if possible: using a reflink
+    if the filesystem supports it, a hardlink otherwise. Files are only copied
+    if neither is possible, e.g. across filesystems.
+
+    Args:
+        source (str | Path): Path to the file to copy
+        target (str | Path): Path to the copy
+
+    Returns:
+        str: The method used, "reflink", "hardlink" or "copy"
+    """
+    if reflink(source, target):
+        return "reflink"
+    try:
+        os.link(source, target)
+        return "hardlink"
+    except OSError:
+        shutil.copy2(source, target)
+        return "copy"
+
+
+def cow_copytree(source: str | Path, target: str | Path) -> None:
+    """Copy an HDF5 library without duplicating the data of its HDF5 files.
+    Other files, such as the cross_sections.xml file, are small and often
+    rewritten in place, so they are always copied.
+
+    Args:
+        source (str | Path): Path to the library to copy
+        target (str | Path): Path to the copy
+    """
+
+    def copy_function(src: str, dst: str):
+        if src.endswith(".h5"):
+            cow_copy(src, dst)
+        else:
+            shutil.copy2(src, dst)
+        return dst
+
+    shutil.copytree(source, target, copy_function=copy_function)
+
+
+def break_link(path: str | Path) -> None:
+    """Make sure a file does not share its data with another file before it is
+    modified in place. Hardlinked files are replaced by a private copy,
+    reflinked files are already copied on write by the filesystem.
+
+    Args:
+        path (str | Path): Path to the file
+    """
+    path = Path(path)
+    if path.stat().st_nlink <= 1:
+        return
+    tmppath = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    shutil.copy2(path, tmppath)
+    os.replace(tmppath, path)
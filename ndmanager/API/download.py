@@ -0,0 +1,222 @@
+"""Concurrent, segmented and resumable downloads of large files"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import requests
+from tqdm import tqdm
+
+CHUNK_SIZE = 1 << 20
+# Files smaller than this are not split into segments
+MIN_SEGMENT_SIZE = 16 << 20
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+
+
+def probe(url: str, timeout: int = 600) -> Tuple[int, bool]:
+    """Get the size of a remote file and whether the server supports HTTP
+    range requests, by requesting the first byte of the file.
+
+    Args:
+        url (str): The URL of the file
+        timeout (int, optional): The timeout of the request in seconds.
+                                 Defaults to 600.
+
+    Returns:
+        Tuple[int, bool]: The size of the file, 0 if it is unknown, and whether
+                          ranges are supported
+    """
+    headers = {"Range": "bytes=0-0", "Accept-Encoding": "identity"}
+    with requests.get(url, headers=headers, stream=True, timeout=timeout) as r:
+        r.raise_for_status()
+        if r.status_code == 206 and "/" in r.headers.get("content-range", ""):
+            size = r.headers["content-range"].rsplit("/", 1)[1]
+            if size != "*":
+                return int(size), True
+        return int(r.headers.get("content-length", 0)), False
+
+
+def split_segments(size: int, segments: int) -> List[List[int]]:
+    """Split a file into contiguous segments
+
+    Args:
+        size (int): The size of the file
+        segments (int): The maximum number of segments
+
+    Returns:
+        List[List[int]]: The start, end (excluded) and downloaded size of each
+                         segment
+    """
+    segments = max(1, min(segments, size // MIN_SEGMENT_SIZE))
+    bounds = [size * i // segments for i in range(segments + 1)]
+    return [[start, end, 0] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def load_state(target: Path, url: str, size: int) -> List[List[int]] | None:
+    """Read the state of an interrupted download
+
+    Args:
+        target (Path): The path to the downloaded file
+        url (str): The URL of the file
+        size (int): The size of the file
+
+    Returns:
+        List[List[int]] | None: The segments of the download, None if there is
+                                no interrupted download of the same file
+    """
+    part = target.with_name(target.name + PART_SUFFIX)
+    try:
+        with open(target.with_name(target.name + STATE_SUFFIX), encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get("url") != url or state.get("size") != size or not part.exists():
+        return None
+    return state["segments"]
+
+
+def _write_state(path: Path, state: Dict[str, Any]) -> None:
+    """Atomically write the state of a download
+
+    Args:
+        path (Path): The path to the state file
+        state (Dict[str, Any]): The state
+    """
+    tmppath = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    with open(tmppath, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmppath, path)
+
+
+def download(
+    url: str,
+    target: str | Path,
+    segments: int = 4,
+    desc: str | None = None,
+    position: int | None = None,
+    timeout: int = 600,
+) -> Path:
+    """Download a file. If the server supports HTTP range requests, the file
+    is downloaded in several segments concurrently, and an interrupted
+    download resumes where it stopped. The file is written to a `.part` file
+    next to the target, which is renamed when the download is complete.
+
+    Args:
+        url (str): The URL of the file
+        target (str | Path): The path to the downloaded file
+        segments (int, optional): The number of concurent segments. Defaults to 4.
+        desc (str | None, optional): The description of the progress bar.
+                                     Defaults to None, i.e. the file name.
+        position (int | None, optional): The position of the progress bar.
+                                         Defaults to None.
+        timeout (int, optional): The timeout of the requests in seconds.
+                                 Defaults to 600.
+
+    Returns:
+        Path: The path to the downloaded file
+    """
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    part = target.with_name(target.name + PART_SUFFIX)
+    statepath = target.with_name(target.name + STATE_SUFFIX)
+    size, ranges = probe(url, timeout)
+
+    state = None
+    if ranges:
+        segs = load_state(target, url, size)
+        if segs is None:
+            segs = split_segments(size, segments)
+            with open(part, "wb") as f:
+                f.truncate(size)
+        state = {"url": url, "size": size, "segments": segs}
+        _write_state(statepath, state)
+    else:
+        segs = [[0, size, 0]]
+
+    bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
+    pbar = tqdm(
+        desc=desc if desc is not None else target.name,
+        total=size or None,
+        initial=sum(s[2] for s in segs),
+        unit="iB",
+        unit_scale=True,
+        unit_divisor=1024,
+        bar_format=bar_format,
+        position=position,
+        leave=position is None,
+    )
+    lock = threading.Lock()
+    # The state is written at most once per second, and when the download stops
+    last_write = [time.monotonic()]
+
+    def fetch(segment: List[int]) -> None:
+        start, end, done = segment
+        if ranges and start + done >= end:
+            return
+        headers = {"Accept-Encoding": "identity"}
+        if ranges:
+            headers["Range"] = f"bytes={start + done}-{end - 1}"
+        with requests.get(url, headers=headers, stream=True, timeout=timeout) as r:
+            r.raise_for_status()
+            if ranges and r.status_code != 206:
+                raise ValueError(f"{url} did not honor the range request")
+            mode = "r+b" if ranges else "wb"
+            with open(part, mode) as f:
+                f.seek(start + done)
+                for data in r.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(data)
+                    f.flush()
+                    with lock:
+                        segment[2] += len(data)
+                        pbar.update(len(data))
+                        if state is not None and time.monotonic() - last_write[0] > 1:
+                            _write_state(statepath, state)
+                            last_write[0] = time.monotonic()
+
+    try:
+        if len(segs) == 1:
+            fetch(segs[0])
+        else:
+            with ThreadPoolExecutor(len(segs)) as executor:
+                list(executor.map(fetch, segs))
+    finally:
+        pbar.close()
+        if state is not None:
+            _write_state(statepath, state)
+
+    os.replace(part, target)
+    statepath.unlink(missing_ok=True)
+    return target
+
+
+def download_all(
+    files: Sequence[Tuple[str, str | Path, str]],
+    processes: int = 1,
+    segments: int = 4,
+) -> List[Path]:
+    """Download several files concurrently
+
+    Args:
+        files (Sequence[Tuple[str, str | Path, str]]): The URL, target path and
+                                                       progress bar description
+                                                       of each file
+        processes (int, optional): Number of concurent downloads. Defaults to 1.
+        segments (int, optional): Number of concurent segments per download.
+                                  Defaults to 4.
+
+    Returns:
+        List[Path]: The paths to the downloaded files
+    """
+    if processes == 1 or len(files) == 1:
+        return [download(url, target, segments, desc) for url, target, desc in files]
+    with ThreadPoolExecutor(processes) as executor:
+        futures = [
+            executor.submit(download, url, target, segments, desc, i)
+            for i, (url, target, desc) in enumerate(files)
+        ]
+        return [future.result() for future in futures]
@@ -1,7 +1,9 @@
 # pylint: disable=invalid-name
 """A module that defines and ENDF6 class to manipulate ENDF6 tapes"""
 from pathlib import Path
+from typing import List, Tuple
 
+from ndmanager.API.endf6_sections import get_section_index, read_section
 from ndmanager.API.nuclide import Nuclide
 from ndmanager.data import NSUB_IDS
 
@@ -22,3 +24,26 @@ class Endf6:
                 line = f.readline()
             NSUB = int(line[46:56])
         self.sublibrary = NSUB_IDS[NSUB]
+
+    @property
+    def sections(self) -> List[Tuple[int, int]]:
+        """List the (MF, MT) sections of the first material of the tape
+
+        Returns:
+            List[Tuple[int, int]]: The (MF, MT) pairs
+        """
+        index = get_section_index(self.filename)
+        index = index[index["mat"] == index["mat"][0]]
+        return list(zip(index["mf"].tolist(), index["mt"].tolist()))
+
+    def section(self, mf: int, mt: int) -> str:
+        """Read a single section of the tape
+
+        Args:
+            mf (int): The MF number of the section
+            mt (int): The MT number of the section
+
+        Returns:
+            str: The lines of the section, without the SEND record
+        """
+        return read_section(self.filename, mf, mt)
@@ -0,0 +1,223 @@
+# pylint: disable=invalid-name
+"""A persistent index of the headers of the ENDF6 tapes in a sublibrary"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ndmanager.API.hashing import compute_file_sha1
+from ndmanager.API.nuclide import Nuclide
+
+INDEX_NAME = ".ndm_index.json"
+INDEX_VERSION = 1
+
+endf_float_re = re.compile(r"([0-9.])([+-])(\d+)$")
+
+
+def endf_float(string: str) -> float:
+    """Convert an ENDF6 floating point number, e.g. 9.223500+4, to a float
+
+    Args:
+        string (str): The ENDF6 number
+
+    Returns:
+        float: The value
+    """
+    return float(endf_float_re.sub(r"\1e\2\3", string.strip()))
+
+
+def parse_header(lines: List[str]) -> Dict[str, Any]:
+    """Parse the material identification fields in the MF1/MT451 header of an
+    ENDF6 material.
+
+    Args:
+        lines (List[str]): The first six lines of the tape, starting with the
+                           TPID record
+
+    Returns:
+        Dict[str, Any]: The ZA, LISO, NSUB, MAT and ZSYMAM fields, and the
+                        name of the nuclide in the GNDS format, or None if the
+                        ZA value does not correspond to a nuclide.
+    """
+    za = endf_float(lines[1][0:11])
+    header = {
+        "za": int(round(za)),
+        "liso": int(lines[2][33:44]),
+        "nsub": int(lines[3][44:55]),
+        "mat": int(lines[1][66:70]),
+        "zsymam": lines[5][0:11],
+    }
+    a = header["za"] % 1000
+    z = header["za"] // 1000
+    m = header["liso"]
+    try:
+        if header["nsub"] in [3, 6] and a == 0 and m == 0:
+            header["name"] = Nuclide(z, None, None).name
+        else:
+            header["name"] = Nuclide(z, a, m).name
+    except KeyError:
+        header["name"] = None
+    return header
+
+
+def read_header(tape: str | Path) -> Dict[str, Any]:
+    """Read the material identification fields in the MF1/MT451 header of an
+    ENDF6 tape. Only the first lines of the tape are read.
+
+    Args:
+        tape (str | Path): Path to an ENDF6 tape
+
+    Returns:
+        Dict[str, Any]: See `parse_header`
+    """
+    with open(tape, "r", encoding="utf-8") as f:
+        lines = [f.readline() for _ in range(6)]
+    return parse_header(lines)
+
+
+def index_path(directory: str | Path) -> Path:
+    """Path to the index file of a sublibrary directory
+
+    Args:
+        directory (str | Path): The sublibrary directory
+
+    Returns:
+        Path: The path to the index file
+    """
+    return Path(directory) / INDEX_NAME
+
+
+def load_index(directory: str | Path) -> Dict[str, Any]:
+    """Read the index file of a sublibrary directory
+
+    Args:
+        directory (str | Path): The sublibrary directory
+
+    Returns:
+        Dict[str, Any]: The index, empty if the file does not exist or was
+                        written by an incompatible version
+    """
+    path = index_path(directory)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if index.get("version") != INDEX_VERSION:
+        return {}
+    return index
+
+
+def update_index(directory: str | Path, full: bool = False) -> Dict[str, Any]:
+    """Bring the index of a sublibrary directory up to date and return its
+    entries. If the directory has not been modified since the index was
+    written, the index is returned as is. Otherwise, only the tapes that were
+    added or whose size or modification time changed are read again. The
+    `full` option forces this check even if the directory was not modified,
+    which catches tapes overwritten in place.
+
+    Args:
+        directory (str | Path): The sublibrary directory
+        full (bool, optional): Check every tape. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: A dictionnary mapping tape file names to their entries
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return {}
+    path = index_path(directory)
+    index = load_index(directory)
+    # The modification time of the index file is set to the one of the
+    # directory when it is written, any tape added or removed since then
+    # changes the directory modification time.
+    if not full and index and is_up_to_date(directory):
+        return index["tapes"]
+
+    old = index.get("tapes", {})
+    tapes = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.name.endswith(".endf6") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            cached = old.get(entry.name)
+            if (
+                cached is not None
+                and cached["size"] == stat.st_size
+                and cached["mtime"] == stat.st_mtime_ns
+            ):
+                tapes[entry.name] = cached
+                continue
+            tapes[entry.name] = read_header(entry.path) | {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "sha1": compute_file_sha1(entry.path),
+            }
+    tapes = dict(sorted(tapes.items()))
+
+    tmppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmppath, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "tapes": tapes}, f, indent=1)
+        os.replace(tmppath, path)
+        mtime = directory.stat().st_mtime_ns
+        os.utime(path, ns=(mtime, mtime))
+    except OSError:
+        # The index is only an optimization, read-only installations still work
+        tmppath.unlink(missing_ok=True)
+    return tapes
+
+
+def is_up_to_date(directory: str | Path) -> bool:
+    """Check that no tape was added to or removed from a sublibrary directory
+    since its index was written
+
+    Args:
+        directory (str | Path): The sublibrary directory
+
+    Returns:
+        bool: Whether the index is up to date
+    """
+    try:
+        index_mtime = index_path(directory).stat().st_mtime_ns
+    except OSError:
+        return False
+    return index_mtime == Path(directory).stat().st_mtime_ns
+
+
+def list_indexed_tapes(directory: str | Path) -> Dict[str, Path]:
+    """List the tapes of a sublibrary directory using its index
+
+    Args:
+        directory (str | Path): The sublibrary directory
+
+    Returns:
+        Dict[str, Path]: A dictionnary that associates nuclide names to tapes
+    """
+    directory = Path(directory)
+    tapes = update_index(directory)
+    return {
+        entry["name"]: directory / filename
+        for filename, entry in tapes.items()
+        if entry["name"] is not None
+    }
+
+
+def get_tape_header(tape: str | Path) -> Dict[str, Any]:
+    """Get the index entry of a tape, reading the tape header if the tape
+    is not part of an indexed sublibrary
+
+    Args:
+        tape (str | Path): Path to an ENDF6 tape
+
+    Returns:
+        Dict[str, Any]: The index entry of the tape
+    """
+    tape = Path(tape)
+    tapes = update_index(tape.parent)
+    if tape.name in tapes:
+        return tapes[tape.name]
+    return read_header(tape)
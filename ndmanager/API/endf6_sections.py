@@ -0,0 +1,313 @@
+# pylint: disable=invalid-name
+"""Random access to the sections of ENDF6 tapes"""
+
+import hashlib
+import mmap
+import os
+import re
+import zipfile
+from functools import partial
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from tqdm import tqdm
+
+from ndmanager.API.endf6_index import parse_header
+from ndmanager.API.pool import imap
+from ndmanager.env import NDMANAGER_CACHE
+
+SECTION_INDEX_SUFFIX = ".idx"
+
+# MEND records end every material, they are the only records with MAT = 0
+MEND_RE = re.compile(rb"^.{66}   0 0  0[^\n]*(?:\n|$)", re.M)
+TEND_RECORD = f"{'':66}{-1:4d}{0:2d}{0:3d}{0:5d}\n"
+
+SECTION_DTYPE = np.dtype(
+    [
+        ("mat", np.int64),
+        ("mf", np.int64),
+        ("mt", np.int64),
+        ("offset", np.int64),
+        ("length", np.int64),
+    ]
+)
+
+
+def _parse_ints(columns: np.ndarray) -> np.ndarray:
+    """Parse right-aligned integer fields from a 2D array of ASCII codes, one
+    field per row. Blank fields are parsed as 0.
+
+    Args:
+        columns (np.ndarray): The ASCII codes of the fields
+
+    Returns:
+        np.ndarray: The integers
+    """
+    digits = columns.astype(np.int64) - ord("0")
+    isdigit = (digits >= 0) & (digits <= 9)
+    digits = np.where(isdigit, digits, 0)
+    # Weights of each digit, counted from the last digit of the field
+    position = np.cumsum(isdigit[:, ::-1], axis=1)[:, ::-1] - 1
+    values = (digits * 10 ** np.where(isdigit, position, 0)).sum(axis=1)
+    negative = (columns == ord("-")).any(axis=1)
+    return np.where(negative, -values, values)
+
+
+def build_section_index(buffer: bytes | mmap.mmap) -> np.ndarray:
+    """Compute the byte offset and length of every (MAT, MF, MT) section of an
+    ENDF6 tape. The control records of every line are parsed at once with
+    NumPy. A section spans all its lines, excluding its SEND record.
+
+    Args:
+        buffer (bytes | mmap.mmap): The content of the tape
+
+    Returns:
+        np.ndarray: A structured array with the mat, mf, mt, offset and length
+                    of each section, in the order of the tape
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    ends = np.flatnonzero(data == ord("\n")) + 1
+    if len(ends) == 0 or ends[-1] != len(data):
+        ends = np.append(ends, len(data))
+    starts = np.concatenate(([0], ends[:-1]))
+
+    # Lines too short to hold control records are ignored
+    valid = ends - starts >= 75
+    starts, ends = starts[valid], ends[valid]
+    if len(starts) == 0:
+        return np.zeros(0, dtype=SECTION_DTYPE)
+    control = data[starts[:, None] + np.arange(66, 75)]
+    mat = _parse_ints(control[:, 0:4])
+    mf = _parse_ints(control[:, 4:6])
+    mt = _parse_ints(control[:, 6:9])
+
+    # SEND, FEND, MEND, TEND and TPID records have MT = 0
+    insection = (mt > 0) & (mf > 0) & (mat > 0)
+    previous = np.roll(np.stack([mat, mf, mt]), 1, axis=1)
+    previous_insection = np.roll(insection, 1)
+    previous_insection[0] = False
+    first = insection & (
+        ~previous_insection | (np.stack([mat, mf, mt]) != previous).any(axis=0)
+    )
+    last = insection & np.append(first[1:] | ~insection[1:], True)
+
+    first, last = np.flatnonzero(first), np.flatnonzero(last)
+    index = np.zeros(len(first), dtype=SECTION_DTYPE)
+    index["mat"] = mat[first]
+    index["mf"] = mf[first]
+    index["mt"] = mt[first]
+    index["offset"] = starts[first]
+    index["length"] = ends[last] - starts[first]
+    return index
+
+
+def section_index_path(tape: str | Path) -> Path:
+    """Path to the cached section index of a tape. Section indexes are kept in
+    the cache directory and keyed by the signature of the tape, i.e. its
+    absolute path, size and modification time: writing them next to the tapes
+    would modify the sublibrary directory and invalidate its header index, see
+    `is_up_to_date`. The tape is neither read nor hashed.
+
+    Args:
+        tape (str | Path): Path to an ENDF6 tape
+
+    Returns:
+        Path: Path to the section index
+    """
+    stat = os.stat(tape)
+    signature = f"{Path(tape).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    key = hashlib.sha1(signature.encode("utf-8")).hexdigest()
+    return NDMANAGER_CACHE / "sections" / f"{key}{SECTION_INDEX_SUFFIX}"
+
+
+def get_section_index(tape: str | Path, write: bool = True) -> np.ndarray:
+    """Get the section index of a tape, from the cache if it is up to date,
+    or by indexing the tape otherwise.
+
+    Args:
+        tape (str | Path): Path to an ENDF6 tape
+        write (bool, optional): Write the section index to the cache if it is
+                                missing or out of date. Defaults to True.
+
+    Returns:
+        np.ndarray: The section index, see `build_section_index`
+    """
+    stat = os.stat(tape)
+    signature = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    path = section_index_path(tape)
+    try:
+        with np.load(path) as cached:
+            if np.array_equal(cached["signature"], signature):
+                return cached["sections"]
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        pass
+
+    with open(tape, "rb") as f:
+        if stat.st_size == 0:
+            index = build_section_index(b"")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                index = build_section_index(mm)
+
+    if write:
+        tmppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmppath, "wb") as f:
+                np.savez(f, sections=index, signature=signature)
+            os.replace(tmppath, path)
+        except OSError:
+            tmppath.unlink(missing_ok=True)
+    return index
+
+
+def read_section(tape: str | Path, mf: int, mt: int, mat: int | None = None) -> str:
+    """Read a single section of an ENDF6 tape, without reading the rest of
+    the tape.
+
+    Args:
+        tape (str | Path): Path to an ENDF6 tape
+        mf (int): The MF number of the section
+        mt (int): The MT number of the section
+        mat (int | None, optional): The MAT number of the section. Defaults to
+                                    None, i.e. the first material of the tape.
+
+    Raises:
+        KeyError: The section is not in the tape
+
+    Returns:
+        str: The lines of the section, without the SEND record
+    """
+    index = get_section_index(tape)
+    match = (index["mf"] == mf) & (index["mt"] == mt)
+    if mat is not None:
+        match &= index["mat"] == mat
+    found = np.flatnonzero(match)
+    if len(found) == 0:
+        raise KeyError(f"No MF={mf}, MT={mt} section in {tape}")
+    section = index[found[0]]
+    with open(tape, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = int(section["offset"])
+            content = mm[start : start + int(section["length"])]
+    return content.decode("utf-8")
+
+
+def _open_tape(tape: str | Path) -> mmap.mmap:
+    """Memory-map a tape for reading
+
+    Args:
+        tape (str | Path): Path to an ENDF6 tape
+
+    Returns:
+        mmap.mmap: The memory-mapped tape
+    """
+    with open(tape, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def material_spans(tape: str | Path) -> Tuple[str, List[Tuple[int, int]]]:
+    """Locate the materials of a tape by scanning it for MEND records. The
+    tape is memory-mapped, so that the scan runs in constant memory.
+
+    Args:
+        tape (str | Path): Path to an ENDF6 tape
+
+    Returns:
+        Tuple[str, List[Tuple[int, int]]]: The TPID record of the tape and the
+                                           byte offset and length of each
+                                           material, MEND record included
+    """
+    if os.stat(tape).st_size == 0:
+        return "", []
+    with _open_tape(tape) as mm:
+        start = mm.find(b"\n") + 1
+        tpid = mm[:start].decode("utf-8")
+        spans = []
+        for match in MEND_RE.finditer(mm, start):
+            spans.append((start, match.end() - start))
+            start = match.end()
+    return tpid, spans
+
+
+def iter_materials(tape: str | Path) -> Iterator[str]:
+    """Lazily read the materials of a multi-material tape. Only one material
+    is held in memory at a time.
+
+    Args:
+        tape (str | Path): Path to an ENDF6 tape
+
+    Yields:
+        str: The lines of a material, MEND record included
+    """
+    _, spans = material_spans(tape)
+    if not spans:
+        return
+    with _open_tape(tape) as mm:
+        for offset, length in spans:
+            yield mm[offset : offset + length].decode("utf-8")
+
+
+def _write_material(
+    tape: str | Path, directory: Path, tpid: str, span: Tuple[int, int]
+) -> Path:
+    """Write a material of a tape to a single material tape, named after the
+    material's nuclide, or its MAT number if it is not a nuclide.
+
+    Args:
+        tape (str | Path): Path to the multi-material tape
+        directory (Path): The directory to write the tape in
+        tpid (str): The TPID record of the multi-material tape
+        span (Tuple[int, int]): The offset and length of the material
+
+    Returns:
+        Path: The path to the written tape
+    """
+    offset, length = span
+    with _open_tape(tape) as mm:
+        material = mm[offset : offset + length].decode("utf-8")
+    header = parse_header([tpid] + material.splitlines(keepends=True)[:5])
+    name = header["name"] if header["name"] is not None else str(header["mat"])
+    target = directory / f"{name}.endf6"
+    with open(target, "w", encoding="utf-8", newline="") as f:
+        f.write(tpid + material + TEND_RECORD)
+    return target
+
+
+def split_tape(
+    tape: str | Path, directory: str | Path, processes: int = 1
+) -> List[Path]:
+    """Split a multi-material tape into single material tapes. Materials are
+    located in a first pass over the memory-mapped tape, and are then written
+    concurrently, each process reading only the material it writes.
+
+    Args:
+        tape (str | Path): Path to the multi-material tape
+        directory (str | Path): The directory to write the tapes in
+        processes (int, optional): Number of concurent processes. Defaults to 1.
+
+    Returns:
+        List[Path]: The paths to the written tapes, in the order of the
+                    multi-material tape
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    tpid, spans = material_spans(tape)
+    func = partial(_write_material, tape, directory, tpid)
+
+    bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
+    pbar = tqdm(total=len(spans), bar_format=bar_format, desc=Path(tape).name)
+    if processes == 1:
+        paths = []
+        for span in spans:
+            paths.append(func(span))
+            pbar.update()
+    else:
+        chunksize = max(1, len(spans) // (4 * processes))
+        paths = []
+        for path in imap(func, spans, processes, chunksize):
+            paths.append(path)
+            pbar.update()
+    pbar.close()
+    return paths
@@ -0,0 +1,18 @@
+"""SHA1 hashing of files, kept free of ndmanager imports so that any module
+can use it"""
+
+import hashlib
+from pathlib import Path
+
+
+def compute_file_sha1(filename: str | Path) -> str:
+    """Compute the SHA1 value of a file given its path.
+
+    Args:
+        filename (str | Path): Path to a file.
+
+    Returns:
+        str: The SHA1 value
+    """
+    with open(filename, "rb") as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
@@ -1,6 +1,5 @@
 """A class to manage a nuclear data sublibrary originating from the IAEA website"""
 
-import multiprocessing as mp
 import re
 import tempfile
 import zipfile
@@ -14,6 +13,7 @@ from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 from ndmanager.API.nuclide import Nuclide
+from ndmanager.API.pool import starmap
 
 
 @dataclass
@@ -235,23 +235,9 @@ class IAEASublibrary:
                 pbar.update()
             pbar.close()
         else:
-
-            def error_callback(e):
-                raise e
-
-            def update_pbar(_):
-                pbar.update()
-
             description = f"{self.lib}/{self.kind}"
             pbar.set_description(f"{description:<25}")
-            with mp.get_context("spawn").Pool(processes) as p:
-                for nuclide, target in zip(nuclides, targets):
-                    p.apply_async(
-                        self.download_single,
-                        args=(nuclide, target),
-                        callback=update_pbar,
-                        error_callback=error_callback,
-                    )
-                p.close()
-                p.join()
-                pbar.close()
+            tasks = zip(nuclides, targets)
+            for _ in starmap(self.download_single, tasks, processes, unordered=True):
+                pbar.update()
+            pbar.close()
@@ -0,0 +1,286 @@
+"""Merkle trees of the datasets of OpenMC HDF5 libraries, used to compare
+libraries without loading their data"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import h5py
+import numpy as np
+
+from ndmanager.API.pool import imap
+from ndmanager.API.validate import list_library_files
+from ndmanager.env import NDMANAGER_HDF5
+
+MERKLE_NAME = ".merkle.json"
+MERKLE_VERSION = 2
+# Number of values hashed at once for large datasets
+HASH_BLOCK = 1 << 22
+
+
+def _update_with_array(sha1: "hashlib._Hash", value: Any) -> None:
+    """Update a hash with the type, shape and content of an array
+
+    Args:
+        sha1 (hashlib._Hash): The hash object
+        value (Any): The array or array-like value
+    """
+    array = np.asarray(value)
+    sha1.update(f"{array.dtype.str}{array.shape}".encode())
+    if array.dtype.kind == "O":
+        sha1.update(repr(array.tolist()).encode())
+    else:
+        sha1.update(np.ascontiguousarray(array).tobytes())
+
+
+def _attrs_hash(node: h5py.HLObject) -> str:
+    """Hash the attributes of an HDF5 node
+
+    Args:
+        node (h5py.HLObject): The group or dataset
+
+    Returns:
+        str: The SHA1 of the attributes
+    """
+    sha1 = hashlib.sha1()
+    for key in sorted(node.attrs):
+        sha1.update(key.encode())
+        _update_with_array(sha1, node.attrs[key])
+    return sha1.hexdigest()
+
+
+def hash_dataset(dataset: h5py.Dataset) -> str:
+    """Hash the content and attributes of an HDF5 dataset. Large datasets are
+    read in blocks.
+
+    Args:
+        dataset (h5py.Dataset): The dataset
+
+    Returns:
+        str: The SHA1 of the dataset
+    """
+    sha1 = hashlib.sha1()
+    sha1.update(_attrs_hash(dataset).encode())
+    sha1.update(f"{dataset.dtype.str}{dataset.shape}".encode())
+    if dataset.ndim == 0 or dataset.size <= HASH_BLOCK:
+        _update_with_array(sha1, dataset[()])
+        return sha1.hexdigest()
+    step = max(1, HASH_BLOCK // (dataset.size // dataset.shape[0]))
+    for start in range(0, dataset.shape[0], step):
+        _update_with_array(sha1, dataset[start : start + step])
+    return sha1.hexdigest()
+
+
+def hash_group(group: h5py.Group) -> Dict[str, Any]:
+    """Build the Merkle tree of an HDF5 group: the hash of a group is the hash
+    of its attributes and of the names and hashes of its children.
+
+    Args:
+        group (h5py.Group): The group
+
+    Returns:
+        Dict[str, Any]: The tree, with a "hash" key, and "attrs" and "children"
+                        keys for groups
+    """
+    sha1 = hashlib.sha1()
+    attrs = _attrs_hash(group)
+    sha1.update(attrs.encode())
+    children = {}
+    for name in sorted(group):
+        child = group[name]
+        if isinstance(child, h5py.Group):
+            children[name] = hash_group(child)
+        else:
+            children[name] = {"hash": hash_dataset(child)}
+        sha1.update(f"{name}:{children[name]['hash']}".encode())
+    return {"hash": sha1.hexdigest(), "attrs": attrs, "children": children}
+
+
+def hash_file(path: str | Path) -> Dict[str, Any]:
+    """Build the Merkle tree of an HDF5 file
+
+    Args:
+        path (str | Path): Path to the file
+
+    Returns:
+        Dict[str, Any]: The tree, see `hash_group`
+    """
+    with h5py.File(path, "r") as f:
+        return hash_group(f)
+
+
+def _hash_entry(args: Tuple[str, Path]) -> Tuple[str, Dict[str, Any]]:
+    """Build the cache entry of a file of a library
+
+    Args:
+        args (Tuple[str, Path]): The key of the file and the path to the file
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: The key of the file and the cache entry
+    """
+    key, path = args
+    stat = path.stat()
+    entry = {"path": str(path), "mtime": stat.st_mtime_ns, "size": stat.st_size}
+    entry["tree"] = hash_file(path)
+    return key, entry
+
+
+def library_tree(name: str, processes: int = 1) -> Dict[str, Dict[str, Any]]:
+    """Get the Merkle trees of the files of a library. Trees are cached in the
+    library directory, and only rebuilt for files that were modified since.
+    Files are identified by their data type and material name, e.g.
+    "neutron/U235" and "wmp/U235".
+
+    Args:
+        name (str): The name of the library
+        processes (int, optional): Number of concurent processes. Defaults to 1.
+
+    Raises:
+        ValueError: The library does not exist
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The cache entries, with the path,
+                                   modification time, size and tree of each
+                                   file, by data type and material name
+    """
+    root = NDMANAGER_HDF5 / name
+    xspath = root / "cross_sections.xml"
+    if not xspath.exists():
+        raise ValueError(f"{name} is not in the library list.")
+
+    cachepath = root / MERKLE_NAME
+    try:
+        with open(cachepath, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("version") != MERKLE_VERSION:
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    cached = cache.get("files", {})
+
+    files, todo = {}, []
+    for material, kind, path in list_library_files(xspath):
+        key = f"{kind}/{material}"
+        entry = cached.get(key)
+        if entry is not None and entry["path"] == str(path):
+            stat = path.stat()
+            if entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                files[key] = entry
+                continue
+        todo.append((key, path))
+
+    if todo:
+        for key, entry in imap(_hash_entry, todo, processes, unordered=True):
+            files[key] = entry
+        tmppath = cachepath.with_name(f"{cachepath.name}.{os.getpid()}.tmp")
+        with open(tmppath, "w", encoding="utf-8") as f:
+            json.dump({"version": MERKLE_VERSION, "files": files}, f)
+        os.replace(tmppath, cachepath)
+    return files
+
+
+def diff_trees(
+    tree1: Dict[str, Any], tree2: Dict[str, Any], prefix: str = ""
+) -> List[Tuple[str, str]]:
+    """Compare two Merkle trees, only descending into differing subtrees
+
+    Args:
+        tree1 (Dict[str, Any]): The first tree
+        tree2 (Dict[str, Any]): The second tree
+        prefix (str, optional): The path of the trees. Defaults to "".
+
+    Returns:
+        List[Tuple[str, str]]: The path and status of the differing nodes:
+                               "added", "removed" or "changed"
+    """
+    if tree1["hash"] == tree2["hash"]:
+        return []
+    children1 = tree1.get("children")
+    children2 = tree2.get("children")
+    if children1 is None or children2 is None:
+        return [(prefix, "changed")]
+    # A group is changed if its own attributes changed
+    diff = [(prefix, "changed")] if tree1["attrs"] != tree2["attrs"] else []
+    for name in sorted(children1.keys() | children2.keys()):
+        path = f"{prefix}/{name}"
+        if name not in children2:
+            diff.append((path, "removed"))
+        elif name not in children1:
+            diff.append((path, "added"))
+        else:
+            diff += diff_trees(children1[name], children2[name], path)
+    return diff
+
+
+def dataset_statistics(path1: str | Path, path2: str | Path, node: str) -> Dict[str, Any]:
+    """Compute difference statistics of a dataset present in two files
+
+    Args:
+        path1 (str | Path): Path to the first file
+        path2 (str | Path): Path to the second file
+        node (str): The path of the dataset in the files
+
+    Returns:
+        Dict[str, Any]: The largest absolute and relative differences for
+                        numeric datasets of identical shapes, the shapes
+                        otherwise. Empty for groups.
+    """
+    with h5py.File(path1, "r") as f1, h5py.File(path2, "r") as f2:
+        d1, d2 = f1[node], f2[node]
+        if not isinstance(d1, h5py.Dataset) or not isinstance(d2, h5py.Dataset):
+            return {}
+        a, b = d1[()], d2[()]
+    a, b = np.asarray(a), np.asarray(b)
+    if a.shape != b.shape:
+        return {"shape": [list(a.shape), list(b.shape)]}
+    if a.dtype.kind not in "iuf" or b.dtype.kind not in "iuf":
+        return {}
+    a, b = a.astype(float), b.astype(float)
+    absolute = np.abs(a - b)
+    scale = np.maximum(np.abs(a), np.abs(b))
+    relative = np.divide(absolute, scale, out=np.zeros_like(absolute), where=scale > 0)
+    return {
+        "max_abs": float(absolute.max(initial=0.0)),
+        "max_rel": float(relative.max(initial=0.0)),
+    }
+
+
+def diff_libraries(
+    name1: str, name2: str, processes: int = 1, statistics: bool = False
+) -> List[Dict[str, Any]]:
+    """Compare two libraries file by file and dataset by dataset
+
+    Args:
+        name1 (str): The name of the first library
+        name2 (str): The name of the second library
+        processes (int, optional): Number of concurent processes used to hash
+                                   files. Defaults to 1.
+        statistics (bool, optional): Compute difference statistics of the
+                                     changed datasets. Defaults to False.
+
+    Returns:
+        List[Dict[str, Any]]: The differences, with the data type and material
+                              of the file, the path of the node in the file,
+                              the status and optionally statistics
+    """
+    files1 = library_tree(name1, processes)
+    files2 = library_tree(name2, processes)
+    result = []
+    for key in sorted(files1.keys() | files2.keys()):
+        kind, material = key.split("/", 1)
+        file = {"type": kind, "material": material}
+        if key not in files2:
+            result.append(file | {"node": "/", "status": "removed"})
+            continue
+        if key not in files1:
+            result.append(file | {"node": "/", "status": "added"})
+            continue
+        entry1, entry2 = files1[key], files2[key]
+        for node, status in diff_trees(entry1["tree"], entry2["tree"]):
+            difference = file | {"node": node or "/", "status": status}
+            if statistics and status == "changed" and node:
+                difference |= dataset_statistics(entry1["path"], entry2["path"], node)
+            result.append(difference)
+    return result
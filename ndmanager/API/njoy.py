@@ -0,0 +1,341 @@
+"""NJOY processing of neutron data from cached reconstructed PENDF tapes"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from io import StringIO
+from pathlib import Path
+from typing import Iterable
+
+from ndmanager.API.endf6_index import get_tape_header
+from ndmanager.API.hashing import compute_file_sha1
+from ndmanager.env import NDMANAGER_CACHE
+from openmc.data import FissionEnergyRelease, IncidentNeutron, Tabulated1D
+from openmc.data.ace import Library
+from openmc.data.endf import (
+    Evaluation,
+    get_evaluations,
+    get_head_record,
+    get_tab1_record,
+)
+from openmc.data.njoy import run
+from openmc.data.reaction import Reaction
+
+# Default reconstruction and broadening tolerance, as in OpenMC
+NJOY_ERROR = 0.001
+
+_RECONR = """reconr
+{nendf} {npendf}
+'{library} PENDF for {zsymam}'/
+{mat} 2/
+{error}/
+'{library}: {zsymam}'/
+'Processed by NJOY'/
+0/
+"""
+
+_BROADR = """broadr
+{nendf} {npendf} {nbroadr}
+{mat} {num_temp} 0 0 0. /
+{error}/
+{temps}
+0/
+"""
+
+_HEATR = """heatr
+{nendf} {nheatr_in} {nheatr} /
+{mat} 4 0 0 {local} /
+302 318 402 444 /
+"""
+
+_GASPR = """gaspr
+{nendf} {ngas_in} {ngas} /
+"""
+
+_PURR = """purr
+{nendf} {npurr_in} {npurr} /
+{mat} {num_temp} 1 20 64 /
+{temps}
+1.e10
+0/
+"""
+
+_ACER = """acer
+{nendf} {nacer_in} 0 {nace} {ndir} /
+1 0 1 .{ext} /
+'{library}: {zsymam} at {temperature}'/
+{mat} {temperature}
+1 1 {ismooth}/
+/
+"""
+
+
+@lru_cache
+def _executable_sha1(path: str, size: int, mtime: int) -> str:
+    """SHA1 of an executable, computed once per version of the file
+
+    Args:
+        path (str): Path to the executable
+        size (int): Size of the executable, part of the lru_cache key
+        mtime (int): Modification time of the executable, part of the
+                     lru_cache key
+
+    Returns:
+        str: The SHA1 of the executable
+    """
+    return compute_file_sha1(path)
+
+
+def njoy_sha1(njoy_exec: str = "njoy") -> str | None:
+    """SHA1 of the NJOY executable that OpenMC runs, i.e. the first one on
+    the PATH.
+
+    Args:
+        njoy_exec (str, optional): The NJOY executable. Defaults to "njoy".
+
+    Returns:
+        str | None: The SHA1 of the executable, None if it is not found
+    """
+    path = shutil.which(njoy_exec)
+    if path is None:
+        return None
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    return _executable_sha1(path, stat.st_size, stat.st_mtime_ns)
+
+
+def pendf_cache_path(neutron: str | Path, error: float = NJOY_ERROR) -> Path:
+    """Path to the cached reconstructed PENDF tape of a neutron tape. Tapes
+    are identified by the SHA1 of the ENDF6 tape, the reconstruction
+    tolerance and the SHA1 of the NJOY executable, so that upgrading NJOY
+    does not reuse tapes reconstructed by another version.
+
+    Args:
+        neutron (str | Path): Path to the neutron ENDF6 tape
+        error (float, optional): The reconstruction tolerance. Defaults to NJOY_ERROR.
+
+    Returns:
+        Path: The path to the cached tape
+    """
+    sha1 = get_tape_header(neutron).get("sha1") or compute_file_sha1(neutron)
+    options = {"error": error, "njoy": njoy_sha1()}
+    name = sha1 + "-" + hashlib.sha1(json.dumps(options).encode()).hexdigest()[:12]
+    return NDMANAGER_CACHE / "pendf" / f"{name}.pendf"
+
+
+def _deck_parameters(evaluation: Evaluation) -> dict:
+    """Gather the evaluation parameters used in NJOY decks
+
+    Args:
+        evaluation (Evaluation): The ENDF6 evaluation
+
+    Returns:
+        dict: The material number, symbol and library name
+    """
+    return {
+        "mat": evaluation.material,
+        "zsymam": evaluation.target["zsymam"],
+        "library": "{}-{}.{}".format(*evaluation.info["library"]),
+    }
+
+
+def make_pendf(
+    neutron: str | Path, error: float = NJOY_ERROR, evaluation: Evaluation | None = None
+) -> Path:
+    """Reconstruct the 0K pointwise cross sections of a neutron tape with
+    NJOY's RECONR module, unless the resulting PENDF tape is already cached.
+
+    Args:
+        neutron (str | Path): Path to the neutron ENDF6 tape
+        error (float, optional): The reconstruction tolerance. Defaults to NJOY_ERROR.
+        evaluation (Evaluation | None, optional): The parsed tape, read from
+                                                  the tape if None. Defaults to None.
+
+    Returns:
+        Path: The path to the cached PENDF tape
+    """
+    cached = pendf_cache_path(neutron, error)
+    if cached.exists():
+        return cached
+    evaluation = Evaluation(neutron) if evaluation is None else evaluation
+    commands = _RECONR.format(nendf=20, npendf=21, error=error, **_deck_parameters(evaluation))
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    tmppath = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+    run(commands + "stop\n", {20: neutron}, {21: tmppath})
+    os.replace(tmppath, cached)
+    return cached
+
+
+def make_ace_from_pendf(
+    neutron: str | Path,
+    pendf: str | Path,
+    temperatures: Iterable[float],
+    output_dir: str | Path,
+    error: float = NJOY_ERROR,
+    smoothing: bool = True,
+    evaluation: Evaluation | None = None,
+) -> Path:
+    """Generate ACE tables from a reconstructed PENDF tape, running the same
+    NJOY modules as OpenMC's `make_ace` function after RECONR: BROADR, HEATR,
+    GASPR, PURR and ACER. The PENDF tapes of both HEATR runs are written to
+    `heatr` and `heatr_local` in the output directory.
+
+    Args:
+        neutron (str | Path): Path to the neutron ENDF6 tape
+        pendf (str | Path): Path to the reconstructed PENDF tape
+        temperatures (Iterable[float]): The temperatures in Kelvin
+        output_dir (str | Path): The directory to write the tapes to
+        error (float, optional): The broadening tolerance. Defaults to NJOY_ERROR.
+        smoothing (bool, optional): Use ACER's smoothing option. Defaults to True.
+        evaluation (Evaluation | None, optional): The parsed tape, read from
+                                                  the tape if None. Defaults to None.
+
+    Returns:
+        Path: The path to the ACE file holding a table for each temperature
+    """
+    output_dir = Path(output_dir)
+    evaluation = Evaluation(neutron) if evaluation is None else evaluation
+    temperatures = list(temperatures)
+    params = _deck_parameters(evaluation)
+    params |= {
+        "nendf": 20,
+        "npendf": 21,
+        "error": error,
+        "num_temp": len(temperatures),
+        "temps": " ".join(str(t) for t in temperatures),
+    }
+    tapein = {20: neutron, 21: pendf}
+    tapeout = {23: output_dir / "heatr_local", 24: output_dir / "heatr"}
+    commands = _BROADR.format(nbroadr=22, **params)
+    commands += _HEATR.format(nheatr_in=22, nheatr=23, local=1, **params)
+    commands += _HEATR.format(nheatr_in=22, nheatr=24, local=0, **params)
+    commands += _GASPR.format(ngas_in=24, ngas=25, **params)
+    commands += _PURR.format(npurr_in=25, npurr=26, **params)
+    for i, temperature in enumerate(temperatures):
+        nace, ndir = 27 + 2 * i, 28 + 2 * i
+        commands += _ACER.format(
+            nacer_in=26,
+            nace=nace,
+            ndir=ndir,
+            ext=f"{i + 1:02}",
+            temperature=temperature,
+            ismooth=int(not smoothing),
+            **params,
+        )
+        tapeout[nace] = output_dir / f"ace_{temperature:.1f}"
+        tapeout[ndir] = output_dir / f"xsdir_{temperature:.1f}"
+    run(commands + "stop\n", tapein, tapeout)
+
+    ace = output_dir / "ace"
+    with ace.open("w") as f:
+        for temperature in temperatures:
+            table = output_dir / f"ace_{temperature:.1f}"
+            text = table.read_text()
+            # The ZAID of metastable targets is offset by 400
+            if evaluation.target["isomeric_state"] > 0:
+                mass_first_digit = int(text[3])
+                if mass_first_digit <= 2:
+                    text = text[:3] + str(mass_first_digit + 4) + text[4:]
+            f.write(text)
+            table.unlink()
+            (output_dir / f"xsdir_{temperature:.1f}").unlink()
+    return ace
+
+
+def _file3_xs(evaluation: Evaluation, mt: int, energy):
+    """Evaluate a cross section of a PENDF tape on an energy grid
+
+    Args:
+        evaluation (Evaluation): The PENDF evaluation
+        mt (int): The MT number of the cross section
+        energy (np.ndarray): The energy grid
+
+    Returns:
+        np.ndarray: The cross section values
+    """
+    file_obj = StringIO(evaluation.section[3, mt])
+    get_head_record(file_obj)
+    _, xs = get_tab1_record(file_obj)
+    return xs(energy)
+
+
+def neutron_from_pendf(
+    neutron: str | Path,
+    temperatures: Iterable[float],
+    error: float = NJOY_ERROR,
+    smoothing: bool = True,
+) -> IncidentNeutron:
+    """Generate incident neutron data from an ENDF6 tape, like OpenMC's
+    `IncidentNeutron.from_njoy` method, but reusing the cached reconstructed
+    PENDF tape of the tape, see `make_pendf`. Only the temperature-dependent
+    part of the NJOY processing is run.
+
+    Args:
+        neutron (str | Path): Path to the neutron ENDF6 tape
+        temperatures (Iterable[float]): The temperatures in Kelvin
+        error (float, optional): The reconstruction and broadening tolerance.
+                                 Defaults to NJOY_ERROR.
+        smoothing (bool, optional): Use ACER's smoothing option. Defaults to True.
+
+    Returns:
+        IncidentNeutron: The incident neutron data
+    """
+    evaluation = Evaluation(neutron)
+    pendf = make_pendf(neutron, error, evaluation)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ace = make_ace_from_pendf(
+            neutron, pendf, temperatures, tmpdir, error, smoothing, evaluation
+        )
+        library = Library(ace)
+        data = IncidentNeutron.from_ace(library.tables[0])
+        for table in library.tables[1:]:
+            data.add_temperature_from_ace(table)
+
+        # 0K elastic scattering cross section
+        if "0K" not in data.energy:
+            file_obj = StringIO(Evaluation(pendf).section[3, 2])
+            get_head_record(file_obj)
+            _, xs = get_tab1_record(file_obj)
+            data.energy["0K"] = xs.x
+            data[2].xs["0K"] = xs
+
+        fission = None
+        if (1, 458) in evaluation.section:
+            data.fission_energy = fission = FissionEnergyRelease.from_endf(evaluation, data)
+
+        # Replace the fission KERMA computed by NJOY from the fission energy
+        # release, and add the KERMA where photons deposit their energy
+        # locally, see IncidentNeutron.from_njoy
+        heating_local = Reaction(901)
+        heating_local.redundant = True
+        heatr = get_evaluations(Path(tmpdir) / "heatr")
+        heatr_local = get_evaluations(Path(tmpdir) / "heatr_local")
+        for ev, ev_local, temperature in zip(heatr, heatr_local, data.temperatures):
+            kerma = data.reactions[301].xs[temperature]
+            energy = kerma.x
+            if fission is not None:
+                sigma_f = data[18].xs[temperature](energy)
+                kerma.y = (
+                    kerma.y
+                    - _file3_xs(ev, 318, energy)
+                    + (fission.fragments(energy) + fission.betas(energy)) * sigma_f
+                )
+            kerma_local = _file3_xs(ev_local, 301, energy)
+            if fission is not None:
+                kerma_local = (
+                    kerma_local
+                    - _file3_xs(ev_local, 318, energy)
+                    + (
+                        fission.fragments(energy)
+                        + fission.prompt_photons(energy)
+                        + fission.delayed_photons(energy)
+                        + fission.betas(energy)
+                    )
+                    * sigma_f
+                )
+            heating_local.xs[temperature] = Tabulated1D(energy, kerma_local)
+        data.reactions[901] = heating_local
+    return data
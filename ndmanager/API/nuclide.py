@@ -2,32 +2,87 @@
 """A class to manage nuclide names."""
 
 import re
+from functools import cache, total_ordering
 from pathlib import Path
+from typing import Dict, Tuple
 
 from ndmanager.data import ATOMIC_SYMBOL, META_SYMBOL
 
 
+@total_ordering
 class Nuclide:
-    """A class to manage Nuclide names."""
+    """A class to manage Nuclide names. Nuclides are immutable and interned:
+    there is a single instance for each (Z, A, M) triplet, so that nuclides
+    can be used as dictionnary keys and compared cheaply. Nuclides are ordered
+    by zam number.
+    """
+
+    __slots__ = ("Z", "A", "M", "element", "name", "zam")
 
     splitname_re = re.compile(r"^([A-Za-z]+)([0-9]+)(_*)([A-Za-z0-9]*)")
     file2zam_re = re.compile(r"([A-Za-z][a-z]*)-(\d+)([A-Z]*)")
+    _instances: Dict[Tuple[int, int | None, int | None], "Nuclide"] = {}
 
-    def __init__(self, Z: int, A: int, M: int) -> None:
+    def __new__(cls, Z: int, A: int | None, M: int | None) -> "Nuclide":
         """Instanciate a nuclide using it atomic number, mass number and
-        metastable index.
+        metastable index. Elements have no mass number and metastable index.
 
         Args:
             Z (int): Atomic number
-            A (int): Mass number
-            M (int): Metastable index
+            A (int | None): Mass number
+            M (int | None): Metastable index
+
+        Returns:
+            Nuclide: The nuclide object
         """
-        self.Z = Z
-        self.element = ATOMIC_SYMBOL[Z]
-        self.A = A
-        self.M = M
+        key = (Z, A, M)
+        nuclide = cls._instances.get(key)
+        if nuclide is not None:
+            return nuclide
+
+        element = ATOMIC_SYMBOL[Z]
+        if A is None and M is None:
+            name = element
+            zam = 10_000 * Z
+        else:
+            name = f"{element}{A}_m{M}" if M > 0 else f"{element}{A}"
+            zam = 10_000 * Z + 10 * A + M
+
+        nuclide = super().__new__(cls)
+        for attr, value in zip(cls.__slots__, (Z, A, M, element, name, zam)):
+            object.__setattr__(nuclide, attr, value)
+        return cls._instances.setdefault(key, nuclide)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __reduce__(self):
+        return type(self), (self.Z, self.A, self.M)
+
+    def __repr__(self) -> str:
+        return f"Nuclide(Z={self.Z}, A={self.A}, M={self.M})"
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Nuclide):
+            return NotImplemented
+        return (self.Z, self.A, self.M) == (other.Z, other.A, other.M)
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Nuclide):
+            return NotImplemented
+        return self.zam < other.zam
+
+    def __hash__(self) -> int:
+        return hash((self.Z, self.A, self.M))
 
     @classmethod
+    @cache
     def from_name(cls, name: str) -> "Nuclide":
         """Instanciate a nuclide using its name in the GNDS format.
 
@@ -53,6 +108,7 @@ class Nuclide:
         return cls(Z, A, M)
 
     @classmethod
+    @cache
     def from_zam(cls, zam: int) -> "Nuclide":
         """Instanciate a nuclide using its zam number
 
@@ -92,7 +148,17 @@ class Nuclide:
             return cls(z, a, m)
 
     @classmethod
+    @cache
     def from_iaea_name(cls, name: str) -> "Nuclide":
+        """Instanciate a nuclide using its name in the IAEA index files, e.g.
+        95-Am-242M.
+
+        Args:
+            name (str): Nuclide name in the IAEA format
+
+        Returns:
+            Nuclide: The nuclide object
+        """
         _, element, AM = name.split("-")
         Z = ATOMIC_SYMBOL[element.capitalize()]
         if AM.isdigit():
@@ -102,28 +168,3 @@ class Nuclide:
             A = int(AM[:-1])
             M = META_SYMBOL[AM[-1]]
         return cls(Z, A, M)
-
-
-    @property
-    def name(self) -> str:
-        """Returns the name of the nuclide in the GNDS format
-
-        Returns:
-            str: The name
-        """
-        if self.A is None and self.M is None:
-            return self.element
-        if self.M > 0:
-            return f"{ATOMIC_SYMBOL[self.Z]}{self.A}_m{self.M}"
-        return f"{ATOMIC_SYMBOL[self.Z]}{self.A}"
-
-    @property
-    def zam(self) -> int:
-        """Returns the zam of the nuclide
-
-        Returns:
-            int: The zam
-        """
-        if self.A is None and self.M is None:
-            return 10_000 * self.Z
-        return 10_000 * self.Z + 10 * self.A + self.M
@@ -0,0 +1,254 @@
+# pylint: disable=invalid-name
+"""A columnar container for bulk nuclide name conversions."""
+
+import re
+from typing import Dict, Iterable, Iterator, Sequence
+
+import numpy as np
+
+from ndmanager.API.nuclide import Nuclide
+from ndmanager.data import ATOMIC_SYMBOL, META_SYMBOL
+
+# Mass number and metastable index of elements
+ELEMENT = -1
+
+SYMBOLS = np.array([ATOMIC_SYMBOL[Z] for Z in range(119)])
+SYMBOL_TO_Z = {symbol: Z for Z, symbol in enumerate(SYMBOLS)}
+LETTER_TO_M = {k: v for k, v in META_SYMBOL.items() if isinstance(k, str)}
+
+
+def _lookup(table: Dict[str, int], keys: np.ndarray) -> np.ndarray:
+    """Vectorized dictionnary lookup of an array of strings
+
+    Args:
+        table (Dict[str, int]): The dictionnary
+        keys (np.ndarray): The keys to look up
+
+    Raises:
+        KeyError: A key is not in the dictionnary
+
+    Returns:
+        np.ndarray: The values
+    """
+    sorted_keys = np.array(sorted(table))
+    values = np.array([table[k] for k in sorted_keys], dtype=np.int64)
+    if len(keys) == 0:
+        return np.zeros(0, dtype=np.int64)
+    idx = np.searchsorted(sorted_keys, keys).clip(max=len(sorted_keys) - 1)
+    missing = sorted_keys[idx] != keys
+    if missing.any():
+        raise KeyError(keys[missing][0])
+    return values[idx]
+
+
+def _findall(pattern: re.Pattern, strings: Sequence[str]) -> np.ndarray:
+    """Match every string against a regular expression with a single call to
+    the regex engine, by matching the pattern on the newline separated
+    concatenation of the strings.
+
+    Args:
+        pattern (re.Pattern): A multiline anchored pattern with groups
+        strings (Sequence[str]): The strings to match
+
+    Raises:
+        ValueError: A string does not match the pattern
+
+    Returns:
+        np.ndarray: A 2D array of matched groups, one row per string
+    """
+    strings = list(strings)
+    groups = pattern.findall("\n".join(strings))
+    if len(groups) != len(strings):
+        unmatched = next(s for s in strings if pattern.fullmatch(s) is None)
+        raise ValueError(f"Invalid nuclide name: {unmatched}")
+    return np.array(groups, dtype=str).reshape(len(strings), pattern.groups)
+
+
+def _to_int(strings: np.ndarray, default: int) -> np.ndarray:
+    """Convert an array of digit strings to integers
+
+    Args:
+        strings (np.ndarray): The digit strings, possibly empty
+        default (int): The value for empty strings
+
+    Returns:
+        np.ndarray: The integers
+    """
+    return np.where(strings == "", str(default), strings).astype(np.int64)
+
+
+class NuclideArray:
+    """A columnar array of nuclides, backed by NumPy arrays of atomic
+    numbers, mass numbers and metastable indices. Elements have a mass number
+    and a metastable index of -1.
+    """
+
+    gnds_re = re.compile(r"^([A-Za-z]+)(\d*)(?:_*m(\d+))?$", re.M)
+    iaea_re = re.compile(r"^\d+-([A-Za-z]+)-(\d+)([A-Z]?)$", re.M)
+
+    def __init__(self, Z: Iterable[int], A: Iterable[int], M: Iterable[int]) -> None:
+        """Instanciate a nuclide array using atomic numbers, mass numbers and
+        metastable indices.
+
+        Args:
+            Z (Iterable[int]): Atomic numbers
+            A (Iterable[int]): Mass numbers, -1 for elements
+            M (Iterable[int]): Metastable indices, -1 for elements
+
+        Raises:
+            ValueError: The arrays do not have the same length
+        """
+        self.Z = np.asarray(Z, dtype=np.int64).ravel()
+        self.A = np.asarray(A, dtype=np.int64).ravel()
+        self.M = np.asarray(M, dtype=np.int64).ravel()
+        if not len(self.Z) == len(self.A) == len(self.M):
+            raise ValueError("Z, A and M must have the same length")
+
+    @classmethod
+    def from_names(cls, names: Sequence[str]) -> "NuclideArray":
+        """Instanciate a nuclide array using names in the GNDS format.
+
+        Args:
+            names (Sequence[str]): Nuclide names in the GNDS format
+
+        Returns:
+            NuclideArray: The nuclide array
+        """
+        groups = _findall(cls.gnds_re, names)
+        Z = _lookup(SYMBOL_TO_Z, groups[:, 0])
+        A = _to_int(groups[:, 1], ELEMENT)
+        M = np.where(A == ELEMENT, ELEMENT, _to_int(groups[:, 2], 0))
+        return cls(Z, A, M)
+
+    @classmethod
+    def from_zams(cls, zams: Iterable[int]) -> "NuclideArray":
+        """Instanciate a nuclide array using zam numbers
+
+        Args:
+            zams (Iterable[int]): The zam numbers
+
+        Returns:
+            NuclideArray: The nuclide array
+        """
+        zams = np.asarray(zams, dtype=np.int64)
+        return cls(zams // 10_000, (zams // 10) % 1000, zams % 10)
+
+    @classmethod
+    def from_iaea_names(cls, names: Sequence[str]) -> "NuclideArray":
+        """Instanciate a nuclide array using names from the IAEA index files,
+        e.g. 95-Am-242M.
+
+        Args:
+            names (Sequence[str]): Nuclide names in the IAEA format
+
+        Returns:
+            NuclideArray: The nuclide array
+        """
+        groups = _findall(cls.iaea_re, names)
+        Z = _lookup(SYMBOL_TO_Z, np.char.capitalize(groups[:, 0]))
+        A = groups[:, 1].astype(np.int64)
+        M = _lookup(LETTER_TO_M, groups[:, 2])
+        return cls(Z, A, M)
+
+    @classmethod
+    def from_endf(cls, za: Iterable[float], liso: Iterable[int]) -> "NuclideArray":
+        """Instanciate a nuclide array using the ZA and LISO values of the
+        MF1/MT451 section of ENDF6 tapes. Materials with a mass number of 0 are
+        considered to be elements.
+
+        Args:
+            za (Iterable[float]): The ZA values
+            liso (Iterable[int]): The LISO values
+
+        Returns:
+            NuclideArray: The nuclide array
+        """
+        za = np.rint(np.asarray(za, dtype=float)).astype(np.int64)
+        liso = np.asarray(liso, dtype=np.int64)
+        A = za % 1000
+        element = (A == 0) & (liso == 0)
+        A = np.where(element, ELEMENT, A)
+        M = np.where(element, ELEMENT, liso)
+        return cls(za // 1000, A, M)
+
+    @classmethod
+    def from_nuclides(cls, nuclides: Iterable[Nuclide]) -> "NuclideArray":
+        """Instanciate a nuclide array from Nuclide objects
+
+        Args:
+            nuclides (Iterable[Nuclide]): The nuclides
+
+        Returns:
+            NuclideArray: The nuclide array
+        """
+        triplets = [
+            (n.Z, ELEMENT if n.A is None else n.A, ELEMENT if n.M is None else n.M)
+            for n in nuclides
+        ]
+        Z, A, M = np.array(triplets, dtype=np.int64).reshape(-1, 3).T
+        return cls(Z, A, M)
+
+    def __len__(self) -> int:
+        return len(self.Z)
+
+    def __getitem__(self, key) -> "Nuclide | NuclideArray":
+        if np.ndim(key) == 0 and not isinstance(key, slice):
+            if self.A[key] == ELEMENT:
+                return Nuclide(int(self.Z[key]), None, None)
+            return Nuclide(int(self.Z[key]), int(self.A[key]), int(self.M[key]))
+        return NuclideArray(self.Z[key], self.A[key], self.M[key])
+
+    def __iter__(self) -> Iterator[Nuclide]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"NuclideArray({self.names.tolist()})"
+
+    @property
+    def elements(self) -> np.ndarray:
+        """Returns the element symbols of the nuclides
+
+        Returns:
+            np.ndarray: The element symbols
+        """
+        return SYMBOLS[self.Z]
+
+    @property
+    def names(self) -> np.ndarray:
+        """Returns the names of the nuclides in the GNDS format
+
+        Returns:
+            np.ndarray: The names
+        """
+        names = np.char.add(self.elements, np.char.mod("%d", self.A))
+        meta = np.char.add("_m", np.char.mod("%d", self.M))
+        names = np.where(self.M > 0, np.char.add(names, meta), names)
+        return np.where(self.A == ELEMENT, self.elements, names)
+
+    @property
+    def zams(self) -> np.ndarray:
+        """Returns the zam numbers of the nuclides
+
+        Returns:
+            np.ndarray: The zam numbers
+        """
+        zams = 10_000 * self.Z + 10 * self.A + self.M
+        return np.where(self.A == ELEMENT, 10_000 * self.Z, zams)
+
+    def argsort(self) -> np.ndarray:
+        """Returns the indices that sort the nuclides by zam number, elements
+        come before the nuclides with the same atomic number.
+
+        Returns:
+            np.ndarray: The sorting indices
+        """
+        return np.lexsort((self.M, self.A, self.Z))
+
+    def sorted(self) -> "NuclideArray":
+        """Returns a copy of the array sorted by zam number
+
+        Returns:
+            NuclideArray: The sorted array
+        """
+        return self[self.argsort()]
@@ -1,12 +1,100 @@
 """Set nuclear data paths for OpenMC"""
 
-from typing import List
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
 import openmc
 from openmc.data import DataLibrary
 
 from ndmanager.env import NDMANAGER_CHAINS, NDMANAGER_HDF5
 
+# Parsed libraries, keyed by path, with the modification time of the file
+# they were read from and an index of their entries by data type and material
+Index = Dict[Tuple[str, str], Dict[str, Any]]
+_libraries: Dict[Path, Tuple[int, DataLibrary, Index]] = {}
+
+
+def get_xs_path(libname: str) -> Path:
+    """Get the path to the cross_sections.xml file of a library
+
+    Args:
+        libname (str): The name of the library or a path to a cross_sections.xml file
+
+    Raises:
+        FileNotFoundError: raised if the library is not installed.
+
+    Returns:
+        Path: The absolute path to the cross_sections.xml file
+    """
+    if libname[-4:] == ".xml":
+        p = Path(libname).absolute()
+        if not p.exists():
+            raise FileNotFoundError(f"No such file '{libname}'")
+    else:
+        p = NDMANAGER_HDF5 / libname / "cross_sections.xml"
+        if not p.exists():
+            raise FileNotFoundError(f"Invalid library name '{libname}'")
+    return p
+
+
+def _load_library(libname: str) -> Tuple[DataLibrary, Index]:
+    """Parse a library, or get it from the cache if its cross_sections.xml file
+    was not modified since it was last parsed.
+
+    Args:
+        libname (str): The name of the library or a path to a cross_sections.xml file
+
+    Returns:
+        Tuple[DataLibrary, Index]: The library and its entries by data type
+                                   and material
+    """
+    p = get_xs_path(libname)
+    mtime = p.stat().st_mtime_ns
+    cached = _libraries.get(p)
+    if cached is None or cached[0] != mtime:
+        lib = DataLibrary.from_xml(p)
+        index = {}
+        for entry in lib.libraries:
+            for material in entry["materials"]:
+                index.setdefault((entry["type"], material), entry)
+        cached = (mtime, lib, index)
+        _libraries[p] = cached
+    return cached[1], cached[2]
+
+
+def get_library(libname: str) -> DataLibrary:
+    """Get the parsed DataLibrary of a library. Libraries are cached and only
+    parsed again when their cross_sections.xml file is modified, the returned
+    object should not be modified.
+
+    Args:
+        libname (str): The name of the library or a path to a cross_sections.xml file
+
+    Returns:
+        DataLibrary: The library
+    """
+    return _load_library(libname)[0]
+
+
+def get_library_entry(
+    libname: str, material: str, data_type: str = "neutron"
+) -> Dict[str, Any] | None:
+    """Get the entry of a material in a library, the equivalent of
+    DataLibrary.get_by_material using the cached index of the library.
+
+    Args:
+        libname (str): The name of the library or a path to a cross_sections.xml file
+        material (str): The name of the material
+        data_type (str, optional): The type of the entry, e.g. "neutron",
+                                   "photon", "thermal" or "wmp".
+                                   Defaults to "neutron".
+
+    Returns:
+        Dict[str, Any] | None: The library entry, None if the material is not
+                               in the library
+    """
+    return _load_library(libname)[1].get((data_type, material))
+
 
 def set_xs(libname: str):
     """Set openmc.config["cross_section"] value to the path to the
@@ -18,15 +106,13 @@ def set_xs(libname: str):
     Raises:
         FileNotFoundError: raised if the library is not installed.
     """
-
+    # Parsing the library here validates it, and warms up the cache for the
+    # checks that usually follow
+    _load_library(libname)
     if libname[-4:] == ".xml":
         openmc.config["cross_sections"] = libname
     else:
-        p = NDMANAGER_HDF5 / libname / "cross_sections.xml"
-        if p.exists():
-            openmc.config["cross_sections"] = p
-        else:
-            raise FileNotFoundError(f"Invalid library name '{libname}'")
+        openmc.config["cross_sections"] = get_xs_path(libname)
 
 
 def set_chain(chain: str):
@@ -65,29 +151,32 @@ def set_nuclear_data(libname: str, chain: str = False):
         set_chain(chain)
 
 
-def check_nuclear_data(libname: str, nuclides: str | List[str]):
-    """Check that the OpenMC nuclear data library contains the desired nuclides.
+def missing_nuclear_data(libname: str, nuclides: str | Iterable[str]) -> Set[str]:
+    """Find the nuclides that have no neutron data in an OpenMC nuclear data
+    library.
 
     Args:
         libname (str): The name of the library or a path to a cross_sections.xml file
-        nuclides (str | List[str]): The nuclide of nuclides to check for
+        nuclides (str | Iterable[str]): The nuclide or nuclides to check for
 
-    Raises:
-        ValueError: _description_
+    Returns:
+        Set[str]: The missing nuclides
     """
-    if libname[-4:] == ".xml":
-        lib = DataLibrary.from_xml(libname)
-    else:
-        lib = DataLibrary.from_xml(NDMANAGER_HDF5 / libname / "cross_sections.xml")
     if isinstance(nuclides, str):
-        if lib.get_by_material(nuclides) is None:
-            return False
-        return True
-
-    missing = []
-    for nuclide in nuclides:
-        if lib.get_by_material(nuclide) is None:
-            missing.append(nuclide)
-    if missing:
-        return False
-    return True
+        nuclides = [nuclides]
+    index = _load_library(libname)[1]
+    return {nuclide for nuclide in nuclides if ("neutron", nuclide) not in index}
+
+
+def check_nuclear_data(libname: str, nuclides: str | List[str]) -> bool:
+    """Check that the OpenMC nuclear data library contains neutron data for the
+    desired nuclides.
+
+    Args:
+        libname (str): The name of the library or a path to a cross_sections.xml file
+        nuclides (str | List[str]): The nuclide of nuclides to check for
+
+    Returns:
+        bool: Whether all the nuclides are in the library
+    """
+    return not missing_nuclear_data(libname, nuclides)
@@ -0,0 +1,177 @@
+"""Persistent worker pools shared by the processing stages"""
+
+import atexit
+import logging
+import multiprocessing as mp
+import multiprocessing.pool
+import warnings
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+# Modules imported once by the forkserver process, and inherited by every
+# worker it forks instead of being imported again by each worker
+PRELOAD = ["numpy", "h5py", "openmc", "openmc.data", "openmc.deplete", "ndmanager.data"]
+
+# Workers are replaced after this number of jobs, which bounds the memory and
+# file handles leaked by a long running worker
+MAX_TASKS_PER_CHILD = 100
+
+_POOL: Dict[str, Any] = {"pool": None, "processes": 0}
+
+
+def get_context() -> mp.context.BaseContext:
+    """Get the multiprocessing context used by worker pools: forkserver with
+    preloaded modules where available, spawn otherwise.
+
+    Returns:
+        mp.context.BaseContext: The multiprocessing context
+    """
+    if "forkserver" not in mp.get_all_start_methods():
+        return mp.get_context("spawn")
+    context = mp.get_context("forkserver")
+    # Modules that cannot be imported are skipped by the forkserver
+    context.set_forkserver_preload(PRELOAD)
+    return context
+
+
+def get_pool(processes: int) -> mp.pool.Pool:
+    """Get a pool of worker processes. A single pool is kept and reused by the
+    following stages, until the program exits or `shutdown` is called. It is
+    replaced when a different number of processes is requested. Workers are
+    replaced after `MAX_TASKS_PER_CHILD` jobs.
+
+    Args:
+        processes (int): The number of worker processes
+
+    Returns:
+        mp.pool.Pool: The pool
+    """
+    if _POOL["pool"] is None or _POOL["processes"] != processes:
+        shutdown()
+        _POOL["pool"] = get_context().Pool(
+            processes, maxtasksperchild=MAX_TASKS_PER_CHILD
+        )
+        _POOL["processes"] = processes
+    return _POOL["pool"]
+
+
+def shutdown() -> None:
+    """Terminate the worker pool, if any"""
+    pool = _POOL["pool"]
+    _POOL["pool"], _POOL["processes"] = None, 0
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+
+
+atexit.register(shutdown)
+
+
+def _loggers() -> List[logging.Logger]:
+    """List the existing loggers, including the root logger
+
+    Returns:
+        List[logging.Logger]: The loggers
+    """
+    loggers = [logging.getLogger()]
+    for logger in logging.Logger.manager.loggerDict.values():
+        if isinstance(logger, logging.Logger):
+            loggers.append(logger)
+    return loggers
+
+
+def isolated(func: Callable, *args: Any) -> Any:
+    """Call a function, then restore the warnings and logging state of the
+    process: the warnings filters and `warnings.showwarning` are restored, and
+    the logging handlers added during the call are closed and removed. Workers
+    of persistent pools run many jobs, which must not leak this state into
+    each other, e.g. through `HDF5Sublibrary.get_logger`.
+
+    Args:
+        func (Callable): The function
+        *args (Any): The arguments of the function
+
+    Returns:
+        Any: The result of the function
+    """
+    handlers = {id(logger): list(logger.handlers) for logger in _loggers()}
+    with warnings.catch_warnings():
+        try:
+            return func(*args)
+        finally:
+            for logger in _loggers():
+                for handler in logger.handlers[:]:
+                    if handler not in handlers.get(id(logger), []):
+                        logger.removeHandler(handler)
+                        handler.close()
+
+
+def imap(
+    func: Callable,
+    iterable: Iterable,
+    processes: int = 1,
+    chunksize: int = 1,
+    unordered: bool = False,
+) -> Iterator:
+    """Apply a function to the items of an iterable in a persistent pool of
+    worker processes, see `get_pool`, each call being isolated, see `isolated`.
+    If a call fails, the pool is terminated so that its remaining jobs are
+    cancelled, and the exception is raised. With a single process, the
+    function is called in the current process instead.
+
+    Args:
+        func (Callable): The function, which must be picklable
+        iterable (Iterable): The items
+        processes (int, optional): The number of worker processes. Defaults to 1.
+        chunksize (int, optional): The number of items sent to a worker at
+                                   once. Defaults to 1.
+        unordered (bool, optional): Yield results as soon as they are
+                                    available instead of in order.
+                                    Defaults to False.
+
+    Yields:
+        Any: The results
+    """
+    if processes == 1:
+        for item in iterable:
+            yield isolated(func, item)
+        return
+    pool = get_pool(processes)
+    mapper = pool.imap_unordered if unordered else pool.imap
+    try:
+        yield from mapper(partial(isolated, func), iterable, chunksize=chunksize)
+    except BaseException:
+        shutdown()
+        raise
+
+
+def starmap(
+    func: Callable, iterable: Iterable[Tuple], processes: int = 1, unordered: bool = False
+) -> Iterator:
+    """Like `imap`, with argument tuples unpacked
+
+    Args:
+        func (Callable): The function, which must be picklable
+        iterable (Iterable[Tuple]): The argument tuples
+        processes (int, optional): The number of worker processes. Defaults to 1.
+        unordered (bool, optional): Yield results as soon as they are
+                                    available instead of in order.
+                                    Defaults to False.
+
+    Yields:
+        Any: The results
+    """
+    yield from imap(_star, ((func, args) for args in iterable), processes, 1, unordered)
+
+
+def _star(task: Tuple[Callable, Tuple]) -> Any:
+    """Call a function with unpacked arguments
+
+    Args:
+        task (Tuple[Callable, Tuple]): The function and its arguments
+
+    Returns:
+        Any: The result of the function
+    """
+    func, args = task
+    return func(*args)
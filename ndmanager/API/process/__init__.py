@@ -3,8 +3,10 @@ from .hdf5_neutron import HDF5Neutron
 from .hdf5_photon import HDF5Photon
 from .hdf5_sublibrary import HDF5Sublibrary
 from .hdf5_tsl import HDF5TSL
+from .hdf5_wmp import HDF5WMP
 from .input_parser import InputParser
 from .ndm_library import NDMLibrary
 from .neutron_manager import NeutronManager
 from .photon_manager import PhotonManager
 from .tsl_manager import TSLManager
+from .wmp_manager import WMPManager
@@ -1,6 +1,5 @@
 """A generic class for managing libraries generation"""
-import multiprocessing as mp
-
+from ndmanager.API.pool import imap
 from ndmanager.API.process.hdf5_sublibrary import HDF5Sublibrary
 from tqdm import tqdm
 
@@ -30,23 +29,7 @@ class BaseManager(list):
         if len(self) == 0:
             return
         bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
-        with mp.get_context("spawn").Pool(j) as p:
-            pbar = tqdm(total=len(self), bar_format=bar_format, desc=desc)
-
-            def update_pbar(_):
-                pbar.update()
-
-            def error_callback(e):
-                raise e
-
-            for particle in self:
-                p.apply_async(
-                    processor,
-                    args=(particle,),
-                    callback=update_pbar,
-                    error_callback=error_callback,
-                )
-
-            p.close()
-            p.join()
-            pbar.close()
+        pbar = tqdm(total=len(self), bar_format=bar_format, desc=desc)
+        for _ in imap(processor, self, j, unordered=True):
+            pbar.update()
+        pbar.close()
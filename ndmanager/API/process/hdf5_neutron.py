@@ -1,11 +1,13 @@
 """A class to process an OpenMC HDF5 neutron data file"""
+import shutil
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Set
 
+from ndmanager.API.njoy import neutron_from_pendf
 from ndmanager.API.process.hdf5_sublibrary import HDF5Sublibrary
-from ndmanager.API.utils import merge_neutron_file
+from ndmanager.API.utils import get_temperatures, merge_neutron_file
 from openmc.data import IncidentNeutron
 
 
@@ -15,6 +17,22 @@ class HDF5Neutron(HDF5Sublibrary):
 
     neutron: Path
     temperatures: Set[int]
+    cache_pendf: bool = False
+
+    def generate(self, temperatures: Set[int]) -> IncidentNeutron:
+        """Generate the incident neutron data at some temperatures with NJOY.
+        If `cache_pendf` is set, the reconstructed PENDF tape is cached and
+        reused, so that only the temperature-dependent modules are run.
+
+        Args:
+            temperatures (Set[int]): The temperatures in Kelvin
+
+        Returns:
+            IncidentNeutron: The incident neutron data
+        """
+        if self.cache_pendf:
+            return neutron_from_pendf(self.neutron, sorted(temperatures))
+        return IncidentNeutron.from_njoy(self.neutron, temperatures=temperatures)
 
     def process(self):
         """Process neutron ENDF6 file to HDF5 using OpenMC's API"""
@@ -26,8 +44,7 @@ class HDF5Neutron(HDF5Sublibrary):
         t0 = time.time()
         if self.path.exists():
             logger.info("Processed file already exists at %s", self.path)
-            target = IncidentNeutron.from_hdf5(self.path)
-            target_temp = {int(t[:-1]) for t in target.temperatures}
+            target_temp = get_temperatures(self.path)
             _t = " ".join([str(t) for t in target_temp])
             logger.info("Existing temperatures: %s", _t)
 
@@ -37,15 +54,17 @@ class HDF5Neutron(HDF5Sublibrary):
                 return
             _t = " ".join([str(t) for t in temperatures])
             logger.info("New processing temperatures: %s", _t)
-            tmpfile = self.path.parent / f"tmp_{self.target}.h5"
-
-            source = IncidentNeutron.from_njoy(self.neutron, temperatures=temperatures)
-            source.export_to_hdf5(tmpfile, "w")
-            merge_neutron_file(tmpfile, self.path)
-            tmpfile.unlink()
+            with self.scratch() as scratch:
+                tmpfile = scratch / f"tmp_{self.target}.h5"
+                merged = scratch / f"{self.target}.h5"
+                source = self.generate(temperatures)
+                source.export_to_hdf5(tmpfile, "w")
+                shutil.copyfile(self.path, merged)
+                merge_neutron_file(tmpfile, merged)
+                self.install(merged)
         else:
-            data = IncidentNeutron.from_njoy(
-                self.neutron, temperatures=self.temperatures
-            )
-            data.export_to_hdf5(self.path, "w")
+            with self.scratch() as scratch:
+                data = self.generate(self.temperatures)
+                data.export_to_hdf5(scratch / f"{self.target}.h5", "w")
+                self.install(scratch / f"{self.target}.h5")
         logger.info("Processing time: %.1f", time.time() - t0)
@@ -23,6 +23,8 @@ class HDF5Photon(HDF5Sublibrary):
         t0 = time.time()
         if self.path.exists():
             return
-        data = IncidentPhoton.from_endf(self.photo, self.ard)
-        data.export_to_hdf5(self.path, "w")
+        with self.scratch() as scratch:
+            data = IncidentPhoton.from_endf(self.photo, self.ard)
+            data.export_to_hdf5(scratch / self.path.name, "w")
+            self.install(scratch / self.path.name)
         logger.info("Processing time %.1f", time.time() - t0)
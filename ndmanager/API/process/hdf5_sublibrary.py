@@ -1,9 +1,36 @@
 """A generic class to manage libraries of OpenMC HDF5 data files"""
 import abc
 import logging
+import os
+import shutil
+import tempfile
 import warnings
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
+
+from ndmanager.env import NDMANAGER_SCRATCH
+
+# Free space required to use /dev/shm as the default scratch filesystem
+SCRATCH_MIN_FREE = 4 << 30
+
+
+def scratch_root() -> Path:
+    """The directory in which processing jobs create their scratch directory:
+    NDMANAGER_SCRATCH if it is set, /dev/shm if it is available and has
+    enough free space, or the default temporary directory.
+
+    Returns:
+        Path: The scratch directory
+    """
+    if NDMANAGER_SCRATCH is not None:
+        return NDMANAGER_SCRATCH
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        if shutil.disk_usage(shm).free >= SCRATCH_MIN_FREE:
+            return shm
+    return Path(tempfile.gettempdir())
 
 
 @dataclass
@@ -38,3 +65,37 @@ class HDF5Sublibrary:
 
         warnings.showwarning = showwarning
         return logger
+
+    @contextmanager
+    def scratch(self) -> Iterator[Path]:
+        """Create a scratch directory for the job, see `scratch_root`. OpenMC
+        runs NJOY in temporary directories, which are created in the scratch
+        directory while the context is active. The scratch directory is
+        removed on exit.
+
+        Yields:
+            Path: The scratch directory
+        """
+        root = scratch_root()
+        root.mkdir(parents=True, exist_ok=True)
+        directory = Path(tempfile.mkdtemp(prefix=f"ndmanager-{self.target}-", dir=root))
+        previous = tempfile.tempdir
+        tempfile.tempdir = str(directory)
+        try:
+            yield directory
+        finally:
+            tempfile.tempdir = previous
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def install(self, source: Path) -> None:
+        """Move a file written in the scratch directory to the path of the
+        data file. The file is first copied next to its destination, then
+        atomically renamed, so that the data file is never partially written.
+
+        Args:
+            source (Path): The file to install
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmppath = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        shutil.move(source, tmppath)
+        os.replace(tmppath, self.path)
@@ -27,7 +27,11 @@ class HDF5TSL(HDF5Sublibrary):
         t0 = time.time()
         if self.path.exists():
             return
-        data = ThermalScattering.from_njoy(self.neutron, self.tsl, self.temperatures)
-        assert self.path.name == f"{data.name}.h5"
-        data.export_to_hdf5(self.path, "w")
+        with self.scratch() as scratch:
+            data = ThermalScattering.from_njoy(
+                self.neutron, self.tsl, self.temperatures
+            )
+            assert self.path.name == f"{data.name}.h5"
+            data.export_to_hdf5(scratch / self.path.name, "w")
+            self.install(scratch / self.path.name)
         logger.info("Processing time: %.1f", time.time() - t0)
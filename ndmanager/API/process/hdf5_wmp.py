@@ -0,0 +1,73 @@
+"""A class to process an OpenMC HDF5 windowed multipole data file"""
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict
+
+from ndmanager.API.cow import cow_copy
+from ndmanager.API.endf6_index import get_tape_header
+from ndmanager.API.hashing import compute_file_sha1
+from ndmanager.API.process.hdf5_sublibrary import HDF5Sublibrary
+from ndmanager.env import NDMANAGER_CACHE
+from openmc.data import WindowedMultipole
+
+
+def wmp_cache_path(neutron: str | Path, options: Dict[str, Any]) -> Path:
+    """Path to the cached windowed multipole data generated from a tape. Data
+    is identified by the SHA1 of the tape and the generation options.
+
+    Args:
+        neutron (str | Path): Path to the neutron ENDF6 tape
+        options (Dict[str, Any]): The options of WindowedMultipole.from_endf
+
+    Returns:
+        Path: The path to the cached file
+    """
+    sha1 = get_tape_header(neutron).get("sha1") or compute_file_sha1(neutron)
+    name = sha1
+    if options:
+        dump = json.dumps(options, sort_keys=True).encode()
+        name += "-" + hashlib.sha1(dump).hexdigest()[:12]
+    return NDMANAGER_CACHE / "wmp" / f"{name}.h5"
+
+
+@dataclass
+class HDF5WMP(HDF5Sublibrary):
+    """A class to process an OpenMC HDF5 windowed multipole data file"""
+
+    neutron: Path
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def process(self):
+        """Generate windowed multipole data from a neutron ENDF6 file using
+        OpenMC's API. Generated data is cached, so that the vector fitting is
+        only performed once for a given tape. Tapes without resolved resonance
+        parameters produce no file."""
+        logger = self.get_logger()
+        logger.info("PROCESS WINDOWED MULTIPOLE DATA")
+        logger.info("Nuclide: %s", self.target)
+        logger.info("Neutron tape: %s", self.neutron)
+        t0 = time.time()
+        if self.path.exists():
+            logger.info("Processed file already exists at %s", self.path)
+            return
+
+        cached = wmp_cache_path(self.neutron, self.options)
+        if cached.exists():
+            logger.info("Using cached data from %s", cached)
+        else:
+            try:
+                with self.scratch():
+                    data = WindowedMultipole.from_endf(self.neutron, **self.options)
+            except ValueError as e:
+                logger.error("No windowed multipole data generated: %s", e)
+                return
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmppath = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+            data.export_to_hdf5(tmppath, "w")
+            os.replace(tmppath, cached)
+        cow_copy(cached, self.path)
+        logger.info("Processing time: %.1f", time.time() - t0)
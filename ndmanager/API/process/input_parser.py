@@ -1,7 +1,7 @@
 """A generic class to parse yml inputs of the omcer module"""
 from typing import Any, Dict
 
-from ndmanager.API.nuclide import Nuclide
+from ndmanager.API.endf6_index import list_indexed_tapes
 from ndmanager.API.utils import get_endf6
 from ndmanager.env import NDMANAGER_ENDF6, NDMANAGER_HDF5
 from openmc.data import DataLibrary
@@ -50,8 +50,7 @@ class InputParser:
         """
         tapes = {}
         if self.base is not None:
-            base_paths = (NDMANAGER_ENDF6 / self.base / sublibrary).glob("*.endf6")
-            all_tapes = {Nuclide.from_file(p).name: p for p in base_paths}
+            all_tapes = list_indexed_tapes(NDMANAGER_ENDF6 / self.base / sublibrary)
             tapes |= {k: v for k, v in all_tapes.items() if k not in self.reuse}
 
         # Remove unwanted evaluations
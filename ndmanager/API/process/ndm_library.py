@@ -2,11 +2,12 @@
 import shutil
 from pathlib import Path
 
-import h5py
 import yaml
 from ndmanager.API.process.neutron_manager import NeutronManager
 from ndmanager.API.process.photon_manager import PhotonManager
 from ndmanager.API.process.tsl_manager import TSLManager
+from ndmanager.API.process.wmp_manager import WMPManager
+from ndmanager.API.utils import get_temperatures
 from ndmanager.env import NDMANAGER_HDF5
 from openmc.data import DataLibrary
 
@@ -33,6 +34,7 @@ class NDMLibrary(DataLibrary):
         self.neutron = NeutronManager(inputdict.get("neutron"), self.root)
         self.photon = PhotonManager(inputdict.get("photon"), self.root)
         self.tsl = TSLManager(inputdict.get("tsl"), self.neutron, self.root)
+        self.wmp = WMPManager(inputdict.get("wmp"), self.neutron, self.root)
 
     def process(self, j: int = 1, dryrun: bool = False, clean: bool = False) -> None:
         """Process the NDManager library using OpenMC's API
@@ -68,6 +70,11 @@ class NDMLibrary(DataLibrary):
             self.tsl.process("TSL", j, dryrun)
             self.register(self.tsl)
 
+        if self.wmp:
+            (self.root / "wmp/logs").mkdir(parents=True, exist_ok=True)
+            self.wmp.process("WMP", j, dryrun)
+            self.register(self.wmp)
+
         self.export_to_xml(self.root / "cross_sections.xml")
         shutil.copy(self.inputpath, self.root / "input.yml")
 
@@ -76,11 +83,13 @@ class NDMLibrary(DataLibrary):
                 "Reused and new neutron processed files used different temperature grids!"
             )
 
-    def register(self, manager: NeutronManager | PhotonManager | TSLManager) -> None:
+    def register(
+        self, manager: NeutronManager | PhotonManager | TSLManager | WMPManager
+    ) -> None:
         """Register managers in the DataLibrary database
 
         Args:
-            manager (NeutronManager | PhotonManager | TSLManager): _description_
+            manager (NeutronManager | PhotonManager | TSLManager | WMPManager): _description_
         """
         for path in manager.reuse.values():
             self.register_file(path)
@@ -97,11 +106,9 @@ class NDMLibrary(DataLibrary):
         # Reused temperatures
         temperature_sets = []
         for path in self.neutron.reuse.values():
-            with h5py.File(path, "r") as f:
-                kTg = list(f.values())[0]["kTs"]
-                temperatures = set([int(temp[:-1]) for temp in kTg])
-                if temperatures not in temperature_sets:
-                    temperature_sets.append(temperatures)
+            temperatures = get_temperatures(path)
+            if temperatures not in temperature_sets:
+                temperature_sets.append(temperatures)
 
         if len(temperature_sets) == 1 and self.neutron.temperatures in temperature_sets:
             return True
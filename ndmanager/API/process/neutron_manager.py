@@ -32,12 +32,15 @@ class NeutronManager(InputParser, BaseManager):
         if neutrondict is not None:
             temperatures = neutrondict.get("temperatures", "")
             self.temperatures = {int(t) for t in temperatures.split()}
+            cache_pendf = bool(neutrondict.get("cache_pendf", False))
             self.tapes = self.list_endf6("n")
             for target, neutron in self.tapes.items():
                 path = rootdir / f"neutron/{target}.h5"
                 logpath = rootdir / f"neutron/logs/{target}.log"
                 self.append(
-                    HDF5Neutron(target, path, logpath, neutron, self.temperatures)
+                    HDF5Neutron(
+                        target, path, logpath, neutron, self.temperatures, cache_pendf
+                    )
                 )
 
     def update_temperatures(self, temperatures: Set[int]) -> None:
@@ -2,6 +2,7 @@
 from pathlib import Path
 from typing import Any, Dict, List
 
+from ndmanager.API.endf6_index import get_tape_header
 from ndmanager.API.process.hdf5_tsl import HDF5TSL
 from ndmanager.API.process.base_manager import BaseManager
 from ndmanager.API.process.input_parser import InputParser
@@ -9,7 +10,7 @@ from ndmanager.API.process.neutron_manager import NeutronManager
 from ndmanager.API.utils import get_endf6
 from ndmanager.data import TSL_NEUTRON
 from ndmanager.env import NDMANAGER_ENDF6
-from openmc.data import Evaluation, get_thermal_name
+from openmc.data import get_thermal_name
 
 
 def read_temperatures(from_yaml_node: int | str) -> List[int]:
@@ -104,5 +105,5 @@ class TSLManager(InputParser, BaseManager):
         Returns:
             str: The ZSYMAM value
         """
-        e = Evaluation(tape)
-        return get_thermal_name(e.target["zsymam"].strip())
+        zsymam = get_tape_header(tape)["zsymam"]
+        return get_thermal_name(zsymam.strip())
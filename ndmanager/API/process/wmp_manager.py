@@ -0,0 +1,65 @@
+"""A class for managing windowed multipole libraries generation"""
+from pathlib import Path
+from typing import Any, Dict
+
+from ndmanager.API.nuclide import Nuclide
+from ndmanager.API.process.base_manager import BaseManager
+from ndmanager.API.process.hdf5_wmp import HDF5WMP
+from ndmanager.API.process.neutron_manager import NeutronManager
+
+
+class WMPManager(BaseManager):
+    """A class for managing windowed multipole libraries generation"""
+
+    sublibrary: str = "WMP"
+    cross_section_node_type: str = "wmp"
+
+    def __init__(
+        self, wmpdict: Dict[str, Any], neutron_library: NeutronManager, rootdir: Path
+    ) -> None:
+        """Create a windowed multipole manager given an input wmp dictionnary,
+        a neutron manager and a path to a directory. Windowed multipole data is
+        generated from the tapes of the neutron manager.
+
+        Args:
+            wmpdict (Dict[str, Any]): A windowed multipole input dictionnary
+            neutron_library (NeutronManager): A neutron manager
+            rootdir (Path): A path to write the HDF5 files in
+
+        Raises:
+            KeyError: A nuclide is not processed by the neutron manager
+        """
+        self.sorting_key = lambda x: Nuclide.from_name(x.target).zam
+        self.reuse = {}
+        self.options = {}
+
+        if wmpdict is not None:
+            for key in ["vf_options", "wmp_options"]:
+                if key in wmpdict:
+                    self.options[key] = wmpdict[key]
+            if "nuclides" in wmpdict:
+                targets = wmpdict["nuclides"].split()
+            else:
+                targets = list(neutron_library.tapes)
+            ommit = set(wmpdict.get("ommit", "").split())
+
+            for target in targets:
+                if target in ommit:
+                    continue
+                if target not in neutron_library.tapes:
+                    raise KeyError(f"{target} is not in the neutron sublibrary")
+                neutron = neutron_library.tapes[target]
+                path = rootdir / f"wmp/{target}.h5"
+                logpath = rootdir / f"wmp/logs/{target}.log"
+                self.append(HDF5WMP(target, path, logpath, neutron, self.options))
+
+    def process(self, desc: str, j: int = 1, dryrun: bool = False):
+        """Generate the windowed multipole data, and forget the nuclides for
+        which no data could be generated.
+
+        Args:
+            desc (str): Description for the tqdm bar
+            j (int, optional): number of concurrent jobs to run. Defaults to 1.
+        """
+        super().process(desc, j, dryrun)
+        self[:] = [wmp for wmp in self if wmp.path.exists()]
@@ -0,0 +1,270 @@
+"""A registry of the OpenMC HDF5 libraries installed in the NDManager database"""
+
+import json
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import yaml
+
+from ndmanager.API.utils import get_temperatures
+from ndmanager.env import NDMANAGER_HDF5
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, Windows
+    fcntl = None
+
+REGISTRY_NAME = "registry.json"
+REGISTRY_VERSION = 2
+
+
+def registry_path() -> Path:
+    """Path to the registry file
+
+    Returns:
+        Path: The path to the registry file
+    """
+    return NDMANAGER_HDF5 / REGISTRY_NAME
+
+
+def read_registry() -> Dict[str, Any]:
+    """Read the registry file
+
+    Returns:
+        Dict[str, Any]: The registry, with the entries by library name under
+                        the "libraries" key, and a "complete" key telling
+                        whether every library was registered by a rescan.
+                        Empty if there is no valid registry.
+    """
+    try:
+        with open(registry_path(), "r", encoding="utf-8") as f:
+            registry = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if registry.get("version") != REGISTRY_VERSION:
+        return {}
+    return registry
+
+
+def load_registry() -> Dict[str, Dict[str, Any]] | None:
+    """Read the registry entries
+
+    Returns:
+        Dict[str, Dict[str, Any]] | None: The registry entries by library name,
+                                          None if there is no valid registry
+                                          or if it may be missing libraries
+                                          installed before it was created
+    """
+    registry = read_registry()
+    if not registry.get("complete", False):
+        return None
+    return registry["libraries"]
+
+
+def write_registry(libraries: Dict[str, Dict[str, Any]], complete: bool) -> None:
+    """Atomically write the registry file
+
+    Args:
+        libraries (Dict[str, Dict[str, Any]]): The registry entries by library name
+        complete (bool): Whether the registry holds every installed library
+    """
+    path = registry_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    registry = {
+        "version": REGISTRY_VERSION,
+        "complete": complete,
+        "libraries": dict(sorted(libraries.items())),
+    }
+    with open(tmppath, "w", encoding="utf-8") as f:
+        json.dump(registry, f, indent=1)
+    os.replace(tmppath, path)
+
+
+@contextmanager
+def registry_lock() -> Iterator[None]:
+    """Serialize the modifications of the registry by concurrent NDManager
+    processes with a file lock"""
+    path = registry_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(f".{path.stem}.lock"), "w", encoding="utf-8") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+@contextmanager
+def locked_registry() -> Iterator[Dict[str, Dict[str, Any]]]:
+    """Open the registry entries for modification. The entries are written
+    back when the context exits, see `registry_lock`.
+
+    Yields:
+        Dict[str, Dict[str, Any]]: The registry entries by library name
+    """
+    with registry_lock():
+        registry = read_registry()
+        libraries = registry.get("libraries", {})
+        yield libraries
+        write_registry(libraries, registry.get("complete", False))
+
+
+def directory_size(directory: Path) -> int:
+    """Compute the total size of the files in a directory tree
+
+    Args:
+        directory (Path): The directory
+
+    Returns:
+        int: The size in bytes
+    """
+    size = 0
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    size += entry.stat(follow_symlinks=False).st_size
+    return size
+
+
+def describe_library(name: str, status: str | None = None) -> Dict[str, Any]:
+    """Gather the metadata of an installed library
+
+    Args:
+        name (str): The name of the library
+        status (str | None, optional): The status of the library. Defaults to
+                                       None, in which case it is "complete" if
+                                       every file listed in the
+                                       cross_sections.xml file exists, and
+                                       "incomplete" otherwise.
+
+    Returns:
+        Dict[str, Any]: The metadata of the library
+    """
+    root = NDMANAGER_HDF5 / name
+    xspath = root / "cross_sections.xml"
+
+    summary = ""
+    if (root / "input.yml").exists():
+        with open(root / "input.yml", "r", encoding="utf-8") as f:
+            summary = (yaml.safe_load(f) or {}).get("summary", "")
+
+    nuclides: Dict[str, int] = {}
+    neutrons: List[Path] = []
+    missing = False
+    if xspath.exists():
+        for node in ET.parse(xspath).getroot().iter("library"):
+            kind = node.get("type")
+            nuclides[kind] = nuclides.get(kind, 0) + 1
+            path = root / node.get("path")
+            if not path.exists():
+                missing = True
+            elif kind == "neutron":
+                neutrons.append(path)
+    else:
+        missing = True
+
+    temperatures = set()
+    for path in neutrons:
+        temperatures |= get_temperatures(path)
+
+    if status is None:
+        status = "incomplete" if missing else "complete"
+    return {
+        "summary": summary,
+        "nuclides": nuclides,
+        "temperatures": sorted(temperatures),
+        "size": directory_size(root) if root.exists() else 0,
+        "status": status,
+    }
+
+
+def register_library(name: str, status: str | None = None) -> Dict[str, Any]:
+    """Add or update a library in the registry. Only the given library is
+    described: if there is no registry yet, the registry created holds this
+    library only, and is completed by a rescan on the next `ndo list`.
+
+    Args:
+        name (str): The name of the library
+        status (str | None, optional): The status of the library, see
+                                       `describe_library`. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The registry entry of the library
+    """
+    entry = describe_library(name, status)
+    with locked_registry() as libraries:
+        libraries[name] = entry
+    return entry
+
+
+def unregister_library(name: str) -> None:
+    """Remove a library from the registry
+
+    Args:
+        name (str): The name of the library
+    """
+    with locked_registry() as libraries:
+        libraries.pop(name, None)
+
+
+def find_libraries(root: Path, processes: int = 8) -> List[str]:
+    """Find the libraries in a directory tree, i.e. the directories that hold
+    a cross_sections.xml file. Directories are listed concurrently, and the
+    walk does not descend into libraries, which avoids listing the HDF5 files.
+
+    Args:
+        root (Path): The root of the tree
+        processes (int, optional): Number of concurent threads. Defaults to 8.
+
+    Returns:
+        List[str]: The names of the libraries, relative to the root
+    """
+
+    def visit(directory: str):
+        with os.scandir(directory) as it:
+            entries = list(it)
+        if any(e.name == "cross_sections.xml" and e.is_file() for e in entries):
+            return directory, []
+        subdirs = [
+            e.path
+            for e in entries
+            if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")
+        ]
+        return None, subdirs
+
+    libraries = []
+    if not root.exists():
+        return libraries
+    with ThreadPoolExecutor(processes) as executor:
+        pending = [executor.submit(visit, str(root))]
+        while pending:
+            library, subdirs = pending.pop().result()
+            if library is not None and library != str(root):
+                libraries.append(str(Path(library).relative_to(root)))
+            pending.extend(executor.submit(visit, d) for d in subdirs)
+    return sorted(libraries)
+
+
+def rescan(processes: int = 8) -> Dict[str, Dict[str, Any]]:
+    """Rebuild the registry by walking the NDManager HDF5 directory
+
+    Args:
+        processes (int, optional): Number of concurent threads. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The registry entries by library name
+    """
+    names = find_libraries(NDMANAGER_HDF5, processes)
+    with ThreadPoolExecutor(processes) as executor:
+        entries = executor.map(describe_library, names)
+        libraries = dict(zip(names, entries))
+    with registry_lock():
+        write_registry(libraries, complete=True)
+    return libraries
@@ -1,30 +1,13 @@
 """Some utility function to compute ENDF6 tape SHA1"""
 
-import hashlib
 from typing import Dict
 
+from ndmanager.API.hashing import compute_file_sha1
 from ndmanager.API.utils import get_endf6
 from ndmanager.data import TAPE_SHA1
 from ndmanager.env import NDMANAGER_ENDF6
 
 
-def compute_file_sha1(filename: str) -> str:
-    """Compute the SHA1 value of a file given its path.
-
-    Args:
-        Path to a file.
-    """
-    BUF_SIZE = 65536  # 64 kBi
-    sha1 = hashlib.sha1()
-    with open(filename, "rb") as f:
-        while True:
-            data = f.read(BUF_SIZE)
-            if not data:
-                break
-            sha1.update(data)
-    return sha1.hexdigest()
-
-
 def compute_tape_sha1(libname: str, sub: str, nuclide: str) -> Dict[str, str]:
     """Compute the SHA1 hash of a tape stored in the NDManager database
 
@@ -58,7 +41,7 @@ def compute_sublib_sha1(libname: str, sub: str) -> Dict[str, str]:
     """
     subdir = NDMANAGER_ENDF6 / libname / sub
     results = {}
-    for tape in subdir.iterdir():
+    for tape in subdir.glob("*.endf6"):
         results |= compute_tape_sha1(libname, sub, tape.stem)
     return results
 
@@ -0,0 +1,419 @@
+"""A content-addressed store of HDF5 files shared between libraries"""
+
+import json
+import os
+import shutil
+import stat
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Set
+
+from ndmanager.API.hashing import compute_file_sha1
+from ndmanager.env import NDMANAGER_HDF5
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, Windows
+    fcntl = None
+
+STORE_NAME = ".store"
+MANIFEST_NAME = "manifest.json"
+STORE_VERSION = 1
+
+
+def store_path() -> Path:
+    """Path to the root of the store
+
+    Returns:
+        Path: The path to the store
+    """
+    return NDMANAGER_HDF5 / STORE_NAME
+
+
+def blob_path(sha1: str) -> Path:
+    """Path to the blob of a given SHA1 in the store
+
+    Args:
+        sha1 (str): The SHA1 of the file
+
+    Returns:
+        Path: The path to the blob
+    """
+    return store_path() / "objects" / sha1[:2] / f"{sha1[2:]}.h5"
+
+
+def blob_sha1(path: str | Path) -> str | None:
+    """Get the SHA1 of a file from its path if it is a blob of the store. The
+    path may be relative to any directory.
+
+    Args:
+        path (str | Path): Path to a file
+
+    Returns:
+        str | None: The SHA1 of the blob, None if the file is not in the store
+    """
+    path = Path(path)
+    objects = path.parent.parent
+    if objects.name != "objects" or objects.parent.name != STORE_NAME:
+        return None
+    return path.parent.name + path.stem
+
+
+@contextmanager
+def locked_refs() -> Iterator[Dict[str, List[str]]]:
+    """Open the reference table of the store for modification. The table maps
+    the SHA1 of every blob to the libraries that use it, and is written back
+    when the context exits. Concurrent NDManager processes are serialized
+    with a file lock.
+
+    Yields:
+        Dict[str, List[str]]: The reference table
+    """
+    root = store_path()
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / "refs.json"
+    with open(root / ".lock", "w", encoding="utf-8") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                refs = json.load(f)["refs"]
+        else:
+            refs = {}
+        yield refs
+        tmppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmppath, "w", encoding="utf-8") as f:
+            content = {"version": STORE_VERSION, "refs": dict(sorted(refs.items()))}
+            json.dump(content, f, indent=1)
+        os.replace(tmppath, path)
+
+
+def _link(source: Path, target: Path) -> bool:
+    """Atomically replace a file by a hardlink to another file
+
+    Args:
+        source (Path): Path to the file to link to
+        target (Path): Path to the hardlink
+
+    Returns:
+        bool: Whether the hardlink was created, e.g. not across filesystems
+    """
+    tmppath = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        os.link(source, tmppath)
+    except OSError:
+        return False
+    os.replace(tmppath, target)
+    return True
+
+
+def _add_blob(path: Path, sha1: str) -> Path:
+    """Put a file in the store, unless an identical blob already exists. The
+    blob is a hardlink to the file where possible, the file itself is left in
+    place and unchanged. Otherwise, the file is copied to the store and the
+    copy is made read-only.
+
+    Args:
+        path (Path): Path to the file
+        sha1 (str): The SHA1 of the file
+
+    Returns:
+        Path: The path to the blob
+    """
+    blob = blob_path(sha1)
+    if blob.exists():
+        return blob
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    if not _link(path, blob):
+        tmppath = blob.with_name(f"{blob.name}.{os.getpid()}.tmp")
+        shutil.copy2(path, tmppath)
+        os.chmod(tmppath, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(tmppath, blob)
+    return blob
+
+
+def _share(path: Path, blob: Path) -> int:
+    """Replace a file of a library by a hardlink to an identical blob
+
+    Args:
+        path (Path): Path to the file
+        blob (Path): Path to the blob
+
+    Returns:
+        int: The number of bytes saved, zero if the file still shares its data
+             with another file
+    """
+    if os.path.samefile(path, blob):
+        return 0
+    info = path.stat()
+    if not _link(blob, path):
+        return 0
+    return info.st_size if info.st_nlink == 1 else 0
+
+
+def _library_nodes(xspath: Path) -> tuple[ET.ElementTree, List[ET.Element], Path]:
+    """Parse a cross_sections.xml file
+
+    Args:
+        xspath (Path): Path to the cross_sections.xml file
+
+    Returns:
+        tuple[ET.ElementTree, List[ET.Element], Path]: The tree, its library
+                                                       nodes and the directory
+                                                       their paths are relative to
+    """
+    tree = ET.parse(xspath)
+    root = tree.getroot()
+    directory = xspath.parent
+    directorynode = root.find("directory")
+    if directorynode is not None:
+        directory = directory / directorynode.text
+        root.remove(directorynode)
+    return tree, root.findall("library"), directory
+
+
+def read_manifest(name: str) -> Dict[str, str]:
+    """Read the manifest of a library, mapping the original paths of its files
+    to their SHA1
+
+    Args:
+        name (str): The name of the library
+
+    Returns:
+        Dict[str, str]: The manifest, empty if the library is not in the store
+    """
+    path = NDMANAGER_HDF5 / name / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["files"]
+
+
+def add_library(name: str) -> int:
+    """Add the HDF5 files of a library to the store, where identical files are
+    only stored once. Files of the library stay at their path, as hardlinks
+    to the blobs, and files identical to a blob already in the store are
+    replaced by a hardlink to it. Files of other libraries, e.g. through the
+    `reuse` keyword, are added to the store and left in place, and the
+    library points to their blobs instead. Paths are written relative to the
+    library directory. The operation is idempotent and can be used on copies
+    of libraries that are already in the store.
+
+    Args:
+        name (str): The name of the library
+
+    Returns:
+        int: The number of bytes saved
+    """
+    libdir = (NDMANAGER_HDF5 / name).absolute()
+    xspath = libdir / "cross_sections.xml"
+    tree, nodes, directory = _library_nodes(xspath)
+    manifest = read_manifest(name)
+
+    saved = 0
+    with locked_refs() as refs:
+        for node in nodes:
+            path = (directory / node.get("path")).absolute()
+            sha1 = blob_sha1(path)
+            if sha1 is None:
+                relpath = os.path.relpath(path, libdir)
+                inlibrary = not relpath.startswith("..")
+                key = relpath if inlibrary else str(path)
+                sha1 = manifest.get(key)
+                blob = None if sha1 is None else blob_path(sha1)
+                # Files already linked to their blob are not hashed again
+                if (
+                    blob is None
+                    or not blob.exists()
+                    or not os.path.samefile(path, blob)
+                ):
+                    sha1 = compute_file_sha1(path)
+                blob = _add_blob(path, sha1)
+                manifest[key] = sha1
+                if inlibrary:
+                    saved += _share(path, blob)
+                else:
+                    path = blob.absolute()
+            elif sha1 not in manifest.values():
+                manifest[str(path)] = sha1
+            node.set("path", os.path.relpath(path, libdir))
+            if name not in refs.setdefault(sha1, []):
+                refs[sha1].append(name)
+
+        ET.indent(tree)
+        tree.write(xspath, encoding="utf-8", xml_declaration=True)
+        with open(libdir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump({"version": STORE_VERSION, "files": manifest}, f, indent=1)
+    return saved
+
+
+def library_blobs(name: str) -> Set[str]:
+    """List the blobs of the store that a library uses, either through a path
+    to the blob or through a file of the library that the manifest maps to it
+
+    Args:
+        name (str): The name of the library
+
+    Returns:
+        Set[str]: The SHA1 of the blobs, empty if the library does not exist
+    """
+    libdir = (NDMANAGER_HDF5 / name).absolute()
+    xspath = libdir / "cross_sections.xml"
+    if not xspath.exists():
+        return set()
+    manifest = read_manifest(name)
+    _, nodes, directory = _library_nodes(xspath)
+    blobs = set()
+    for node in nodes:
+        path = (directory / node.get("path")).absolute()
+        sha1 = blob_sha1(path) or manifest.get(os.path.relpath(path, libdir))
+        if sha1 is not None:
+            blobs.add(sha1)
+    return blobs
+
+
+def track_library(name: str) -> None:
+    """Make the references of a library to the blobs of the store match its
+    cross_sections.xml file. Libraries that are not in the store may still
+    point to blobs, e.g. through the `reuse` keyword, and the blobs must be
+    kept until these libraries are removed. The paths to the blobs are
+    rewritten relative to the library directory.
+
+    Args:
+        name (str): The name of the library
+    """
+    blobs = library_blobs(name)
+    if not blobs and not store_path().exists():
+        return
+    if blobs:
+        libdir = (NDMANAGER_HDF5 / name).absolute()
+        xspath = libdir / "cross_sections.xml"
+        tree, nodes, directory = _library_nodes(xspath)
+        for node in nodes:
+            path = (directory / node.get("path")).absolute()
+            node.set("path", os.path.relpath(path, libdir))
+        ET.indent(tree)
+        tree.write(xspath, encoding="utf-8", xml_declaration=True)
+    with locked_refs() as refs:
+        for sha1 in list(refs):
+            if name in refs[sha1] and sha1 not in blobs:
+                refs[sha1].remove(name)
+                if not refs[sha1]:
+                    del refs[sha1]
+        for sha1 in blobs:
+            if name not in refs.setdefault(sha1, []):
+                refs[sha1].append(name)
+
+
+def _delete_blob(sha1: str) -> int:
+    """Delete a blob of the store
+
+    Args:
+        sha1 (str): The SHA1 of the blob
+
+    Returns:
+        int: The number of bytes freed, zero if a library still links to the
+             data of the blob
+    """
+    blob = blob_path(sha1)
+    if not blob.exists():
+        return 0
+    info = blob.stat()
+    blob.unlink()
+    return info.st_size if info.st_nlink == 1 else 0
+
+
+def release_library(name: str) -> int:
+    """Drop the references of a library to the blobs of the store, and
+    delete the blobs that are no longer referenced.
+
+    Args:
+        name (str): The name of the library
+
+    Returns:
+        int: The number of bytes freed
+    """
+    freed = 0
+    if not store_path().exists():
+        return freed
+    with locked_refs() as refs:
+        for sha1 in list(refs):
+            if name in refs[sha1]:
+                refs[sha1].remove(name)
+            if not refs[sha1]:
+                del refs[sha1]
+                freed += _delete_blob(sha1)
+    return freed
+
+
+def restore_library(name: str) -> None:
+    """Give a library private copies of its files, so that they can be
+    modified, and release its references to the store. Files of the library
+    linked to blobs are copied in place. Files that were used from another
+    library are pointed to again if they still exist, and copied in the
+    library directory otherwise.
+
+    Args:
+        name (str): The name of the library
+    """
+    libdir = (NDMANAGER_HDF5 / name).absolute()
+    manifest = read_manifest(name)
+    original = {sha1: path for path, sha1 in manifest.items()}
+
+    xspath = libdir / "cross_sections.xml"
+    tree, nodes, directory = _library_nodes(xspath)
+    for node in nodes:
+        path = (directory / node.get("path")).absolute()
+        sha1 = blob_sha1(path)
+        if sha1 is None:
+            relpath = os.path.relpath(path, libdir)
+            if relpath in manifest and path.exists() and path.stat().st_nlink > 1:
+                tmppath = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                shutil.copyfile(path, tmppath)
+                os.replace(tmppath, path)
+            node.set("path", relpath)
+            continue
+        relpath = original.get(sha1)
+        if relpath is not None and Path(relpath).is_absolute():
+            if Path(relpath).exists() and blob_sha1(relpath) is None:
+                node.set("path", relpath)
+                continue
+            relpath = None
+        if relpath is None:
+            relpath = f"{node.get('type')}/{node.get('materials').split()[0]}.h5"
+        target = libdir / relpath
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, target)
+        node.set("path", relpath)
+
+    ET.indent(tree)
+    tree.write(xspath, encoding="utf-8", xml_declaration=True)
+    (libdir / MANIFEST_NAME).unlink(missing_ok=True)
+    release_library(name)
+
+
+def prune_store() -> int:
+    """Drop the references of libraries that no longer point to a blob, e.g.
+    removed by hand, and delete the blobs that are not referenced by any
+    library.
+
+    Returns:
+        int: The number of bytes freed
+    """
+    freed = 0
+    objects = store_path() / "objects"
+    if not objects.exists():
+        return freed
+    with locked_refs() as refs:
+        names = {name for names in refs.values() for name in names}
+        blobs = {name: library_blobs(name) for name in names}
+        for sha1 in list(refs):
+            refs[sha1] = [name for name in refs[sha1] if sha1 in blobs[name]]
+            if not refs[sha1]:
+                del refs[sha1]
+        for blob in objects.glob("*/*.h5"):
+            sha1 = blob_sha1(blob)
+            if sha1 not in refs:
+                freed += _delete_blob(sha1)
+    return freed
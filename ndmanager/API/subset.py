@@ -0,0 +1,207 @@
+"""Derive small libraries holding only the data needed by a model"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, Iterable, Set, Tuple
+
+import h5py
+
+from ndmanager.API.cow import cow_copy
+from ndmanager.API.nuclide import Nuclide
+from ndmanager.API.utils import TEMPERATURE_NODE, get_temperatures
+from ndmanager.env import NDMANAGER_HDF5
+
+
+def read_materials(path: str | Path) -> Tuple[Set[str], Set[str], Set[float]]:
+    """Read the nuclides, thermal scattering data and temperatures used in an
+    OpenMC materials.xml file
+
+    Args:
+        path (str | Path): Path to the materials.xml file
+
+    Returns:
+        Tuple[Set[str], Set[str], Set[float]]: The names of the nuclides, the
+                                               names of the thermal scattering
+                                               tables and the temperatures of
+                                               the materials
+    """
+    root = ET.parse(path).getroot()
+    nuclides, thermals, temperatures = set(), set(), set()
+    for material in root.iter("material"):
+        nuclides |= {node.get("name") for node in material.iter("nuclide")}
+        thermals |= {node.get("name") for node in material.iter("sab")}
+        if material.get("temperature") is not None:
+            temperatures.add(float(material.get("temperature")))
+    return nuclides, thermals, temperatures
+
+
+def select_temperatures(
+    available: Iterable[int], tmin: float | None = None, tmax: float | None = None
+) -> Set[int]:
+    """Select the temperatures of a data file needed to cover a temperature
+    range: the temperatures inside the range, and the closest temperatures
+    below and above the range when its bounds are not available, so that
+    OpenMC can interpolate between them.
+
+    Args:
+        available (Iterable[int]): The temperatures of the data file
+        tmin (float | None, optional): The lower bound of the range. Defaults
+                                       to None, i.e. no lower bound.
+        tmax (float | None, optional): The upper bound of the range. Defaults
+                                       to None, i.e. no upper bound.
+
+    Returns:
+        Set[int]: The selected temperatures
+    """
+    available = sorted(available)
+    tmin = available[0] if tmin is None else tmin
+    tmax = available[-1] if tmax is None else tmax
+    selected = {t for t in available if tmin <= t <= tmax}
+    below = [t for t in available if t < tmin]
+    above = [t for t in available if t > tmax]
+    if below and tmin not in available:
+        selected.add(below[-1])
+    if above and tmax not in available:
+        selected.add(above[0])
+    return selected
+
+
+def _copy_temperatures(source: h5py.Group, target: h5py.Group, keep: Set[int]) -> None:
+    """Copy the content of a group, except for the temperature-dependent nodes
+    of unwanted temperatures. 0K nodes are always copied.
+
+    Args:
+        source (h5py.Group): The source group
+        target (h5py.Group): The target group
+        keep (Set[int]): The temperatures to copy
+    """
+    for key, value in source.attrs.items():
+        target.attrs[key] = value
+    for name, child in source.items():
+        match = TEMPERATURE_NODE.match(name)
+        if match is not None and int(match.group(1)) not in keep | {0}:
+            continue
+        if isinstance(child, h5py.Group):
+            _copy_temperatures(child, target.create_group(name), keep)
+        else:
+            source.copy(child, target, name=name)
+
+
+def prune_temperatures(
+    source: str | Path, target: str | Path, tmin: float | None, tmax: float | None
+) -> Set[int]:
+    """Write a copy of an OpenMC HDF5 neutron or thermal scattering data file
+    with only the temperatures needed to cover a temperature range, see
+    `select_temperatures`. If every temperature is needed, the copy shares the
+    data of the original file if possible.
+
+    Args:
+        source (str | Path): Path to the data file
+        target (str | Path): Path to the copy
+        tmin (float | None): The lower bound of the range
+        tmax (float | None): The upper bound of the range
+
+    Returns:
+        Set[int]: The temperatures of the copy
+    """
+    available = get_temperatures(source)
+    keep = select_temperatures(available, tmin, tmax)
+    if keep == available:
+        cow_copy(source, target)
+        return keep
+    with h5py.File(source, "r") as f, h5py.File(target, "w") as g:
+        _copy_temperatures(f, g, keep)
+    return keep
+
+
+def subset_library(
+    source: str,
+    target: str,
+    nuclides: Iterable[str],
+    thermals: Iterable[str] = (),
+    tmin: float | None = None,
+    tmax: float | None = None,
+) -> Dict[str, Any]:
+    """Create a library holding a subset of the data of another library: the
+    neutron and windowed multipole data of some nuclides, the photon data of
+    their elements, and some thermal scattering data. Temperatures outside of
+    a temperature range are pruned, and untouched files share their data with
+    the original library if possible.
+
+    Args:
+        source (str): The name of the original library
+        target (str): The name of the new library
+        nuclides (Iterable[str]): The names of the nuclides
+        thermals (Iterable[str], optional): The names of the thermal scattering
+                                            tables. Defaults to ().
+        tmin (float | None, optional): The lower bound of the temperature range.
+                                       Defaults to None.
+        tmax (float | None, optional): The upper bound of the temperature range.
+                                       Defaults to None.
+
+    Raises:
+        ValueError: The source library does not exist
+        ValueError: The target library already exists
+        KeyError: Some nuclides or thermal scattering tables are not in the
+                  source library
+
+    Returns:
+        Dict[str, Any]: A dictionnary mapping the materials of the new
+                        library to their temperatures, None for photon data
+    """
+    sourcedir = NDMANAGER_HDF5 / source
+    targetdir = NDMANAGER_HDF5 / target
+    if not (sourcedir / "cross_sections.xml").exists():
+        raise ValueError(f"{source} is not in the library list.")
+    if targetdir.exists():
+        raise ValueError(f"{target} is already in the library list.")
+
+    nuclides, thermals = set(nuclides), set(thermals)
+    elements = set()
+    for nuclide in nuclides:
+        try:
+            elements.add(Nuclide.from_name(nuclide).element)
+        except KeyError:
+            pass
+    wanted = {"neutron": nuclides, "wmp": nuclides, "thermal": thermals, "photon": elements}
+
+    tree = ET.parse(sourcedir / "cross_sections.xml")
+    root = tree.getroot()
+    directory = sourcedir
+    directorynode = root.find("directory")
+    if directorynode is not None:
+        directory = sourcedir / directorynode.text
+        root.remove(directorynode)
+
+    selected = []
+    for node in root.findall("library"):
+        materials = node.get("materials").split()
+        if wanted.get(node.get("type"), set()) & set(materials):
+            selected.append(node)
+        else:
+            root.remove(node)
+    available = {m for node in selected for m in node.get("materials").split()}
+    missing = (nuclides | thermals) - available
+    if missing:
+        raise KeyError(f"{' '.join(sorted(missing))} not available in {source}")
+
+    content = {}
+    for node in selected:
+        kind = node.get("type")
+        materials = node.get("materials").split()
+        relpath = f"{kind}/{materials[0]}.h5"
+        (targetdir / kind).mkdir(parents=True, exist_ok=True)
+        if kind in ["neutron", "thermal"]:
+            temperatures = prune_temperatures(
+                directory / node.get("path"), targetdir / relpath, tmin, tmax
+            )
+        else:
+            cow_copy(directory / node.get("path"), targetdir / relpath)
+            temperatures = None
+        node.set("path", relpath)
+        for material in materials:
+            content[material] = temperatures
+
+    ET.indent(tree)
+    tree.write(targetdir / "cross_sections.xml", encoding="utf-8", xml_declaration=True)
+    return content
@@ -0,0 +1,211 @@
+"""Thinning of the energy grids of OpenMC HDF5 neutron data files"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import h5py
+import numpy as np
+
+REACTION_NODE = re.compile(r"^reaction_\d+$")
+
+
+def _segment_errors(
+    energy: np.ndarray,
+    values: List[Tuple[int, np.ndarray]],
+    lo: np.ndarray,
+    hi: np.ndarray,
+    rtol: float,
+    atol: float,
+) -> np.ndarray:
+    """Compute the interpolation error over disjoint segments of an energy grid,
+    for a set of cross sections defined on the grid. The error of a point is
+    its distance to the linear interpolation between the ends of its segment,
+    relative to the tolerance at that point.
+
+    Args:
+        energy (np.ndarray): The energy grid
+        values (List[Tuple[int, np.ndarray]]): The threshold index and values
+                                               of each cross section
+        lo (np.ndarray): The index of the first point of each segment
+        hi (np.ndarray): The index of the last point of each segment
+        rtol (float): The relative tolerance
+        atol (float): The absolute tolerance
+
+    Returns:
+        np.ndarray: The largest error of the points inside each segment, a
+                    value larger than 1 means the tolerance is not met
+    """
+    n = hi - lo - 1
+    if n.sum() == 0:
+        return np.zeros(len(lo))
+    segment = np.repeat(np.arange(len(lo)), n)
+    m = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n) + lo[segment] + 1
+    a, b = lo[segment], hi[segment]
+    t = (energy[m] - energy[a]) / (energy[b] - energy[a])
+
+    error = np.zeros(len(m))
+    for threshold, xs in values:
+        # Segments below the threshold hold no value of this cross section
+        inside = a >= threshold
+        i = np.flatnonzero(inside)
+        ya, yb, ym = xs[a[i] - threshold], xs[b[i] - threshold], xs[m[i] - threshold]
+        interp = ya + (yb - ya) * t[i]
+        error[i] = np.maximum(error[i], np.abs(interp - ym) / (rtol * np.abs(ym) + atol))
+
+    starts = np.concatenate(([0], np.cumsum(n)[:-1]))
+    result = np.zeros(len(lo))
+    nonempty = n > 0
+    result[nonempty] = np.maximum.reduceat(error, starts[nonempty])
+    return result
+
+
+def thin_grid(
+    energy: np.ndarray,
+    values: List[Tuple[int, np.ndarray]],
+    rtol: float = 1e-3,
+    atol: float = 1e-10,
+) -> np.ndarray:
+    """Select a subset of an energy grid on which the linear interpolation of
+    every cross section reproduces its values on the full grid within
+    tolerance. The first and last points, the thresholds of the cross sections
+    and discontinuities are kept. Points are removed in passes over the grid:
+    every other removable point is proposed for removal, and removals are
+    accepted if no point of the full grid between the neighbours of the
+    removed point exceeds the tolerance. Passes go on until no point can be
+    removed.
+
+    Args:
+        energy (np.ndarray): The energy grid
+        values (List[Tuple[int, np.ndarray]]): The threshold index and values
+                                               of each cross section, values
+                                               start at the threshold index
+        rtol (float, optional): The relative tolerance. Defaults to 1e-3.
+        atol (float, optional): The absolute tolerance in barns. Defaults to 1e-10.
+
+    Returns:
+        np.ndarray: The indices of the points of the thinned grid
+    """
+    n = len(energy)
+    protected = np.zeros(n, dtype=bool)
+    protected[[0, -1]] = True
+    for threshold, _ in values:
+        protected[threshold] = True
+    duplicate = np.flatnonzero(energy[1:] == energy[:-1])
+    protected[duplicate] = True
+    protected[duplicate + 1] = True
+
+    kept = np.arange(n)
+    parity, idle = 1, 0
+    while idle < 2 and len(kept) > 2:
+        j = np.arange(1, len(kept) - 1)
+        candidates = j[(j % 2 == parity) & ~protected[kept[j]]]
+        errors = _segment_errors(
+            energy, values, kept[candidates - 1], kept[candidates + 1], rtol, atol
+        )
+        removed = candidates[errors <= 1]
+        kept = np.delete(kept, removed)
+        idle = 0 if len(removed) else idle + 1
+        parity = 1 - parity
+    return kept
+
+
+def max_relative_error(
+    energy: np.ndarray, values: List[Tuple[int, np.ndarray]], kept: np.ndarray
+) -> float:
+    """Compute the largest relative error of the cross sections interpolated
+    on a thinned grid, with respect to their values on the full grid
+
+    Args:
+        energy (np.ndarray): The full energy grid
+        values (List[Tuple[int, np.ndarray]]): The threshold index and values
+                                               of each cross section
+        kept (np.ndarray): The indices of the points of the thinned grid
+
+    Returns:
+        float: The largest relative error
+    """
+    error = 0.0
+    for threshold, xs in values:
+        sub = kept[kept >= threshold]
+        interp = np.interp(energy[threshold:], energy[sub], xs[sub - threshold])
+        nonzero = xs != 0
+        if nonzero.any():
+            relative = np.abs(interp[nonzero] - xs[nonzero]) / np.abs(xs[nonzero])
+            error = max(error, float(relative.max()))
+    return error
+
+
+def _copy_group(
+    source: h5py.Group, target: h5py.Group, replace: Dict[str, Tuple[np.ndarray, Dict]]
+) -> None:
+    """Copy the content of a group, replacing some datasets
+
+    Args:
+        source (h5py.Group): The source group
+        target (h5py.Group): The target group
+        replace (Dict[str, Tuple[np.ndarray, Dict]]): The new data and attributes
+                                                      of the datasets to replace,
+                                                      by absolute path
+    """
+    for key, value in source.attrs.items():
+        target.attrs[key] = value
+    for name, child in source.items():
+        if isinstance(child, h5py.Group):
+            _copy_group(child, target.create_group(name), replace)
+        elif child.name in replace:
+            data, attrs = replace[child.name]
+            dataset = target.create_dataset(name, data=data)
+            for key, value in attrs.items():
+                dataset.attrs[key] = value
+        else:
+            source.copy(child, target, name=name)
+
+
+def thin_file(
+    source: str | Path, target: str | Path, rtol: float = 1e-3, atol: float = 1e-10
+) -> Dict[str, Any]:
+    """Write a copy of an OpenMC HDF5 neutron data file where the energy grid of
+    every temperature is thinned, see `thin_grid`. The cross sections of all
+    reactions are restricted to the thinned grid consistently.
+
+    Args:
+        source (str | Path): Path to the HDF5 file
+        target (str | Path): Path to the thinned HDF5 file
+        rtol (float, optional): The relative tolerance. Defaults to 1e-3.
+        atol (float, optional): The absolute tolerance in barns. Defaults to 1e-10.
+
+    Returns:
+        Dict[str, Any]: The name of the nuclide, the number of points of the
+                        energy grids before and after thinning, summed over
+                        temperatures, and the largest relative error
+    """
+    replace = {}
+    report = {"nuclide": None, "points": 0, "thinned": 0, "error": 0.0}
+    with h5py.File(source, "r") as f:
+        group = list(f.values())[0]
+        report["nuclide"] = group.name[1:]
+        for temperature in group["kTs"]:
+            energy = group[f"energy/{temperature}"][...]
+            datasets = []
+            for name, reaction in group["reactions"].items():
+                if REACTION_NODE.match(name) and f"{temperature}/xs" in reaction:
+                    datasets.append(reaction[f"{temperature}/xs"])
+            values = [
+                (int(d.attrs.get("threshold_idx", 0)), d[...]) for d in datasets
+            ]
+            kept = thin_grid(energy, values, rtol, atol)
+
+            replace[group[f"energy/{temperature}"].name] = (energy[kept], {})
+            for dataset, (threshold, xs) in zip(datasets, values):
+                attrs = dict(dataset.attrs)
+                attrs["threshold_idx"] = int(np.searchsorted(kept, threshold))
+                replace[dataset.name] = (xs[kept[kept >= threshold] - threshold], attrs)
+
+            report["points"] += len(energy)
+            report["thinned"] += len(kept)
+            report["error"] = max(report["error"], max_relative_error(energy, values, kept))
+
+        with h5py.File(target, "w") as g:
+            _copy_group(f, g, replace)
+    return report
@@ -1,8 +1,13 @@
 """Some utility functions"""
 
-from typing import Dict
+import re
+from pathlib import Path
+from typing import Dict, Iterator, Set, Tuple
+
 import h5py
 
+from ndmanager.API.cow import break_link
+from ndmanager.API.endf6_index import list_indexed_tapes
 from ndmanager.API.nuclide import Nuclide
 from ndmanager.env import NDMANAGER_ENDF6
 
@@ -52,8 +57,7 @@ def list_endf6(sublibrary: str, params: Dict[str, str]):
     ommit = params.get("ommit", "").split()
     add = params.get("add", {})
 
-    base_paths = (NDMANAGER_ENDF6 / base / sublibrary).glob("*.endf6")
-    base_dict = {Nuclide.from_file(p).name: p for p in base_paths}
+    base_dict = list_indexed_tapes(NDMANAGER_ENDF6 / base / sublibrary)
 
     # Remove unwanted evaluations
     for nuclide in ommit:
@@ -80,38 +84,116 @@ def list_endf6(sublibrary: str, params: Dict[str, str]):
 
     return base_dict
 
-def merge_neutron_file(sourcepath, targetpath):
-    """Merge two nuclear data file containing data for the same nuclide at
-    different temperatures.
+
+TEMPERATURE_NODE = re.compile(r"^(\d+)K$")
+
+
+def get_temperatures(path: str | Path) -> Set[int]:
+    """Read the temperatures available in an OpenMC HDF5 data file without
+    loading the data itself.
 
     Args:
-        sourcepath: Path to the source data file. This file will not be modified
-        targetpath: Path to the target data file. This file will be modified
+        path (str | Path): Path to an OpenMC HDF5 neutron or TSL data file
+
+    Returns:
+        Set[int]: The set of temperatures in Kelvin
     """
-    source = h5py.File(sourcepath, "r")
-    target = h5py.File(targetpath, "a")
+    with h5py.File(path, "r") as f:
+        group = list(f.values())[0]
+        return {int(t[:-1]) for t in group["kTs"]}
 
-    assert len(source.keys()) == 1
-    assert len(target.keys()) == 1
-    nuclide = list(source.keys())[0]
-    assert list(source.keys())[0] == nuclide
 
-    s_temperatures = source[f"{nuclide}/energy"].keys()
-    s_temperatures = {int(t[:-1]) for t in s_temperatures}
-    t_temperatures = target[f"{nuclide}/energy"].keys()
-    t_temperatures = {int(t[:-1]) for t in t_temperatures}
+def iter_temperature_nodes(group: h5py.Group) -> Iterator[Tuple[str, Set[int]]]:
+    """Walk an HDF5 group and yield every node that holds temperature-dependent
+    children, i.e. children named `<T>K` such as `energy/294K`, `kTs/294K`,
+    `reactions/reaction_002/294K` or `urr/294K`.
+
+    Args:
+        group (h5py.Group): The group to walk, usually the nuclide group
+
+    Yields:
+        Tuple[str, Set[int]]: The path of the node relative to `group` and the
+                              temperatures found under it
+    """
+    stack = [""]
+    while stack:
+        path = stack.pop()
+        node = group[path] if path else group
+        temperatures = set()
+        for name, child in node.items():
+            match = TEMPERATURE_NODE.match(name)
+            if match is not None:
+                temperatures.add(int(match.group(1)))
+            elif isinstance(child, h5py.Group):
+                stack.append(f"{path}/{name}" if path else name)
+        if temperatures:
+            yield path, temperatures
+
+
+def merge_neutron_file(sourcepath: str | Path, targetpath: str | Path) -> Set[int]:
+    """Merge two nuclear data file containing data for the same nuclide at
+    different temperatures. Every temperature-dependent node of the source file
+    is carried over, so that the result is identical to a file processed with
+    all temperatures at once. The 0K nodes, such as `energy/0K` and
+    `reactions/reaction_002/0K`, are not listed in `kTs` and are carried over
+    when the target file lacks them.
 
-    new_temperatures = s_temperatures - t_temperatures
+    Args:
+        sourcepath: Path to the source data file. This file will not be modified
+        targetpath: Path to the target data file. This file will be modified
 
-    for t in new_temperatures:
-        source.copy(source[f"{nuclide}/energy/{t}K"], target[f"{nuclide}/energy/"])
-        source.copy(source[f"{nuclide}/kTs/{t}K"], target[f"{nuclide}/kTs/"])
+    Raises:
+        ValueError: The files do not contain exactly one and the same nuclide
 
-        for reaction in source[f"{nuclide}/reactions"]:
-            source.copy(
-                source[f"{nuclide}/reactions/{reaction}/{t}K"],
-                target[f"{nuclide}/reactions/{reaction}/"],
+    Returns:
+        Set[int]: The temperatures added to the target file
+    """
+    break_link(targetpath)
+    with h5py.File(sourcepath, "r") as source, h5py.File(targetpath, "a") as target:
+        if len(source.keys()) != 1 or list(source.keys()) != list(target.keys()):
+            raise ValueError(
+                f"{sourcepath} and {targetpath} must contain the same single nuclide"
             )
+        nuclide = list(source.keys())[0]
+        sgroup = source[nuclide]
+        tgroup = target[nuclide]
+
+        s_temperatures = {int(t[:-1]) for t in sgroup["kTs"]}
+        t_temperatures = {int(t[:-1]) for t in tgroup["kTs"]}
+        new_temperatures = s_temperatures - t_temperatures
+
+        for path, temperatures in iter_temperature_nodes(sgroup):
+            to_copy = temperatures & new_temperatures
+            if 0 in temperatures and (f"{path}/0K" if path else "0K") not in tgroup:
+                to_copy.add(0)
+            if not to_copy:
+                continue
+            destination = _require_group(sgroup, tgroup, path)
+            for t in to_copy:
+                node = f"{path}/{t}K" if path else f"{t}K"
+                source.copy(sgroup[node], destination, name=f"{t}K")
+    return new_temperatures
+
+
+def _require_group(source: h5py.Group, target: h5py.Group, path: str) -> h5py.Group:
+    """Get a group in the target file, creating the missing levels with the
+    attributes they have in the source file.
+
+    Args:
+        source (h5py.Group): The source nuclide group
+        target (h5py.Group): The target nuclide group
+        path (str): Path of the group relative to the nuclide groups
 
-        if "urr" in source:
-            source.copy(source[f"{nuclide}/urr/{t}K"], target[f"{nuclide}/urr/"])
\ No newline at end of file
+    Returns:
+        h5py.Group: The target group
+    """
+    group = target
+    current = ""
+    for name in filter(None, path.split("/")):
+        current = f"{current}/{name}" if current else name
+        if name not in group:
+            group.create_group(name)
+            for key, value in source[current].attrs.items():
+                group[name].attrs[key] = value
+        group = group[name]
+    return group
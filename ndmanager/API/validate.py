@@ -0,0 +1,250 @@
+"""Consistency checks of OpenMC HDF5 libraries"""
+
+import re
+import xml.etree.ElementTree as ET
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+import h5py
+import numpy as np
+
+REACTION_NODE = re.compile(r"^reaction_(\d+)$")
+
+# Redundant reactions and the reactions they are the sum of
+SUM_RULES = {
+    1: [2, 3],
+    # Same rules as OpenMC: the capture reactions listed in MT101 are not
+    # repeated in MT3, which includes them through MT27
+    3: [4, 5, 11, 16, 17, 22, 23, 24, 25, 27, 28, 29, 30, *range(32, 38)]
+    + [41, 42, 44, 45, 152, 153, 154, 156, *range(157, 182), *range(183, 191)]
+    + [194, 195, 196, 198, 199, 200],
+    4: list(range(50, 92)),
+    16: list(range(875, 892)),
+    18: [19, 20, 21, 38],
+    27: [18, 101],
+    101: [*range(102, 110), *range(111, 118), 155, 182, 191, 192, 193, 197],
+    103: list(range(600, 650)),
+    104: list(range(650, 700)),
+    105: list(range(700, 750)),
+    106: list(range(750, 800)),
+    107: list(range(800, 850)),
+}
+
+
+def _components(mt: int, present: Set[int]) -> List[int]:
+    """List the reactions of a file that a redundant reaction is the sum of,
+    expanding the components that are themselves absent but redundant
+
+    Args:
+        mt (int): The MT number of the redundant reaction
+        present (Set[int]): The MT numbers of the reactions of the file
+
+    Returns:
+        List[int]: The MT numbers of the components
+    """
+    components = []
+    for component in SUM_RULES.get(mt, []):
+        if component in present:
+            components.append(component)
+        elif component in SUM_RULES:
+            components += _components(component, present)
+    return components
+
+
+def _failure(check: str, temperature: str | None, detail: str) -> Dict[str, Any]:
+    """Describe a failed check
+
+    Args:
+        check (str): The name of the check
+        temperature (str | None): The temperature node the check failed for
+        detail (str): A description of the failure
+
+    Returns:
+        Dict[str, Any]: The failure description
+    """
+    return {"check": check, "temperature": temperature, "detail": detail}
+
+
+def check_finite(path: str | Path) -> List[Dict[str, Any]]:
+    """Check that the floating point datasets of an HDF5 file hold no NaN or
+    infinite values
+
+    Args:
+        path (str | Path): Path to the HDF5 file
+
+    Returns:
+        List[Dict[str, Any]]: The failures
+    """
+    failures = []
+
+    def visit(name, node):
+        if isinstance(node, h5py.Dataset) and np.issubdtype(node.dtype, np.floating):
+            data = node[()]
+            if not np.all(np.isfinite(data)):
+                failures.append(_failure("finite", None, f"{name} holds NaN or Inf values"))
+
+    with h5py.File(path, "r") as f:
+        f.visititems(visit)
+    return failures
+
+
+def check_neutron(
+    path: str | Path, rtol: float = 1e-3, atol: float = 1e-8
+) -> List[Dict[str, Any]]:
+    """Check the consistency of an OpenMC HDF5 neutron data file, for every
+    temperature: the energy grid must be positive and sorted, and redundant
+    cross sections must be equal to the sum of their components within
+    tolerance.
+
+    Args:
+        path (str | Path): Path to the HDF5 file
+        rtol (float, optional): The relative tolerance on sums. Defaults to 1e-3.
+        atol (float, optional): The absolute tolerance on sums in barns.
+                                Defaults to 1e-8.
+
+    Returns:
+        List[Dict[str, Any]]: The failures
+    """
+    failures = []
+    with h5py.File(path, "r") as f:
+        group = list(f.values())[0]
+        reactions = {}
+        for name, reaction in group["reactions"].items():
+            match = REACTION_NODE.match(name)
+            if match is not None:
+                reactions[int(match.group(1))] = reaction
+        redundant = [
+            mt
+            for mt, r in reactions.items()
+            if r.attrs.get("redundant", 0) and mt in SUM_RULES
+        ]
+
+        for temperature in group["energy"]:
+            energy = group[f"energy/{temperature}"][...]
+            if np.any(energy <= 0) or np.any(np.diff(energy) < 0):
+                failures.append(
+                    _failure("grid", temperature, "Energy grid is not positive and sorted")
+                )
+                continue
+
+            def full(mt):
+                dataset = reactions[mt][f"{temperature}/xs"]
+                xs = np.zeros(len(energy))
+                xs[int(dataset.attrs.get("threshold_idx", 0)) :] = dataset[...]
+                return xs
+
+            present = {mt for mt, r in reactions.items() if f"{temperature}/xs" in r}
+            for mt in redundant:
+                components = _components(mt, present - {mt})
+                if mt not in present or not components:
+                    continue
+                expected = np.sum([full(c) for c in components], axis=0)
+                actual = full(mt)
+                error = np.abs(actual - expected) - rtol * np.abs(actual) - atol
+                if np.any(error > 0):
+                    i = int(np.argmax(error))
+                    failures.append(
+                        _failure(
+                            "sum",
+                            temperature,
+                            f"MT={mt} differs from the sum of MT={components} at "
+                            f"{energy[i]:.6e} eV: {actual[i]:.6e} != {expected[i]:.6e}",
+                        )
+                    )
+    return failures
+
+
+def validate_file(
+    args: Tuple[str, str, Path], rtol: float = 1e-3, atol: float = 1e-8
+) -> Dict[str, Any]:
+    """Run the file checks relevant to a data file of a library
+
+    Args:
+        args (Tuple[str, str, Path]): The material name, the data type and the
+                                      path to the file
+        rtol (float, optional): The relative tolerance on sums. Defaults to 1e-3.
+        atol (float, optional): The absolute tolerance on sums in barns.
+                                Defaults to 1e-8.
+
+    Returns:
+        Dict[str, Any]: The material, data type and path of the file, its
+                        temperatures and nuclides for neutron and thermal
+                        scattering data, and the failures
+    """
+    material, kind, path = args
+    report = {"material": material, "type": kind, "path": str(path)}
+    try:
+        report["failures"] = check_finite(path)
+        if kind in ["neutron", "thermal"]:
+            with h5py.File(path, "r") as f:
+                group = list(f.values())[0]
+                report["temperatures"] = sorted(int(t[:-1]) for t in group["kTs"])
+                if kind == "thermal":
+                    nuclides = group.attrs.get("nuclides", [])
+                    report["nuclides"] = [np.bytes_(n).decode() for n in nuclides]
+        if kind == "neutron":
+            report["failures"] += check_neutron(path, rtol, atol)
+    except (OSError, KeyError) as e:
+        report["failures"] = [_failure("read", None, str(e))]
+    return report
+
+
+def check_library(reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run the checks that involve several files of a library: all neutron
+    data files must have the same temperatures, and the nuclides of thermal
+    scattering data must have neutron data.
+
+    Args:
+        reports (List[Dict[str, Any]]): The reports of the files, see `validate_file`
+
+    Returns:
+        List[Dict[str, Any]]: The failures, with the material they concern
+    """
+    failures = []
+    neutrons = [r for r in reports if r["type"] == "neutron" and "temperatures" in r]
+    counts = Counter(tuple(r["temperatures"]) for r in neutrons)
+    if len(counts) > 1:
+        reference = counts.most_common(1)[0][0]
+        for r in neutrons:
+            if tuple(r["temperatures"]) != reference:
+                failure = _failure(
+                    "temperatures",
+                    None,
+                    f"Temperatures {r['temperatures']} differ from {list(reference)}",
+                )
+                failures.append({"material": r["material"], **failure})
+
+    materials = {r["material"] for r in neutrons}
+    for r in reports:
+        if r["type"] != "thermal":
+            continue
+        for nuclide in r.get("nuclides", []):
+            if nuclide not in materials:
+                failure = _failure(
+                    "pairing", None, f"No neutron data for {nuclide} in the library"
+                )
+                failures.append({"material": r["material"], **failure})
+    return failures
+
+
+def list_library_files(xspath: str | Path) -> List[Tuple[str, str, Path]]:
+    """List the data files of a library
+
+    Args:
+        xspath (str | Path): Path to the cross_sections.xml file
+
+    Returns:
+        List[Tuple[str, str, Path]]: The material name, the data type and the
+                                     path of each file
+    """
+    xspath = Path(xspath)
+    root = ET.parse(xspath).getroot()
+    directory = xspath.parent
+    directorynode = root.find("directory")
+    if directorynode is not None:
+        directory = directory / directorynode.text
+    return [
+        (node.get("materials"), node.get("type"), directory / node.get("path"))
+        for node in root.findall("library")
+    ]
@@ -1,212 +0,0 @@
-branching_ratios = {
-    "pwr": {
-        "(n,gamma)": {
-            "Na23": {"Na24": 0.232, "Na24_m1": 0.768},
-            "Cl37": {"Cl38": 0.8809, "Cl38_m1": 0.1191},
-            "Sc45": {"Sc46": 0.556, "Sc46_m1": 0.444},
-            "Co59": {"Co60": 0.444, "Co60_m1": 0.556},
-            "Ge72": {"Ge73": 0.5012, "Ge73_m1": 0.4988},
-            "Ge74": {"Ge75": 0.666, "Ge75_m1": 0.334},
-            "Ge76": {"Ge77": 0.4005, "Ge77_m1": 0.5995},
-            "Se76": {"Se77": 0.7409, "Se77_m1": 0.2591},
-            "Se78": {"Se79": 0.1178, "Se79_m1": 0.8822},
-            "Se80": {"Se81": 0.8454, "Se81_m1": 0.1546},
-            "Se82": {"Se83": 0.1402, "Se83_m1": 0.8598},
-            "Br79": {"Br80": 0.7687, "Br80_m1": 0.2313},
-            "Br81": {"Br82": 0.0914, "Br82_m1": 0.9086},
-            "Kr78": {"Kr79": 0.9704, "Kr79_m1": 0.0296},
-            "Kr80": {"Kr81": 0.6031, "Kr81_m1": 0.3969},
-            "Kr82": {"Kr83": 0.333, "Kr83_m1": 0.667},
-            "Kr84": {"Kr85": 0.1839, "Kr85_m1": 0.8161},
-            "Rb85": {"Rb86": 0.8791, "Rb86_m1": 0.1209},
-            "Sr84": {"Sr85": 0.253, "Sr85_m1": 0.747},
-            "Sr86": {"Sr87": 0.1988, "Sr87_m1": 0.8012},
-            "Y89": {"Y90": 0.9979, "Y90_m1": 0.0021},
-            "Y90": {"Y91": 0.7496, "Y91_m1": 0.2504},
-            "Nb93": {"Nb94": 0.3101, "Nb94_m1": 0.6899},
-            "Nb94": {"Nb95": 0.961, "Nb95_m1": 0.039},
-            "Mo92": {"Mo93": 0.9978, "Mo93_m1": 0.0022},
-            "Rh103": {"Rh104": 0.924, "Rh104_m1": 0.076},
-            "Rh105": {"Rh106": 0.904, "Rh106_m1": 0.096},
-            "Pd106": {"Pd107": 0.9527, "Pd107_m1": 0.0473},
-            "Pd108": {"Pd109": 0.9779, "Pd109_m1": 0.0221},
-            "Pd110": {"Pd111": 0.85, "Pd111_m1": 0.15},
-            "Ag107": {"Ag108": 0.9898, "Ag108_m1": 0.0102},
-            "Ag109": {"Ag110": 0.954, "Ag110_m1": 0.046},
-            "Cd110": {"Cd111": 0.9945, "Cd111_m1": 0.0055},
-            "Cd112": {"Cd113": 0.8685, "Cd113_m1": 0.1315},
-            "Cd114": {"Cd115": 0.8812, "Cd115_m1": 0.1188},
-            "Cd116": {"Cd117": 0.666, "Cd117_m1": 0.334},
-            "In113": {"In114": 0.4191, "In114_m1": 0.5809},
-            "Sn112": {"Sn113": 0.7253, "Sn113_m1": 0.2747},
-            "Sn116": {"Sn117": 0.9568, "Sn117_m1": 0.0432},
-            "Sn118": {"Sn119": 0.9794, "Sn119_m1": 0.0206},
-            "Sn120": {"Sn121": 0.9875, "Sn121_m1": 0.0125},
-            "Sn122": {"Sn123": 0.0112, "Sn123_m1": 0.9888},
-            "Sn124": {"Sn125": 0.0375, "Sn125_m1": 0.9625},
-            "Sn126": {"Sn127": 0.3018, "Sn127_m1": 0.6982},
-            "Sb121": {"Sb122": 0.9369, "Sb122_m1": 0.0631},
-            "Te120": {"Te121": 0.8871, "Te121_m1": 0.1129},
-            "Te122": {"Te123": 0.6448, "Te123_m1": 0.3552},
-            "Te124": {"Te125": 0.9912, "Te125_m1": 0.0088},
-            "Te126": {"Te127": 0.8689, "Te127_m1": 0.1311},
-            "Te128": {"Te129": 0.9245, "Te129_m1": 0.0755},
-            "Te130": {"Te131": 0.8559, "Te131_m1": 0.1441},
-            "Te132": {"Te133": 0.8517, "Te133_m1": 0.1483},
-            "I129": {"I130": 0.413, "I130_m1": 0.587},
-            "I131": {"I132": 0.9839, "I132_m1": 0.0161},
-            "Xe124": {"Xe125": 0.83, "Xe125_m1": 0.17},
-            "Xe126": {"Xe127": 0.8691, "Xe127_m1": 0.1309},
-            "Xe128": {"Xe129": 0.8923, "Xe129_m1": 0.1077},
-            "Xe130": {"Xe131": 0.9164, "Xe131_m1": 0.0836},
-            "Xe132": {"Xe133": 0.8867, "Xe133_m1": 0.1133},
-            "Xe133": {"Xe134": 0.96, "Xe134_m1": 0.04},
-            "Xe134": {"Xe135": 0.9853, "Xe135_m1": 0.0147},
-            "Cs133": {"Cs134": 0.907, "Cs134_m1": 0.093},
-            "Cs134": {"Cs135": 0.996, "Cs135_m1": 0.004},
-            "Cs135": {"Cs136": 0.984, "Cs136_m1": 0.016},
-            "Cs137": {"Cs138": 0.9021, "Cs138_m1": 0.0979},
-            "Ba130": {"Ba131": 0.8871, "Ba131_m1": 0.1129},
-            "Ba132": {"Ba133": 0.9175, "Ba133_m1": 0.0825},
-            "Ba134": {"Ba135": 0.9263, "Ba135_m1": 0.0737},
-            "Ba135": {"Ba136": 0.9978, "Ba136_m1": 0.0022},
-            "Ba136": {"Ba137": 0.9731, "Ba137_m1": 0.0269},
-            "Ce136": {"Ce137": 0.8662, "Ce137_m1": 0.1338},
-            "Ce138": {"Ce139": 0.9787, "Ce139_m1": 0.0213},
-            "Pr141": {"Pr142": 0.6519, "Pr142_m1": 0.3481},
-            "Pr143": {"Pr144": 0.31, "Pr144_m1": 0.69},
-            "Pm147": {"Pm148": 0.533, "Pm148_m1": 0.467},
-            "Eu153": {"Eu154": 0.984, "Eu154_m1": 0.016},
-            "Dy164": {"Dy165": 0.37, "Dy165_m1": 0.63},
-            "Ho165": {"Ho166": 0.949, "Ho166_m1": 0.051},
-            "Er166": {"Er167": 0.2503, "Er167_m1": 0.7497},
-            "Lu175": {"Lu176": 0.3331, "Lu176_m1": 0.6669},
-            "Lu176": {"Lu177": 0.999, "Lu177_m1": 0.001},
-            "Hf179": {"Hf180": 0.991, "Hf180_m1": 0.009},
-            "W182": {"W183": 0.8699, "W183_m1": 0.1301},
-            "W184": {"W185": 0.9983, "W185_m1": 0.0017},
-            "Re185": {"Re186": 0.999, "Re186_m1": 0.001},
-            "Re187": {"Re188": 0.9729, "Re188_m1": 0.0271},
-            "Au197": {"Au198": 0.999, "Au198_m1": 0.001},
-            "Hg196": {"Hg197": 0.966, "Hg197_m1": 0.034},
-            "Hg198": {"Hg199": 0.9918, "Hg199_m1": 0.0082},
-            "Pb206": {"Pb207": 0.9783, "Pb207_m1": 0.0217},
-            "Bi209": {"Bi210": 0.6791, "Bi210_m1": 0.3209},
-            "Pa233": {"Pa234": 0.4871, "Pa234_m1": 0.5129},
-            "U234": {"U235": 0.5, "U235_m1": 0.5},
-            "Np235": {"Np236": 0.4, "Np236_m1": 0.6},
-            "Np239": {"Np240": 0.3573, "Np240_m1": 0.6427},
-            "Pu236": {"Pu237": 0.5001, "Pu237_m1": 0.4999},
-            "Am241": {"Am242": 0.919, "Am242_m1": 0.081},
-            "Am243": {"Am244": 0.0626, "Am244_m1": 0.9374},
-            "Bk247": {"Bk248": 0.4, "Bk248_m1": 0.6},
-            "Es253": {"Es254": 0.032, "Es254_m1": 0.968},
-            "Es255": {"Es256": 0.984, "Es256_m1": 0.016},
-        }
-    },
-    "sfr": {
-        "(n,gamma)": {
-            "Na23": {"Na24": 0.2322804, "Na24_m1": 0.7677196},
-            "Cl37": {"Cl38": 0.879945, "Cl38_m1": 0.120055},
-            "Sc45": {"Sc46": 0.5562131, "Sc46_m1": 0.4437869},
-            "Co59": {"Co60": 0.4440172, "Co60_m1": 0.5559828},
-            "Ge72": {"Ge73": 0.5016774, "Ge73_m1": 0.4983226},
-            "Ge74": {"Ge75": 0.6659399, "Ge75_m1": 0.3340601},
-            "Ge76": {"Ge77": 0.4004585, "Ge77_m1": 0.5995415},
-            "Se76": {"Se77": 0.7404387, "Se77_m1": 0.2595613},
-            "Se78": {"Se79": 0.1174581, "Se79_m1": 0.8825419},
-            "Se80": {"Se81": 0.8467427, "Se81_m1": 0.1532573},
-            "Se82": {"Se83": 0.1344763, "Se83_m1": 0.8655237},
-            "Br79": {"Br80": 0.7680622, "Br80_m1": 0.2319378},
-            "Br81": {"Br82": 0.09144152, "Br82_m1": 0.9085585},
-            "Kr78": {"Kr79": 0.9707075, "Kr79_m1": 0.02929246},
-            "Kr80": {"Kr81": 0.60369, "Kr81_m1": 0.39631},
-            "Kr82": {"Kr83": 0.3337274, "Kr83_m1": 0.6662726},
-            "Kr84": {"Kr85": 0.1834211, "Kr85_m1": 0.8165789},
-            "Rb85": {"Rb86": 0.8795385, "Rb86_m1": 0.1204615},
-            "Sr84": {"Sr85": 0.2515508, "Sr85_m1": 0.7484492},
-            "Sr86": {"Sr87": 0.1989285, "Sr87_m1": 0.8010715},
-            "Y89": {"Y90": 0.9892179, "Y90_m1": 0.01078209},
-            "Y90": {"Y91": 0.7493423, "Y91_m1": 0.2506577},
-            "Nb93": {"Nb94": 0.3100506, "Nb94_m1": 0.6899494},
-            "Nb94": {"Nb95": 0.9607838, "Nb95_m1": 0.03921617},
-            "Mo92": {"Mo93": 0.9979834, "Mo93_m1": 0.002016573},
-            "Rh103": {"Rh104": 0.9231517, "Rh104_m1": 0.07684833},
-            "Rh105": {"Rh106": 0.9034308, "Rh106_m1": 0.09656922},
-            "Pd106": {"Pd107": 0.9545036, "Pd107_m1": 0.04549644},
-            "Pd108": {"Pd109": 0.9773971, "Pd109_m1": 0.02260288},
-            "Pd110": {"Pd111": 0.851039, "Pd111_m1": 0.148961},
-            "Ag107": {"Ag108": 0.9885965, "Ag108_m1": 0.01140347},
-            "Ag109": {"Ag110": 0.9533051, "Ag110_m1": 0.04669492},
-            "Cd110": {"Cd111": 0.9935882, "Cd111_m1": 0.006411822},
-            "Cd112": {"Cd113": 0.8687045, "Cd113_m1": 0.1312955},
-            "Cd114": {"Cd115": 0.8813488, "Cd115_m1": 0.1186512},
-            "Cd116": {"Cd117": 0.6664465, "Cd117_m1": 0.3335535},
-            "In113": {"In114": 0.4194048, "In114_m1": 0.5805952},
-            "Sn112": {"Sn113": 0.7253126, "Sn113_m1": 0.2746874},
-            "Sn116": {"Sn117": 0.9572524, "Sn117_m1": 0.04274758},
-            "Sn118": {"Sn119": 0.9800847, "Sn119_m1": 0.01991529},
-            "Sn120": {"Sn121": 0.9904803, "Sn121_m1": 0.00951972},
-            "Sn122": {"Sn123": 0.01013734, "Sn123_m1": 0.9898627},
-            "Sn124": {"Sn125": 0.03840493, "Sn125_m1": 0.9615951},
-            "Sn126": {"Sn127": 0.3020345, "Sn127_m1": 0.6979655},
-            "Sb121": {"Sb122": 0.9363269, "Sb122_m1": 0.06367311},
-            "Te120": {"Te121": 0.8877869, "Te121_m1": 0.1122131},
-            "Te122": {"Te123": 0.6447302, "Te123_m1": 0.3552698},
-            "Te124": {"Te125": 0.9911435, "Te125_m1": 0.008856455},
-            "Te126": {"Te127": 0.8687548, "Te127_m1": 0.1312452},
-            "Te128": {"Te129": 0.9246087, "Te129_m1": 0.07539129},
-            "Te130": {"Te131": 0.8557132, "Te131_m1": 0.1442868},
-            "Te132": {"Te133": 0.8691182, "Te133_m1": 0.1308818},
-            "I129": {"I130": 0.4132203, "I130_m1": 0.5867797},
-            "I131": {"I132": 0.983837, "I132_m1": 0.01616301},
-            "Xe124": {"Xe125": 0.8284029, "Xe125_m1": 0.1715971},
-            "Xe126": {"Xe127": 0.8652369, "Xe127_m1": 0.1347631},
-            "Xe128": {"Xe129": 0.8911829, "Xe129_m1": 0.1088171},
-            "Xe130": {"Xe131": 0.915879, "Xe131_m1": 0.08412101},
-            "Xe132": {"Xe133": 0.888214, "Xe133_m1": 0.111786},
-            "Xe133": {"Xe134": 0.9597055, "Xe134_m1": 0.04029453},
-            "Xe134": {"Xe135": 0.9857912, "Xe135_m1": 0.01420878},
-            "Cs133": {"Cs134": 0.9069577, "Cs134_m1": 0.09304226},
-            "Cs134": {"Cs135": 0.9959592, "Cs135_m1": 0.004040841},
-            "Cs135": {"Cs136": 0.9838413, "Cs136_m1": 0.01615873},
-            "Cs137": {"Cs138": 0.9029225, "Cs138_m1": 0.09707749},
-            "Ba130": {"Ba131": 0.8856946, "Ba131_m1": 0.1143054},
-            "Ba132": {"Ba133": 0.9181743, "Ba133_m1": 0.08182574},
-            "Ba134": {"Ba135": 0.9257324, "Ba135_m1": 0.07426764},
-            "Ba135": {"Ba136": 0.997195, "Ba136_m1": 0.002804998},
-            "Ba136": {"Ba137": 0.9754134, "Ba137_m1": 0.02458658},
-            "Ce136": {"Ce137": 0.8658352, "Ce137_m1": 0.1341648},
-            "Ce138": {"Ce139": 0.9804987, "Ce139_m1": 0.0195013},
-            "Pr141": {"Pr142": 0.6518099, "Pr142_m1": 0.3481901},
-            "Pr143": {"Pr144": 0.3100245, "Pr144_m1": 0.6899755},
-            "Pm147": {"Pm148": 0.5332397, "Pm148_m1": 0.4667603},
-            "Eu153": {"Eu154": 0.9838411, "Eu154_m1": 0.01615894},
-            "Dy164": {"Dy165": 0.3707271, "Dy165_m1": 0.6292729},
-            "Ho165": {"Ho166": 0.948784, "Ho166_m1": 0.05121603},
-            "Er166": {"Er167": 0.2508895, "Er167_m1": 0.7491105},
-            "Lu175": {"Lu176": 0.3337858, "Lu176_m1": 0.6662142},
-            "Lu176": {"Lu177": 0.9989865, "Lu177_m1": 0.001013494},
-            "Hf179": {"Hf180": 0.9907573, "Hf180_m1": 0.009242668},
-            "W182": {"W183": 0.8422296, "W183_m1": 0.1577704},
-            "W184": {"W185": 0.8825411, "W185_m1": 0.1174589},
-            "Re185": {"Re186": 0.998352, "Re186_m1": 0.001648036},
-            "Re187": {"Re188": 0.972502, "Re188_m1": 0.02749798},
-            "Au197": {"Au198": 0.998996, "Au198_m1": 0.001004047},
-            "Hg196": {"Hg197": 0.9658785, "Hg197_m1": 0.03412148},
-            "Hg198": {"Hg199": 0.9914029, "Hg199_m1": 0.008597123},
-            "Pb206": {"Pb207": 0.9787865, "Pb207_m1": 0.02121347},
-            "Bi209": {"Bi210": 0.6766195, "Bi210_m1": 0.3233805},
-            "Pa233": {"Pa234": 0.4880139, "Pa234_m1": 0.5119861},
-            "U234": {"U235": 0.5005599, "U235_m1": 0.4994401},
-            "Np235": {"Np236": 0.4005079, "Np236_m1": 0.5994921},
-            "Np239": {"Np240": 0.3733749, "Np240_m1": 0.6266251},
-            "Pu236": {"Pu237": 0.50091, "Pu237_m1": 0.49909},
-            "Am241": {"Am242": 0.8676948, "Am242_m1": 0.1323052},
-            "Am243": {"Am244": 0.08091221, "Am244_m1": 0.9190878},
-            "Bk247": {"Bk248": 0.4005492, "Bk248_m1": 0.5994508},
-            "Es253": {"Es254": 0.0320329, "Es254_m1": 0.9679671},
-            "Es255": {"Es256": 0.9838167, "Es256_m1": 0.01618327},
-        }
-    },
-}
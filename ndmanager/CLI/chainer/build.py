@@ -7,9 +7,14 @@ from contextlib import chdir
 import openmc.deplete
 import yaml
 
+from ndmanager.API.branching_ratios import (
+    apply_branching_ratios,
+    load_branching_ratios,
+)
+from ndmanager.API.chain import chain_from_endf
+from ndmanager.API.chain_graph import ChainGraph
 from ndmanager.API.utils import list_endf6
-from ndmanager.CLI.chainer.branching_ratios import branching_ratios
-from ndmanager.data import NDMANAGER_CHAINS
+from ndmanager.env import NDMANAGER_CHAINS
 
 
 def build_parser(subparsers: ap._SubParsersAction):
@@ -26,6 +31,10 @@ def build_parser(subparsers: ap._SubParsersAction):
         type=str,
         help="The name of the YAML file describing the target depletion chain",
     )
+    parser.add_argument("-j", type=int, default=1, help="Number of concurent processes")
+    parser.add_argument(
+        "--nocache", help="Do not use the cache of parsed tapes", action="store_true"
+    )
     parser.set_defaults(func=build)
 
 
@@ -53,20 +62,19 @@ def build(args: ap.Namespace):
         nfpy = list(list_endf6("nfpy", inputs["nfpy"]).values())
 
         reactions = list(openmc.deplete.chain.REACTIONS.keys())
-        chain = openmc.deplete.Chain.from_endf(decay, nfpy, n, reactions)
-        if hl > 0.0:
-            tokeep = [
-                nuc.name
-                for nuc in chain.nuclides
-                if nuc.half_life is None or nuc.half_life > hl
-            ]
-            chain = chain.reduce(tokeep)
+        chain = chain_from_endf(
+            decay, nfpy, n, reactions, args.j, cache=not args.nocache
+        )
+        if hl > 0.0 or "initial" in inputs:
+            graph = ChainGraph.from_chain(chain)
+            tokeep = graph.half_life_mask(max(hl, 0.0))
+            if "initial" in inputs:
+                level = inputs.get("level", None)
+                tokeep &= graph.reachable(inputs["initial"].split(), level)
+            chain = graph.reduce(chain, tokeep)
 
         if "branching_ratios" in inputs:
-            ratios = branching_ratios[inputs["branching_ratios"]]
-            for reaction, br in ratios.items():
-                chain.set_branch_ratios(
-                    branch_ratios=br, reaction=reaction, strict=False
-                )
+            ratios = load_branching_ratios(inputs["branching_ratios"])
+            apply_branching_ratios(chain, ratios)
 
     chain.export_to_xml(target)
@@ -1,13 +1,10 @@
 """Definition and parser for the `ndc install` command"""
 
 import argparse as ap
-import tempfile
-from contextlib import chdir
 
-import requests
-from tqdm import tqdm
-
-from ndmanager.data import NDMANAGER_CHAINS, OPENMC_CHAINS
+from ndmanager.API.download import download_all
+from ndmanager.data import OPENMC_CHAINS
+from ndmanager.env import NDMANAGER_CHAINS
 
 
 def install_parser(subparsers):
@@ -24,6 +21,7 @@ def install_parser(subparsers):
         action="extend",
         nargs="+",
     )
+    parser.add_argument("-j", type=int, default=4, help="Number of concurent downloads")
     parser.set_defaults(func=install)
 
 
@@ -39,28 +37,9 @@ def install(args: ap.Namespace):
     for chain in args.chain:
         if chain not in OPENMC_CHAINS:
             raise KeyError(f"{chain} chain is not available for installation")
+    files = []
     for chain in args.chain:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with chdir(tmpdir):
-                url = OPENMC_CHAINS[chain]["url"]
-                total = int(OPENMC_CHAINS[chain]["size"])
-                r = requests.get(url, timeout=3600, stream=True)
-
-                library, name = chain.split("/")
-                p = NDMANAGER_CHAINS / library
-                p.mkdir(exist_ok=True, parents=True)
-
-                bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
-                pbar = tqdm(
-                    desc=f"Downloading {chain:<15}",
-                    total=total,
-                    unit="iB",
-                    unit_scale=True,
-                    unit_divisor=1024,
-                    bar_format=bar_format,
-                )
-                with open(p / f"{name}.xml", "wb") as f:
-                    for data in r.iter_content(chunk_size=1024):
-                        size = f.write(data)
-                        pbar.update(size)
-                pbar.close()
+        library, name = chain.split("/")
+        target = NDMANAGER_CHAINS / library / f"{name}.xml"
+        files.append((OPENMC_CHAINS[chain]["url"], target, f"Downloading {chain:<15}"))
+    download_all(files, args.j)
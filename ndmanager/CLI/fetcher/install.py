@@ -7,6 +7,7 @@ from typing import List
 
 import requests
 
+from ndmanager.API.endf6_index import update_index
 from ndmanager.API.iaea import IAEA
 from ndmanager.data import SUBLIBRARIES_SHORTLIST
 from ndmanager.env import NDMANAGER_ENDF6
@@ -29,7 +30,8 @@ class NdfInstallCommand:
         self.sublibraries = self.get_sublibrary_list()
         self.download()
         self.download_errata()
-        
+        self.build_indices(args.libraries)
+
     def get_sublibrary_list(self) -> List[str]:
         if self.args.sub is not None:
             return self.args.sub
@@ -52,6 +54,16 @@ class NdfInstallCommand:
                 else:
                     sublibdata.download(targetdir, style="nuclide", processes=self.args.j)
 
+    def build_indices(self, libraries: List[str]) -> None:
+        """Build the header index of the installed sublibraries"""
+        for library in libraries:
+            libdir = NDMANAGER_ENDF6 / library
+            if not libdir.exists():
+                continue
+            for sublibdir in libdir.iterdir():
+                if sublibdir.is_dir():
+                    update_index(sublibdir, full=True)
+
     def download_foo(self):
         """Download a minimal library for testing purposes"""
         target = NDMANAGER_ENDF6 / "foo"
@@ -0,0 +1,80 @@
+"""Definition and parser for the `ndo broaden` command"""
+
+import argparse as ap
+import xml.etree.ElementTree as ET
+from functools import partial
+
+from tqdm import tqdm
+
+from ndmanager.API.broaden import broaden_file
+from ndmanager.API.pool import imap
+from ndmanager.API.registry import register_library
+from ndmanager.API.store import MANIFEST_NAME, restore_library
+from ndmanager.env import NDMANAGER_HDF5
+
+
+def broaden_parser(subparsers):
+    """Add the parser for the 'ndo broaden' command to a subparser object
+
+    Args:
+        subparsers (argparse._SubParsersAction): An argparse subparser object
+    """
+    parser = subparsers.add_parser(
+        "broaden",
+        help="Add temperatures to an OpenMC library by Doppler broadening its cross sections",
+    )
+    parser.add_argument("library", type=str, help="Name of the library")
+    parser.add_argument(
+        "--temperatures",
+        "-T",
+        help="The temperatures to add",
+        nargs="+",
+        type=int,
+        required=True,
+    )
+    parser.add_argument(
+        "--emax",
+        type=float,
+        default=float("inf"),
+        help="Only broaden cross sections below this energy in eV",
+    )
+    parser.add_argument("-j", type=int, default=1, help="Number of concurent processes")
+    parser.set_defaults(func=broaden)
+
+
+def broaden(args: ap.Namespace):
+    """Add temperatures to the neutron data of a library, broadening the cross
+    sections from the lowest temperature of each file instead of running NJOY
+
+    Args:
+        args (ap.Namespace): The argparse object containing the command line argument
+
+    Raises:
+        ValueError: The library does not exist
+    """
+    root = NDMANAGER_HDF5 / args.library
+    xspath = root / "cross_sections.xml"
+    if not xspath.exists():
+        raise ValueError(f"{args.library} is not in the library list.")
+    if (root / MANIFEST_NAME).exists():
+        # Files of the store are shared with other libraries
+        restore_library(args.library)
+
+    xml = ET.parse(xspath).getroot()
+    directory = root
+    directorynode = xml.find("directory")
+    if directorynode is not None:
+        directory = root / directorynode.text
+    paths = [
+        directory / node.get("path")
+        for node in xml.findall("library")
+        if node.get("type") == "neutron"
+    ]
+
+    func = partial(broaden_file, temperatures=args.temperatures, emax=args.emax)
+    bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
+    pbar = tqdm(total=len(paths), bar_format=bar_format, desc="Broadening")
+    for _ in imap(func, paths, args.j, unordered=True):
+        pbar.update()
+    pbar.close()
+    register_library(args.library)
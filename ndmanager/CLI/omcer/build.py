@@ -6,6 +6,13 @@ import shutil
 import yaml
 
 from ndmanager.API.process import NDMLibrary
+from ndmanager.API.registry import register_library
+from ndmanager.API.store import (
+    MANIFEST_NAME,
+    add_library,
+    restore_library,
+    track_library,
+)
 from ndmanager import __version__
 
 
@@ -36,6 +43,11 @@ def build_parser(subparsers):
                         type=int,
                         default=None)
     parser.add_argument("-j", type=int, default=1, help="Number of concurent processes")
+    parser.add_argument(
+        "--dedup",
+        help="Share identical HDF5 files with the other libraries",
+        action="store_true",
+    )
     parser.set_defaults(func=build)
 
 
@@ -63,5 +75,15 @@ def build(args: ap.Namespace):
     if args.temperatures is not None:
         lib.neutron.update_temperatures(set(args.temperatures))
         print(f"Custom temperatures: {args.temperatures}")
+    if not args.dryrun:
+        if (lib.root / MANIFEST_NAME).exists():
+            restore_library(lib.name)
+        register_library(lib.name, status="building")
     lib.process(args.j, args.dryrun, args.clean)
     shutil.copy(args.filename, lib.root / "input.yml")
+    if not args.dryrun:
+        if args.dedup:
+            add_library(lib.name)
+        else:
+            track_library(lib.name)
+        register_library(lib.name)
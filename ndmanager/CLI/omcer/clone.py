@@ -3,6 +3,9 @@
 import argparse as ap
 import shutil
 
+from ndmanager.API.cow import cow_copytree
+from ndmanager.API.registry import register_library
+from ndmanager.API.store import MANIFEST_NAME, add_library, track_library
 from ndmanager.env import NDMANAGER_HDF5
 
 
@@ -23,6 +26,11 @@ def clone_parser(subparsers):
         type=str,
         help="Name for the new cloned library",
     )
+    parser.add_argument(
+        "--cow",
+        help="Share the HDF5 files with the original library until they are modified",
+        action="store_true",
+    )
     parser.set_defaults(func=clone)
 
 
@@ -42,4 +50,12 @@ def clone(args: ap.Namespace):
         raise ValueError(f"{args.source} is not in the library list.")
     if target.exists():
         raise ValueError(f"{args.target} is already in the library list.")
-    shutil.copytree(source, target)
+    if args.cow:
+        cow_copytree(source, target)
+    else:
+        shutil.copytree(source, target)
+    if (target / MANIFEST_NAME).exists():
+        add_library(args.target)
+    else:
+        track_library(args.target)
+    register_library(args.target)
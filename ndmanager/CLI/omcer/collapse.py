@@ -0,0 +1,127 @@
+"""Definition and parser for the `ndo collapse` command"""
+
+import argparse as ap
+import xml.etree.ElementTree as ET
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import openmc
+import openmc.mgxs
+from tqdm import tqdm
+
+from ndmanager.API.collapse import collapse_file, load_spectrum
+from ndmanager.API.pool import imap
+from ndmanager.env import NDMANAGER_HDF5
+
+
+def collapse_parser(subparsers):
+    """Add the parser for the 'ndo collapse' command to a subparser object
+
+    Args:
+        subparsers (argparse._SubParsersAction): An argparse subparser object
+    """
+    parser = subparsers.add_parser(
+        "collapse",
+        help="Create an OpenMC multigroup library from an OpenMC library",
+    )
+    parser.add_argument("library", type=str, help="Name of the library")
+    parser.add_argument("target", type=str, help="Path to the multigroup HDF5 file")
+    parser.add_argument(
+        "--groups",
+        "-g",
+        type=str,
+        required=True,
+        help="Name of an OpenMC group structure, or path to a text file of group boundaries in eV",
+    )
+    parser.add_argument(
+        "--spectrum",
+        "-s",
+        type=str,
+        default="1/E",
+        help="The weighting spectrum: 'flat', '1/E' or path to a two columns text file of energies in eV and flux values",
+    )
+    parser.add_argument(
+        "--nuclides",
+        nargs="+",
+        type=str,
+        help="The nuclides to collapse, all neutron data of the library by default",
+    )
+    parser.add_argument(
+        "--temperatures",
+        "-T",
+        nargs="+",
+        type=int,
+        help="The temperatures to collapse, all temperatures by default",
+    )
+    parser.add_argument("-j", type=int, default=1, help="Number of concurent processes")
+    parser.set_defaults(func=collapse)
+
+
+def collapse(args: ap.Namespace):
+    """Collapse the neutron data of a library to a multigroup structure and
+    write it as an OpenMC MGXS library
+
+    Args:
+        args (ap.Namespace): The argparse object containing the command line argument
+
+    Raises:
+        ValueError: The library does not exist
+        KeyError: Some nuclides are not in the library
+    """
+    root = NDMANAGER_HDF5 / args.library
+    xspath = root / "cross_sections.xml"
+    if not xspath.exists():
+        raise ValueError(f"{args.library} is not in the library list.")
+
+    if args.groups in openmc.mgxs.GROUP_STRUCTURES:
+        groups = np.asarray(openmc.mgxs.GROUP_STRUCTURES[args.groups], dtype=float)
+    else:
+        groups = np.sort(np.loadtxt(args.groups, ndmin=1))
+    spectrum = load_spectrum(args.spectrum)
+
+    xml = ET.parse(xspath).getroot()
+    directory = root
+    directorynode = xml.find("directory")
+    if directorynode is not None:
+        directory = root / directorynode.text
+    paths = {
+        node.get("materials"): directory / node.get("path")
+        for node in xml.findall("library")
+        if node.get("type") == "neutron"
+    }
+    if args.nuclides is not None:
+        missing = set(args.nuclides) - set(paths)
+        if missing:
+            raise KeyError(f"{' '.join(sorted(missing))} not available in {args.library}")
+        paths = {nuclide: paths[nuclide] for nuclide in args.nuclides}
+
+    func = partial(
+        collapse_file, groups=groups, spectrum=spectrum, temperatures=args.temperatures
+    )
+    energy_groups = openmc.mgxs.EnergyGroups(groups)
+    library = openmc.MGXSLibrary(energy_groups)
+    bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
+    pbar = tqdm(total=len(paths), bar_format=bar_format, desc="Collapsing")
+    for data in imap(func, paths.values(), args.j):
+        pbar.update()
+        if not data["temperatures"]:
+            continue
+        xsdata = openmc.XSdata(
+            data["name"], energy_groups, temperatures=data["temperatures"]
+        )
+        xsdata.order = 0
+        xsdata.atomic_weight_ratio = data["awr"]
+        for i, temperature in enumerate(data["temperatures"]):
+            xsdata.set_total(data["total"][i], temperature)
+            xsdata.set_absorption(data["absorption"][i], temperature)
+            xsdata.set_scatter_matrix(data["scatter"][i][..., None], temperature)
+            if data["fissionable"]:
+                xsdata.set_fission(data["fission"][i], temperature)
+                xsdata.set_nu_fission(data["nu-fission"][i], temperature)
+                xsdata.set_chi(data["chi"][i], temperature)
+        library.add_xsdata(xsdata)
+    pbar.close()
+
+    Path(args.target).parent.mkdir(parents=True, exist_ok=True)
+    library.export_to_hdf5(args.target)
@@ -0,0 +1,61 @@
+"""Definition and parser for the `ndo dedup` command"""
+
+import argparse as ap
+
+from ndmanager.API.registry import register_library
+from ndmanager.API.store import add_library, prune_store, restore_library
+from ndmanager.env import NDMANAGER_HDF5
+
+
+def dedup_parser(subparsers):
+    """Add the parser for the 'ndo dedup' command to a subparser object
+
+    Args:
+        subparsers (argparse._SubParsersAction): An argparse subparser object
+    """
+    parser = subparsers.add_parser(
+        "dedup", help="Share identical HDF5 files between OpenMC libraries"
+    )
+    parser.add_argument(
+        "library",
+        type=str,
+        help="Names of the libraries",
+        action="extend",
+        nargs="*",
+    )
+    parser.add_argument(
+        "--undo",
+        help="Give the libraries private copies of their HDF5 files",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--prune",
+        help="Delete the files of the store that no library uses",
+        action="store_true",
+    )
+    parser.set_defaults(func=dedup)
+
+
+def dedup(args: ap.Namespace):
+    """Add the HDF5 files of libraries to the NDManager store, or restore them
+
+    Args:
+        args (ap.Namespace): The argparse object containing the command line argument
+
+    Raises:
+        ValueError: A library does not exist
+    """
+    for name in args.library:
+        if not (NDMANAGER_HDF5 / name / "cross_sections.xml").exists():
+            raise ValueError(f"{name} is not in the library list.")
+    for name in args.library:
+        if args.undo:
+            restore_library(name)
+            print(f"{name}: restored")
+        else:
+            saved = add_library(name)
+            print(f"{name}: {saved / 1024**2:.1f} MiB saved")
+        register_library(name)
+    if args.prune:
+        freed = prune_store()
+        print(f"Store pruned: {freed / 1024**2:.1f} MiB freed")
@@ -0,0 +1,62 @@
+"""Definition and parser for the `ndo diff` command"""
+
+import argparse as ap
+import json
+
+from tabulate import tabulate
+
+from ndmanager.API.merkle import diff_libraries
+
+
+def diff_parser(subparsers):
+    """Add the parser for the 'ndo diff' command to a subparser object
+
+    Args:
+        subparsers (argparse._SubParsersAction): An argparse subparser object
+    """
+    parser = subparsers.add_parser(
+        "diff", help="List the datasets that differ between two OpenMC libraries"
+    )
+    parser.add_argument("library1", type=str, help="Name of the first library")
+    parser.add_argument("library2", type=str, help="Name of the second library")
+    parser.add_argument(
+        "--stats",
+        help="Compute the largest differences of the changed datasets",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--report", "-r", type=str, help="Path to write the JSON report to"
+    )
+    parser.add_argument("-j", type=int, default=1, help="Number of concurent processes")
+    parser.set_defaults(func=diff)
+
+
+def diff(args: ap.Namespace):
+    """Compare two libraries and print the nodes that differ
+
+    Args:
+        args (ap.Namespace): The argparse object containing the command line argument
+    """
+    differences = diff_libraries(args.library1, args.library2, args.j, args.stats)
+    if args.report is not None:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(differences, f, indent=2)
+
+    table = []
+    for d in differences:
+        line = [d["type"], d["material"], d["node"], d["status"]]
+        if args.stats:
+            if "shape" in d:
+                line += [f"{d['shape'][0]} -> {d['shape'][1]}", ""]
+            elif "max_abs" in d:
+                line += [f"{d['max_abs']:.3e}", f"{d['max_rel']:.3e}"]
+            else:
+                line += ["", ""]
+        table.append(line)
+    headers = ["Type", "Material", "Node", "Status"]
+    if args.stats:
+        headers += ["Max abs. diff", "Max rel. diff"]
+    if table:
+        print(tabulate(table, headers=headers, disable_numparse=True))
+    else:
+        print(f"{args.library1} and {args.library2} are identical")
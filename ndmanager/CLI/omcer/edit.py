@@ -8,6 +8,8 @@ from typing import Dict, List
 import numpy as np
 from h5py import File
 
+from ndmanager.API.cow import break_link
+from ndmanager.API.store import MANIFEST_NAME, restore_library
 from ndmanager.env import NDMANAGER_HDF5
 
 
@@ -49,6 +51,7 @@ def overwrite(nuclide: str, mt: int, sourcefile: str, targetfile: str):
         ValueError: If the temperatures available in the source and target file
                     are different
     """
+    break_link(targetfile)
     with File(sourcefile, "r") as source, File(targetfile, "r+") as target:
 
         source_rgroup = source[f"{nuclide}/reactions/reaction_{mt:03d}/"]
@@ -132,6 +135,7 @@ def set_negative_to_zero(matpath: str, mt: int) -> None:
         matpath (str): The path to the file
         mt (int): The MT number of the reaction
     """
+    break_link(matpath)
     with File(matpath, "r+") as f:
         for nuclide in f.keys():
             try:
@@ -277,6 +281,9 @@ def sn301(args: ap.Namespace):
     Args:
         args (ap.Namespace): The argparse object containing the command line argument
     """
+    if not args.dryrun and (NDMANAGER_HDF5 / args.target / MANIFEST_NAME).exists():
+        # Files of the store are shared with other libraries
+        restore_library(args.target)
     target = NDMANAGER_HDF5 / args.target / "cross_sections.xml"
     sources = [NDMANAGER_HDF5 / s / "cross_sections.xml" for s in args.sources]
     replace_negatives_in_lib(target, sources, 301, dryrun=args.dryrun, verbose=True)
@@ -7,11 +7,13 @@ import tempfile
 from contextlib import chdir
 from pathlib import Path
 
-import requests
 from tqdm import tqdm
 
+from ndmanager.API.download import download_all
+from ndmanager.API.registry import register_library
+from ndmanager.API.store import add_library
 from ndmanager.data import OPENMC_LIBS
-from ndmanager.env import NDMANAGER_HDF5
+from ndmanager.env import NDMANAGER_CACHE, NDMANAGER_HDF5
 
 
 def install_parser(subparsers):
@@ -30,35 +32,19 @@ def install_parser(subparsers):
         action="extend",
         nargs="+",
     )
-    parser.set_defaults(func=install)
-
-
-def download(url: str, tarname: str, family: str, lib: str):
-    """Download an HDF5 OpenMC library from the official OpenMC website
-
-    Args:
-        url (str): The URL of the library
-        tarname (str): The name of the resulting tar file
-        family (str): The name of the library's family
-        lib (str): The library name
-    """
-    r = requests.get(url, stream=True, timeout=3600)
-
-    total = int(r.headers.get("content-length", 0))
-    bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
-    pbar = tqdm(
-        desc=f"Downloading {family}/{lib}",
-        total=total,
-        unit="iB",
-        unit_scale=True,
-        unit_divisor=1024,
-        bar_format=bar_format,
+    parser.add_argument("-j", type=int, default=4, help="Number of concurent downloads")
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=4,
+        help="Number of concurent connections per download",
+    )
+    parser.add_argument(
+        "--dedup",
+        help="Share identical HDF5 files with the other libraries",
+        action="store_true",
     )
-    with open(tarname, "wb") as f:
-        for data in r.iter_content(chunk_size=1024):
-            size = f.write(data)
-            pbar.update(size)
-    pbar.close()
+    parser.set_defaults(func=install)
 
 
 def extract(tarname: str, total: int, family: str, lib: str):
@@ -87,23 +73,34 @@ def extract(tarname: str, total: int, family: str, lib: str):
 
 
 def install(args: ap.Namespace):
-    """Download and install a OpenMC nuclear data library from the official website
+    """Download and install a OpenMC nuclear data library from the official website.
+    Archives are downloaded concurrently to the NDManager cache directory, so that
+    interrupted downloads can be resumed.
 
     Args:
         args (ap.Namespace): The argparse object containing the command line argument
     """
+    files = []
     for libname in args.library:
+        family, lib = libname.split("/")
+        dico = OPENMC_LIBS[family][lib]
+        tarname = NDMANAGER_CACHE / "downloads" / dico["tarname"]
+        files.append((dico["source"], tarname, f"Downloading {family}/{lib}"))
+    download_all(files, args.j, args.segments)
+
+    for libname, (_, tarname, _) in zip(args.library, files):
         with tempfile.TemporaryDirectory() as tmpdir:
             with chdir(tmpdir):
                 family, lib = libname.split("/")
                 dico = OPENMC_LIBS[family][lib]
+                extract(tarname, dico["size"], family, lib)
 
-                download(dico["source"], dico["tarname"], family, lib)
-                extract(dico["tarname"], dico["size"], family, lib)
-
-                # sp.run(["tar", "xf", dico["tarname"]], check=True)
                 source = Path(dico["extractedname"])
                 target = NDMANAGER_HDF5 / family / lib
                 target.parent.mkdir(exist_ok=True, parents=True)
                 shutil.rmtree(target, ignore_errors=True)
                 shutil.move(source, target)
+                if args.dedup:
+                    add_library(libname)
+                register_library(libname)
+        tarname.unlink()
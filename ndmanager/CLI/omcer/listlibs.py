@@ -1,10 +1,9 @@
 """Definition and parser for the `ndo install` command"""
 
 import textwrap
-import yaml
 
+from ndmanager.API.registry import load_registry, rescan
 from ndmanager.data import OPENMC_LIBS
-from ndmanager.env import NDMANAGER_HDF5
 from ndmanager.format import get_terminal_size, header
 
 
@@ -17,17 +16,23 @@ def listlibs_parser(subparsers):
     parser = subparsers.add_parser(
         "list", help="List libraries compatible with NDManager"
     )
+    parser.add_argument(
+        "--rescan",
+        help="Rebuild the library registry by walking the HDF5 directory",
+        action="store_true",
+    )
+    parser.add_argument("-j", type=int, default=8, help="Number of concurent threads")
     parser.set_defaults(func=listlibs)
 
 
-def listlibs(_args):
+def listlibs(args):
     """List the OpenMC libaries available for download with NDManager"""
     col, _ = get_terminal_size()
 
-    xs = set()
-    for xmlfile in NDMANAGER_HDF5.rglob("*.xml"):
-        p = xmlfile.parent / xmlfile.stem
-        xs.add(str(p.parent.relative_to(NDMANAGER_HDF5)))
+    registry = None if args.rescan else load_registry()
+    if registry is None:
+        registry = rescan(args.j)
+    xs = set(registry)
 
     lst = [header("Installable Libraries")]
     for family, dico in OPENMC_LIBS.items():
@@ -46,8 +51,10 @@ def listlibs(_args):
             )
             lst.append("\n".join(s))
     lst.append(header("Custom Libraries"))
-    for name in xs:
-        desc = yaml.safe_load(open(NDMANAGER_HDF5 / name / "input.yml")).get("summary", "")
+    for name in sorted(xs):
+        desc = registry[name]["summary"]
+        if registry[name]["status"] != "complete":
+            desc = f"({registry[name]['status']}) {desc}"
         s = f"{name:<16} {desc}"
         s = textwrap.wrap(s, initial_indent="", subsequent_indent=21 * " ", width=col)
         lst.append("\n".join(s))
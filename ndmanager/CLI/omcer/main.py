@@ -2,12 +2,19 @@
 
 import argparse as ap
 
+from ndmanager.CLI.omcer.broaden import broaden_parser
 from ndmanager.CLI.omcer.build import build_parser
 from ndmanager.CLI.omcer.clone import clone_parser
+from ndmanager.CLI.omcer.collapse import collapse_parser
+from ndmanager.CLI.omcer.dedup import dedup_parser
+from ndmanager.CLI.omcer.diff import diff_parser
 from ndmanager.CLI.omcer.edit import sn301_parser
 from ndmanager.CLI.omcer.install import install_parser
 from ndmanager.CLI.omcer.listlibs import listlibs_parser
 from ndmanager.CLI.omcer.remove import remove_parser
+from ndmanager.CLI.omcer.subset import subset_parser
+from ndmanager.CLI.omcer.thin import thin_parser
+from ndmanager.CLI.omcer.validate import validate_parser
 
 
 def main():
@@ -24,6 +31,13 @@ def main():
     remove_parser(subparsers)
     build_parser(subparsers)
     sn301_parser(subparsers)
+    dedup_parser(subparsers)
+    broaden_parser(subparsers)
+    thin_parser(subparsers)
+    subset_parser(subparsers)
+    collapse_parser(subparsers)
+    validate_parser(subparsers)
+    diff_parser(subparsers)
 
     args = parser.parse_args()
     if hasattr(args, "func"):
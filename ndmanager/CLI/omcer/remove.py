@@ -3,6 +3,8 @@
 import argparse as ap
 import shutil
 
+from ndmanager.API.registry import unregister_library
+from ndmanager.API.store import release_library
 from ndmanager.env import NDMANAGER_HDF5
 
 
@@ -29,7 +31,9 @@ def remove(args: ap.Namespace):
     Args:
         args (ap.Namespace): The argparse object containing the command line argument
     """
-    libraries = [NDMANAGER_HDF5 / lib for lib in args.library]
-    for library in libraries:
+    for name in args.library:
+        library = NDMANAGER_HDF5 / name
         if library.exists():
             shutil.rmtree(library)
+        release_library(name)
+        unregister_library(name)
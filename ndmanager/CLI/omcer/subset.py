@@ -0,0 +1,80 @@
+"""Definition and parser for the `ndo subset` command"""
+
+import argparse as ap
+
+from tabulate import tabulate
+
+from ndmanager.API.registry import register_library
+from ndmanager.API.subset import read_materials, subset_library
+
+
+def subset_parser(subparsers):
+    """Add the parser for the 'ndo subset' command to a subparser object
+
+    Args:
+        subparsers (argparse._SubParsersAction): An argparse subparser object
+    """
+    parser = subparsers.add_parser(
+        "subset",
+        help="Create a library holding only the data needed by a model",
+    )
+    parser.add_argument("source", type=str, help="Name for the original library")
+    parser.add_argument("target", type=str, help="Name for the new library")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--materials",
+        type=str,
+        help="Path to an OpenMC materials.xml file listing the data to keep",
+    )
+    group.add_argument(
+        "--nuclides",
+        nargs="+",
+        type=str,
+        help="The nuclides to keep",
+    )
+    parser.add_argument(
+        "--thermals",
+        nargs="+",
+        type=str,
+        default=[],
+        help="The thermal scattering tables to keep",
+    )
+    parser.add_argument(
+        "--tmin",
+        type=float,
+        help="Lower bound of the temperature range in Kelvin, defaults to the lowest material temperature",
+    )
+    parser.add_argument(
+        "--tmax",
+        type=float,
+        help="Upper bound of the temperature range in Kelvin, defaults to the highest material temperature",
+    )
+    parser.set_defaults(func=subset)
+
+
+def subset(args: ap.Namespace):
+    """Create a library holding the data of a set of nuclides and thermal
+    scattering tables, restricted to a temperature range
+
+    Args:
+        args (ap.Namespace): The argparse object containing the command line argument
+    """
+    tmin, tmax = args.tmin, args.tmax
+    if args.materials is not None:
+        nuclides, thermals, temperatures = read_materials(args.materials)
+        thermals |= set(args.thermals)
+        if temperatures:
+            tmin = min(temperatures) if tmin is None else tmin
+            tmax = max(temperatures) if tmax is None else tmax
+    else:
+        nuclides, thermals = args.nuclides, args.thermals
+
+    content = subset_library(args.source, args.target, nuclides, thermals, tmin, tmax)
+    register_library(args.target)
+
+    table = []
+    for material, temperatures in sorted(content.items()):
+        if temperatures is not None:
+            temperatures = " ".join(f"{t}K" for t in sorted(temperatures))
+        table.append([material, temperatures or ""])
+    print(tabulate(table, headers=["Material", "Temperatures"], disable_numparse=True))
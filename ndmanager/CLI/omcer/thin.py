@@ -0,0 +1,132 @@
+"""Definition and parser for the `ndo thin` command"""
+
+import argparse as ap
+import shutil
+import xml.etree.ElementTree as ET
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from tabulate import tabulate
+from tqdm import tqdm
+
+from ndmanager.API.cow import cow_copy
+from ndmanager.API.pool import imap
+from ndmanager.API.registry import register_library
+from ndmanager.API.thin import thin_file
+from ndmanager.env import NDMANAGER_HDF5
+
+
+def thin_parser(subparsers):
+    """Add the parser for the 'ndo thin' command to a subparser object
+
+    Args:
+        subparsers (argparse._SubParsersAction): An argparse subparser object
+    """
+    parser = subparsers.add_parser(
+        "thin", help="Create a lighter copy of an OpenMC library by thinning its energy grids"
+    )
+    parser.add_argument("source", type=str, help="Name for the original library")
+    parser.add_argument("target", type=str, help="Name for the thinned library")
+    parser.add_argument(
+        "--rtol",
+        type=float,
+        default=1e-3,
+        help="Relative tolerance on the interpolated cross sections",
+    )
+    parser.add_argument(
+        "--atol",
+        type=float,
+        default=1e-10,
+        help="Absolute tolerance on the interpolated cross sections in barns",
+    )
+    parser.add_argument("-j", type=int, default=1, help="Number of concurent processes")
+    parser.set_defaults(func=thin)
+
+
+def _thin(paths: Tuple[Path, Path], rtol: float, atol: float) -> Dict[str, Any]:
+    """Thin a file, see `thin_file`
+
+    Args:
+        paths (Tuple[Path, Path]): The paths to the source and target files
+        rtol (float): The relative tolerance
+        atol (float): The absolute tolerance
+
+    Returns:
+        Dict[str, Any]: The thinning report of the file
+    """
+    return thin_file(paths[0], paths[1], rtol, atol)
+
+
+def thin(args: ap.Namespace):
+    """Write a copy of a library where the energy grids of the neutron data
+    files are thinned, and report the reduction and error for each nuclide.
+    Other files are shared with the original library if possible.
+
+    Args:
+        args (ap.Namespace): The argparse object containing the command line argument
+
+    Raises:
+        ValueError: The source library does not exist
+        ValueError: The target library already exists
+    """
+    source = NDMANAGER_HDF5 / args.source
+    target = NDMANAGER_HDF5 / args.target
+    if not (source / "cross_sections.xml").exists():
+        raise ValueError(f"{args.source} is not in the library list.")
+    if target.exists():
+        raise ValueError(f"{args.target} is already in the library list.")
+
+    tree = ET.parse(source / "cross_sections.xml")
+    root = tree.getroot()
+    directory = source
+    directorynode = root.find("directory")
+    if directorynode is not None:
+        directory = source / directorynode.text
+        root.remove(directorynode)
+
+    neutrons = []
+    for node in root.findall("library"):
+        kind = node.get("type")
+        relpath = f"{kind}/{node.get('materials').split()[0]}.h5"
+        (target / kind).mkdir(parents=True, exist_ok=True)
+        if kind == "neutron":
+            neutrons.append((directory / node.get("path"), target / relpath))
+        else:
+            cow_copy(directory / node.get("path"), target / relpath)
+        node.set("path", relpath)
+
+    func = partial(_thin, rtol=args.rtol, atol=args.atol)
+    bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
+    pbar = tqdm(total=len(neutrons), bar_format=bar_format, desc="Thinning")
+    reports = []
+    for report in imap(func, neutrons, args.j):
+        reports.append(report)
+        pbar.update()
+    pbar.close()
+
+    ET.indent(tree)
+    tree.write(target / "cross_sections.xml", encoding="utf-8", xml_declaration=True)
+    if (source / "input.yml").exists():
+        shutil.copy(source / "input.yml", target / "input.yml")
+    register_library(args.target)
+
+    table = []
+    for report in reports:
+        reduction = 1 - report["thinned"] / report["points"]
+        table.append(
+            [
+                report["nuclide"],
+                report["points"],
+                report["thinned"],
+                f"{reduction:.1%}",
+                f"{report['error']:.2e}",
+            ]
+        )
+    points = sum(r["points"] for r in reports)
+    thinned = sum(r["thinned"] for r in reports)
+    if points:
+        error = max(r["error"] for r in reports)
+        table.append(["Total", points, thinned, f"{1 - thinned / points:.1%}", f"{error:.2e}"])
+    headers = ["Nuclide", "Points", "Thinned", "Reduction", "Max error"]
+    print(tabulate(table, headers=headers, disable_numparse=True))
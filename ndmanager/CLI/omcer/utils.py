@@ -1,13 +1,14 @@
 """A function that encapsulates nuclear data processing from OpenMC"""
 
 import argparse as ap
-import multiprocessing as mp
 from pathlib import Path
 from typing import Callable, Tuple
 
 import openmc.data
 from tqdm import tqdm
 
+from ndmanager.API.pool import imap
+
 
 def process(
     dest: Path,
@@ -39,19 +40,11 @@ def process(
         for arg in args:
             print(arg[0], str(arg[1]), str(arg[2]))
     else:
-        with mp.get_context("spawn").Pool(processes=run_args.j) as p:
-            bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
-            pbar = tqdm(total=len(args), bar_format=bar_format, desc=desc)
-
-            def update_pbar(_):
-                pbar.update()
-
-            for arg in args:
-                p.apply_async(processor, args=(arg,), callback=update_pbar)
-
-            p.close()
-            p.join()
-            pbar.close()
+        bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
+        pbar = tqdm(total=len(args), bar_format=bar_format, desc=desc)
+        for _ in imap(processor, args, run_args.j, unordered=True):
+            pbar.update()
+        pbar.close()
 
     for path in sorted(dest.glob("*.h5"), key=key):
         library.register_file(path)
@@ -0,0 +1,94 @@
+"""Definition and parser for the `ndo validate` command"""
+
+import argparse as ap
+import json
+import sys
+from functools import partial
+
+from tabulate import tabulate
+from tqdm import tqdm
+
+from ndmanager.API.pool import imap
+from ndmanager.API.validate import check_library, list_library_files, validate_file
+from ndmanager.env import NDMANAGER_HDF5
+
+
+def validate_parser(subparsers):
+    """Add the parser for the 'ndo validate' command to a subparser object
+
+    Args:
+        subparsers (argparse._SubParsersAction): An argparse subparser object
+    """
+    parser = subparsers.add_parser(
+        "validate", help="Check the consistency of an OpenMC library"
+    )
+    parser.add_argument("library", type=str, help="Name of the library")
+    parser.add_argument(
+        "--rtol",
+        type=float,
+        default=1e-3,
+        help="Relative tolerance on the sums of cross sections",
+    )
+    parser.add_argument(
+        "--atol",
+        type=float,
+        default=1e-8,
+        help="Absolute tolerance on the sums of cross sections in barns",
+    )
+    parser.add_argument(
+        "--report", "-r", type=str, help="Path to write the JSON report to"
+    )
+    parser.add_argument("-j", type=int, default=1, help="Number of concurent processes")
+    parser.set_defaults(func=validate)
+
+
+def validate(args: ap.Namespace):
+    """Check the data files of a library, write a JSON report and exit with a
+    non-zero status if any check fails
+
+    Args:
+        args (ap.Namespace): The argparse object containing the command line argument
+
+    Raises:
+        ValueError: The library does not exist
+    """
+    xspath = NDMANAGER_HDF5 / args.library / "cross_sections.xml"
+    if not xspath.exists():
+        raise ValueError(f"{args.library} is not in the library list.")
+    files = list_library_files(xspath)
+
+    func = partial(validate_file, rtol=args.rtol, atol=args.atol)
+    bar_format = "{l_bar}{bar:40}| {n_fmt}/{total_fmt} [{elapsed}s]"
+    pbar = tqdm(total=len(files), bar_format=bar_format, desc="Validating", file=sys.stderr)
+    reports = []
+    for report in imap(func, files, args.j):
+        reports.append(report)
+        pbar.update()
+    pbar.close()
+
+    failures = check_library(reports)
+    passed = not failures and not any(r["failures"] for r in reports)
+    result = {
+        "library": args.library,
+        "passed": passed,
+        "files": reports,
+        "library_failures": failures,
+    }
+    if args.report is not None:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    table = []
+    for report in reports:
+        for failure in report["failures"]:
+            table.append(
+                [report["material"], failure["check"], failure["temperature"] or "", failure["detail"]]
+            )
+    for failure in failures:
+        table.append([failure["material"], failure["check"], "", failure["detail"]])
+    if table:
+        headers = ["Material", "Check", "Temperature", "Detail"]
+        print(tabulate(table, headers=headers, disable_numparse=True))
+    print(f"{args.library}: {len(files)} files, {len(table)} failures")
+    if not passed:
+        sys.exit(1)
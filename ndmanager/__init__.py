@@ -5,5 +5,6 @@ __version__="0.4.0"
 from .API.iaea import IAEA, IAEALibrary, IAEASublibrary
 from .API.endf6 import Endf6
 from .API.nuclide import Nuclide
+from .API.nuclide_array import NuclideArray
 from .API.sha1 import compute_file_sha1
 from .API.utils import get_endf6
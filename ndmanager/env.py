@@ -32,3 +32,17 @@ elif "NDMANAGER_CHAINS" in settings:
     NDMANAGER_CHAINS = Path(settings["NDMANAGER_CHAINS"]).absolute()
 else:
     NDMANAGER_CHAINS = NDMANAGER_CONFIG / "chains"
+
+if "NDMANAGER_CACHE" in os.environ:
+    NDMANAGER_CACHE = Path(os.environ["NDMANAGER_CACHE"]).absolute()
+elif "NDMANAGER_CACHE" in settings:
+    NDMANAGER_CACHE = Path(settings["NDMANAGER_CACHE"]).absolute()
+else:
+    NDMANAGER_CACHE = NDMANAGER_CONFIG / "cache"
+
+if "NDMANAGER_SCRATCH" in os.environ:
+    NDMANAGER_SCRATCH = Path(os.environ["NDMANAGER_SCRATCH"]).absolute()
+elif "NDMANAGER_SCRATCH" in settings:
+    NDMANAGER_SCRATCH = Path(settings["NDMANAGER_SCRATCH"]).absolute()
+else:
+    NDMANAGER_SCRATCH = None
@@ -1,5 +1,12 @@
+import os
+
+import numpy as np
+from openmc.data import IncidentNeutron
+
+from ndmanager.API.njoy import neutron_from_pendf, njoy_sha1, pendf_cache_path
 from ndmanager.API.process import HDF5Neutron
 from ndmanager.API.sha1 import compute_file_sha1
+from ndmanager.API.utils import get_temperatures
 from pathlib import Path
 
 def test_hdf5_neutron(install):
@@ -29,3 +36,51 @@ def test_hdf5_neutron(install):
     neutron.temperatures = {300, 400}
     neutron.process()
 
+
+
+def test_hdf5_neutron_cache_pendf(install):
+    p = Path("pytest-artifacts/API/process/hdf5_neutron/cached/neutron")
+    (p / "logs").mkdir(parents=True, exist_ok=True)
+    tape = "pytest-artifacts/endf6/foo/n/H1.endf6"
+    neutron = HDF5Neutron("H1", p / "H1.h5", p / "logs/H1.logs", tape, {250}, True)
+    neutron.process()
+    assert pendf_cache_path(tape).exists()
+    assert get_temperatures(p / "H1.h5") == {250}
+
+    neutron.temperatures = {250, 400}
+    neutron.process()
+    assert get_temperatures(p / "H1.h5") == {250, 400}
+
+
+def test_pendf_cache_path(install, tmp_path, monkeypatch):
+    tape = "pytest-artifacts/endf6/foo/n/H1.endf6"
+    assert njoy_sha1() is not None
+    path = pendf_cache_path(tape)
+    assert pendf_cache_path(tape) == path
+    assert pendf_cache_path(tape, error=0.01) != path
+
+    # Tapes reconstructed by another NJOY executable are not reused
+    njoy = tmp_path / "njoy"
+    njoy.write_text("#!/bin/sh\n")
+    njoy.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path), prepend=os.pathsep)
+    assert njoy_sha1() == compute_file_sha1(njoy)
+    assert pendf_cache_path(tape) != path
+
+
+def test_neutron_from_pendf(install):
+    tape = "pytest-artifacts/endf6/foo/n/H1.endf6"
+    data = neutron_from_pendf(tape, [294, 600])
+    reference = IncidentNeutron.from_njoy(tape, temperatures=[294, 600])
+
+    assert set(data.energy) == set(reference.energy)
+    assert set(data.reactions) == set(reference.reactions)
+    for temperature in ["294K", "600K"]:
+        energy = reference.energy[temperature]
+        assert np.allclose(data.energy[temperature], energy)
+        for mt, reaction in reference.reactions.items():
+            if temperature not in reaction.xs:
+                continue
+            assert np.allclose(
+                data[mt].xs[temperature](energy), reaction.xs[temperature](energy)
+            )
@@ -0,0 +1,20 @@
+import tempfile
+
+import ndmanager.API.process.hdf5_sublibrary as hdf5_sublibrary
+from ndmanager.API.process.hdf5_sublibrary import HDF5Sublibrary
+
+
+def test_scratch(tmp_path, monkeypatch):
+    monkeypatch.setattr(hdf5_sublibrary, "NDMANAGER_SCRATCH", tmp_path / "scratch")
+    sublibrary = HDF5Sublibrary("H1", tmp_path / "lib/neutron/H1.h5", tmp_path / "H1.log")
+    with sublibrary.scratch() as scratch:
+        assert scratch.parent == tmp_path / "scratch"
+        assert scratch.name.startswith("ndmanager-H1-")
+        # Temporary directories, such as NJOY's, are created in the scratch directory
+        assert tempfile.mkdtemp().startswith(str(scratch))
+        (scratch / "H1.h5").write_bytes(b"data")
+        sublibrary.install(scratch / "H1.h5")
+    assert not scratch.exists()
+    assert tempfile.tempdir != str(scratch)
+    assert sublibrary.path.read_bytes() == b"data"
+    assert list(sublibrary.path.parent.iterdir()) == [sublibrary.path]
@@ -0,0 +1,48 @@
+from ndmanager.API.process import HDF5WMP, NeutronManager, WMPManager
+from ndmanager.API.process.hdf5_wmp import wmp_cache_path
+from pathlib import Path
+import pytest
+
+
+def test_wmp_manager(install):
+    p = Path("pytest-artifacts/API/process/wmp_manager/")
+    neutron = NeutronManager({"base": "foo", "temperatures": "294"}, p)
+
+    manager = WMPManager(None, neutron, p)
+    assert len(manager) == 0
+
+    manager = WMPManager({"ommit": "H1"}, neutron, p)
+    assert {wmp.target for wmp in manager} == {"C12", "Am242_m1"}
+
+    manager = WMPManager({"nuclides": "Am242_m1"}, neutron, p)
+    assert len(manager) == 1
+    wmp = manager[0]
+    assert isinstance(wmp, HDF5WMP)
+    assert wmp.path == p / "wmp/Am242_m1.h5"
+    assert wmp.logpath == p / "wmp/logs/Am242_m1.log"
+    assert wmp.neutron.samefile("pytest-artifacts/endf6/foo/n/Am242_m1.endf6")
+
+    with pytest.raises(KeyError):
+        WMPManager({"nuclides": "U235"}, neutron, p)
+
+
+def test_hdf5_wmp(install):
+    p = Path("pytest-artifacts/API/process/hdf5_wmp/foo/wmp")
+    (p / "logs").mkdir(parents=True, exist_ok=True)
+    tape = Path("pytest-artifacts/endf6/foo/n/Am242_m1.endf6")
+
+    wmp = HDF5WMP("Am242_m1", p / "Am242_m1.h5", p / "logs/Am242_m1.log", tape)
+    wmp.process()
+    assert wmp.path.exists()
+    assert wmp_cache_path(tape, {}).exists()
+
+    # The cached data is used when the file is processed again
+    wmp.path.unlink()
+    wmp.process()
+    assert wmp.path.exists()
+
+    # H1 has no resolved resonance parameters
+    tape = Path("pytest-artifacts/endf6/foo/n/H1.endf6")
+    wmp = HDF5WMP("H1", p / "H1.h5", p / "logs/H1.log", tape)
+    wmp.process()
+    assert not wmp.path.exists()
@@ -0,0 +1,62 @@
+import pytest
+import yaml
+from openmc.deplete import Chain, Nuclide
+
+import ndmanager.API.branching_ratios as br
+from ndmanager.API.branching_ratios import (
+    apply_branching_ratios,
+    list_branching_ratios,
+    load_branching_ratios,
+    register_branching_ratios,
+)
+
+
+def write_ratios(path, ratios):
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump({"version": 1, "reactions": ratios}, f)
+
+
+def test_packaged_branching_ratios():
+    sets = list_branching_ratios()
+    assert {"pwr", "sfr"} <= sets.keys()
+    pwr = load_branching_ratios("pwr")
+    assert pwr["(n,gamma)"]["Am241"] == {"Am242": 0.919, "Am242_m1": 0.081}
+    assert load_branching_ratios("pwr") is pwr
+    for targets in load_branching_ratios("sfr")["(n,gamma)"].values():
+        assert sum(targets.values()) == pytest.approx(1.0, abs=1e-5)
+
+
+def test_register_branching_ratios(tmp_path, monkeypatch):
+    monkeypatch.setattr(br, "USER_BRANCHING_RATIOS", tmp_path / "registered")
+    path = tmp_path / "custom.yml"
+    write_ratios(path, {"(n,gamma)": {"Am241": {"Am242": 0.5, "Am242_m1": 0.5}}})
+    assert load_branching_ratios(path)["(n,gamma)"]["Am241"]["Am242"] == 0.5
+
+    register_branching_ratios(path, "mine")
+    assert "mine" in list_branching_ratios()
+    assert load_branching_ratios("mine") == load_branching_ratios(path)
+    with pytest.raises(KeyError):
+        load_branching_ratios("notaset")
+
+    invalid = tmp_path / "invalid.yml"
+    invalid.write_text("reactions: {}\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        register_branching_ratios(invalid)
+
+
+def test_apply_branching_ratios():
+    chain = Chain()
+    for name in ["Am241", "Am242", "Am242_m1", "Am243", "Am244"]:
+        chain.add_nuclide(Nuclide(name))
+    chain["Am241"].add_reaction("(n,gamma)", "Am242", 5.5e6, 1.0)
+    chain["Am243"].add_reaction("(n,gamma)", "Am244", 5.4e6, 1.0)
+
+    ratios = load_branching_ratios("pwr")
+    apply_branching_ratios(chain, ratios)
+    am241 = {r.target: r.branching_ratio for r in chain["Am241"].reactions}
+    assert am241 == {"Am242": 0.919, "Am242_m1": 0.081}
+    # Am244_m1 is not in the chain, the reaction is left untouched
+    am243 = {r.target: r.branching_ratio for r in chain["Am243"].reactions}
+    assert am243 == {"Am244": 1.0}
+    # The cached set must not be modified by the chain
+    assert load_branching_ratios("pwr")["(n,gamma)"]["Am241"] == am241
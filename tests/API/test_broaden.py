@@ -0,0 +1,142 @@
+import h5py
+import numpy as np
+import pytest
+from scipy.special import erf
+
+from openmc.data import IncidentNeutron, Resonances
+from openmc.data.endf import Evaluation
+
+from ndmanager.API.broaden import K_BOLTZMANN, broaden, broaden_file
+from ndmanager.API.utils import get_endf6, get_temperatures
+
+AWR = 236.0
+
+
+def test_broaden_one_over_v():
+    # 1/v cross sections are invariant under Doppler broadening
+    energy = np.logspace(-5, 7, 3000)
+    xs = 10 / np.sqrt(energy)
+    assert np.allclose(broaden(energy, xs, AWR, 600.0), xs, rtol=1e-5)
+
+
+def test_broaden_constant():
+    energy = np.logspace(-5, 7, 3000)
+    xs = np.full_like(energy, 5.0)
+    y = np.sqrt(AWR / (K_BOLTZMANN * 600.0) * energy)
+    ref = 5.0 * (
+        (1 + 1 / (2 * y**2)) * erf(y) + np.exp(-(y**2)) / (y * np.sqrt(np.pi))
+    )
+    # The cross section is extended with a 1/v law below the first energy
+    # point, which only affects the kernel at the lowest energies
+    hot = broaden(energy, xs, AWR, 600.0)
+    assert np.allclose(hot[energy > 1e-2], ref[energy > 1e-2], rtol=1e-5)
+
+
+def test_broaden_resonance():
+    energy = np.linspace(1.0, 20.0, 20001)
+    xs = 1e3 / (1 + ((energy - 6.67) / 0.01) ** 2) + 10
+    hot = broaden(energy, xs, AWR, 600.0)
+    # Broadening conserves the area of the resonance and lowers its peak
+    assert hot.max() < xs.max() / 2
+    inner = (energy > 3) & (energy < 15)
+    assert hot[inner].sum() == pytest.approx(xs[inner].sum(), rel=1e-3)
+    # Broadening by steps is equivalent to broadening at once
+    steps = broaden(energy, broaden(energy, xs, AWR, 300.0), AWR, 300.0)
+    assert np.allclose(steps[inner], hot[inner], rtol=1e-3)
+    # Cross sections above emax are not broadened
+    partial = broaden(energy, xs, AWR, 600.0, emax=6.0)
+    assert np.array_equal(partial[energy >= 6.0], xs[energy >= 6.0])
+    assert np.array_equal(partial[energy < 6.0], hot[energy < 6.0])
+
+
+def write_u235_file(write_neutron_file, path):
+    energy = np.logspace(-5, 7, 3000)
+    reactions = {2: 10 / np.sqrt(energy), 16: 2.0}
+    write_neutron_file(
+        path, "U235", [294], energy, reactions, thresholds={16: 2500}, awr=AWR
+    )
+    with h5py.File(path, "r+") as f:
+        f["U235/urr/294K/table"] = np.ones((3, 3))
+
+
+def test_broaden_file(tmp_path, write_neutron_file):
+    path = tmp_path / "U235.h5"
+    write_u235_file(write_neutron_file, path)
+    assert broaden_file(path, [294, 600, 900]) == {600, 900}
+    assert get_temperatures(path) == {294, 600, 900}
+    with h5py.File(path) as f:
+        g = f["U235"]
+        assert g["kTs/600K"][()] == pytest.approx(K_BOLTZMANN * 600)
+        assert np.array_equal(g["energy/900K"][...], g["energy/294K"][...])
+        assert np.allclose(
+            g["reactions/reaction_002/900K/xs"][...],
+            g["reactions/reaction_002/294K/xs"][...],
+            rtol=1e-4,
+        )
+        assert len(g["reactions/reaction_016/600K/xs"]) == 500
+        assert g["reactions/reaction_016/600K/xs"].attrs["threshold_idx"] == 2500
+        assert np.array_equal(g["urr/600K/table"][...], np.ones((3, 3)))
+
+    with pytest.raises(ValueError):
+        broaden_file(path, [250])
+
+
+def test_broaden_file_atomic(tmp_path, monkeypatch, write_neutron_file):
+    path = tmp_path / "U235.h5"
+    write_u235_file(write_neutron_file, path)
+    link = tmp_path / "link.h5"
+    link.hardlink_to(path)
+    content = path.read_bytes()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError
+
+    # A failure leaves the file untouched
+    monkeypatch.setattr("ndmanager.API.broaden.broaden", fail)
+    with pytest.raises(RuntimeError):
+        broaden_file(path, [600])
+    assert path.read_bytes() == content
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["U235.h5", "link.h5"]
+
+    # Files sharing their data with the file are not modified
+    monkeypatch.undo()
+    broaden_file(path, [600])
+    assert get_temperatures(path) == {294, 600}
+    assert link.read_bytes() == content
+
+
+@pytest.mark.parametrize("nuclide", ["H1", "C12"])
+def test_broaden_file_njoy(install, tmp_path, nuclide):
+    tape = get_endf6("foo", "n", nuclide)
+    path = tmp_path / f"{nuclide}.h5"
+    IncidentNeutron.from_njoy(tape, temperatures=[294]).export_to_hdf5(path)
+    reference = IncidentNeutron.from_njoy(tape, temperatures=[600])
+
+    # NJOY's BROADR module only broadens cross sections below 1 MeV
+    broaden_file(path, [600], emax=1e6)
+    data = IncidentNeutron.from_hdf5(path)
+    energy = reference.energy["600K"]
+    energy = energy[energy < 1e6]
+    for mt in [2, 102]:
+        # NJOY reconstructs and thins cross sections within 0.1%
+        assert np.allclose(
+            data[mt].xs["600K"](energy), reference[mt].xs["600K"](energy), rtol=1e-2
+        )
+
+
+def test_broaden_file_njoy_resonances(install, tmp_path):
+    # Am242_m1 is the only resonant nuclide of the test libraries
+    tape = get_endf6("foo", "n", "Am242_m1")
+    path = tmp_path / "Am242_m1.h5"
+    IncidentNeutron.from_njoy(tape, temperatures=[294]).export_to_hdf5(path)
+    reference = IncidentNeutron.from_njoy(tape, temperatures=[600])
+
+    broaden_file(path, [600], emax=1e6)
+    data = IncidentNeutron.from_hdf5(path)
+    resolved = Resonances.from_endf(Evaluation(tape)).resolved
+    energy = reference.energy["600K"]
+    energy = energy[(energy > resolved.energy_min) & (energy < resolved.energy_max)]
+    for mt in [2, 18, 102]:
+        assert np.allclose(
+            data[mt].xs["600K"](energy), reference[mt].xs["600K"](energy), rtol=5e-3
+        )
@@ -0,0 +1,78 @@
+from io import StringIO
+
+import openmc.data
+import openmc.deplete
+import pytest
+from openmc.data.endf import Evaluation
+
+import ndmanager.API.chain as chain
+from ndmanager.API.chain import (cache_path, cached_parse, from_preparsed,
+                                 parse_tapes, read_neutron_sections,
+                                 supports_preparsed)
+from ndmanager.API.endf6_index import get_tape_header, index_path
+from ndmanager.API.utils import get_endf6
+
+
+def test_read_neutron_sections(install):
+    tape = get_endf6("foo", "n", "C12")
+    full = Evaluation(tape)
+    reduced = Evaluation(StringIO(read_neutron_sections(tape)))
+
+    assert reduced.material == full.material
+    assert reduced.target == full.target
+    assert reduced.reaction_list == full.reaction_list
+    assert {mf for mf, _ in reduced.section} == {1, 3}
+    for (mf, mt), section in reduced.section.items():
+        assert section == full.section[mf, mt]
+
+
+def test_parse_tapes(install):
+    tapes = [get_endf6("foo", "n", n) for n in ["C12", "H1", "Am242_m1"]]
+    serial = parse_tapes(read_neutron_sections, tapes, "Test", 1, cache=False)
+    parallel = parse_tapes(read_neutron_sections, tapes, "Test", 2, cache=False)
+    assert serial == parallel
+
+
+def test_supports_preparsed():
+    # Pins the OpenMC internals from_preparsed relies on
+    assert supports_preparsed()
+
+
+def test_from_preparsed():
+    Decay = openmc.data.Decay
+    # Decay data of the neutron itself is skipped by Chain.from_endf
+    decay = object.__new__(Decay)
+    decay.nuclide = {"atomic_number": 0, "name": "n1"}
+    depletion = from_preparsed([decay], [], [], [])
+    assert isinstance(depletion, openmc.deplete.Chain)
+    assert len(depletion) == 0
+    assert openmc.data.Decay is Decay
+
+
+def test_cached_parse(install, tmp_path, monkeypatch):
+    monkeypatch.setattr("ndmanager.API.chain.NDMANAGER_CACHE", tmp_path)
+    tape = get_endf6("foo", "n", "H1")
+    sha1 = get_tape_header(tape)["sha1"]
+    path = cache_path(read_neutron_sections, sha1)
+    assert path.is_relative_to(tmp_path)
+    assert path.name == sha1
+    assert not path.exists()
+
+    text = cached_parse(read_neutron_sections, tape)
+    assert path.exists()
+    assert cached_parse(read_neutron_sections, tape, sha1) == text
+
+
+def test_parse_tapes_index(install, tmp_path, monkeypatch):
+    # The header index of a sublibrary is loaded once for all its tapes
+    monkeypatch.setattr("ndmanager.API.chain.NDMANAGER_CACHE", tmp_path)
+    loaded = []
+    update_index = chain.update_index
+    monkeypatch.setattr(
+        chain, "update_index", lambda d: loaded.append(d) or update_index(d)
+    )
+    tapes = [get_endf6("foo", "n", n) for n in ["C12", "H1", "Am242_m1"]]
+    cached = parse_tapes(read_neutron_sections, tapes, "Test", 1)
+    assert len(loaded) == 1
+    assert cached == parse_tapes(read_neutron_sections, tapes, "Test", 1, cache=False)
+    assert index_path(tapes[0].parent).exists()
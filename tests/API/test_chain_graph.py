@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from openmc.deplete import Chain, FissionYieldDistribution, Nuclide
+
+from ndmanager.API.chain_graph import DECAY, REACTION, ChainGraph
+
+
+@pytest.fixture
+def chain():
+    chain = Chain()
+    half_lives = {
+        "U238": 1.4e17,
+        "U239": 1.4e3,
+        "Np239": 2.0e5,
+        "Pu239": 7.6e11,
+        "Pu240": 2.1e11,
+    }
+    for name, half_life in half_lives.items():
+        nuclide = Nuclide(name)
+        nuclide.half_life = half_life
+        chain.add_nuclide(nuclide)
+    chain["U238"].add_reaction("(n,gamma)", "U239", 0.0, 1.0)
+    chain["U239"].add_decay_mode("beta-", "Np239", 1.0)
+    chain["Np239"].add_decay_mode("beta-", "Pu239", 1.0)
+    chain["Pu239"].add_reaction("(n,gamma)", "Pu240", 0.0, 1.0)
+    return chain
+
+
+def test_from_chain(chain):
+    graph = ChainGraph.from_chain(chain)
+    assert len(graph) == 5
+    assert list(graph.names) == ["U238", "U239", "Np239", "Pu239", "Pu240"]
+    assert list(graph.indptr) == [0, 1, 2, 3, 4, 4]
+    assert list(graph.indices) == [1, 2, 3, 4]
+    assert list(graph.kinds) == [REACTION, DECAY, DECAY, REACTION]
+
+
+def test_distances(chain):
+    graph = ChainGraph.from_chain(chain)
+    assert list(graph.distances(["U238"])) == [0, 1, 2, 3, 4]
+    assert list(graph.distances(["U238"], level=2)) == [0, 1, 2, -1, -1]
+    assert list(graph.distances(["U239"], kinds=[DECAY])) == [-1, 0, 1, 2, -1]
+    assert list(graph.reachable(["Np239"])) == [False, False, True, True, True]
+    with pytest.raises(KeyError):
+        graph.distances(["Am241"])
+
+
+def test_reduce(chain):
+    graph = ChainGraph.from_chain(chain)
+    mask = graph.half_life_mask(86400.0)
+    assert list(mask) == [True, False, True, True, True]
+
+    mask &= graph.reachable(["U238"], level=3)
+    reduced = graph.reduce(chain, mask)
+    assert [nuclide.name for nuclide in reduced.nuclides] == ["U238", "Np239", "Pu239"]
+    assert np.all(ChainGraph.from_chain(reduced).half_lives > 86400.0)
+
+    # U239 is collapsed into its decay daughter: U238 still breeds Pu239
+    assert [(r.type, r.target) for r in reduced["U238"].reactions] == [
+        ("(n,gamma)", "Np239")
+    ]
+    assert ChainGraph.from_chain(reduced).reachable(["U238"])[2]
+    # Pu240 is out of reach, its production is kept without target
+    assert [r.target for r in reduced["Pu239"].reactions] == [None]
+
+
+def test_reduce_branching(chain):
+    chain["U238"].add_reaction("fission", None, 2e8, 1.0)
+    chain["U238"].yield_data = FissionYieldDistribution(
+        {0.0253: {"U239": 0.5, "Np239": 0.25}}
+    )
+    chain["U239"].decay_modes = []
+    chain["U239"].add_decay_mode("beta-", "Np239", 0.6)
+    chain["U239"].add_decay_mode("alpha", "Pu239", 0.4)
+
+    graph = ChainGraph.from_chain(chain)
+    reduced = graph.reduce(chain, graph.half_life_mask(1e6))
+    assert [nuclide.name for nuclide in reduced.nuclides] == ["U238", "Pu239", "Pu240"]
+
+    # Np239 is also removed: all the decay paths of U239 lead to Pu239
+    u238 = reduced["U238"]
+    capture = [r for r in u238.reactions if r.type == "(n,gamma)"]
+    assert [(r.target, r.branching_ratio) for r in capture] == [
+        ("Pu239", pytest.approx(1.0))
+    ]
+    yields = u238.yield_data[0.0253]
+    assert list(yields.products) == ["Pu239"]
+    assert yields.yields[0] == pytest.approx(0.75)
+    assert ChainGraph.from_chain(reduced).reachable(["U238"]).all()
@@ -0,0 +1,135 @@
+import warnings
+
+import h5py
+import numpy as np
+import pytest
+
+from ndmanager.API.collapse import collapse_file, load_spectrum, watt_spectrum
+
+GROUPS = np.array([1e-5, 0.625, 1e5, 2e7])
+
+
+def write_u235_file(write_neutron_file, path):
+    energy = np.logspace(-5, np.log10(2e7), 4000)
+    write_neutron_file(
+        path,
+        energy=energy,
+        reactions={2: 10.0, 102: 1 / np.sqrt(energy), 18: 2.0},
+        products={
+            2: [("neutron", 1.0)],
+            102: [("photon", 1.0)],
+            18: [("neutron", 2.5)],
+        },
+    )
+
+
+def test_collapse_file(tmp_path, write_neutron_file):
+    write_u235_file(write_neutron_file, tmp_path / "U235.h5")
+    # The fission neutrons have no energy distribution
+    with pytest.warns(UserWarning, match="Watt spectrum"):
+        data = collapse_file(tmp_path / "U235.h5", GROUPS, load_spectrum("1/E"), [600])
+    assert data["name"] == "U235"
+    assert data["temperatures"] == [600]
+    assert data["fissionable"]
+
+    # Groups are in descending energy order
+    thermal = 2 * (1e-5**-0.5 - 0.625**-0.5) / np.log(0.625 / 1e-5)
+    assert data["absorption"][0, 2] == pytest.approx(2 + thermal, rel=1e-4)
+    assert np.allclose(data["fission"], 2.0)
+    assert np.allclose(data["nu-fission"], 5.0)
+    assert np.allclose(data["total"], data["absorption"] + 10.0, rtol=1e-6)
+
+    # Elastic scattering conserves neutrons, except those scattered below the
+    # lowest group boundary, and only slows them down
+    scatter = data["scatter"][0]
+    assert np.allclose(scatter.sum(axis=1)[:2], 10.0, rtol=1e-5)
+    assert scatter[2, 2] < 10.0
+    assert np.allclose(np.tril(scatter, -1), 0.0)
+    assert scatter[0, 1] > 0
+
+    assert data["chi"].shape == (1, 3)
+    assert np.allclose(data["chi"][0], watt_spectrum(GROUPS)[::-1])
+    assert data["chi"][0, 0] > 0.98
+
+
+def write_distribution(path, kind, **datasets):
+    with h5py.File(path, "r+") as f:
+        energy = f["U235/reactions/reaction_018/product_0"].create_group(
+            "distribution_0"
+        )
+        energy.attrs["type"] = np.bytes_("uncorrelated")
+        energy = energy.create_group("energy")
+        energy.attrs["type"] = np.bytes_(kind)
+        for name, value in datasets.items():
+            if name == "u":
+                energy.attrs["u"] = value
+            elif name == "distribution":
+                energy[name], energy[name].attrs["offsets"] = value
+            else:
+                energy[name] = value
+                energy[name].attrs["type"] = np.bytes_("Tabulated1D")
+
+
+def test_fission_spectrum(tmp_path, write_neutron_file):
+    path = tmp_path / "U235.h5"
+    write_u235_file(write_neutron_file, path)
+    # Fission neutrons are emitted between 1e5 eV and 2e7 eV at low incident
+    # energies, and between 0.625 eV and 1e5 eV at 2e7 eV
+    pairs = np.array(
+        [
+            [1e5, 2e7, 0.625, 1e5],
+            [1 / (2e7 - 1e5), 1 / (2e7 - 1e5), 1 / 1e5, 1 / 1e5],
+            [0.0, 1.0, 0.0, 1.0],
+        ]
+    )
+    write_distribution(
+        path,
+        "continuous",
+        energy=np.array([1e-5, 2e7]),
+        distribution=(pairs, np.array([0, 2])),
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        data = collapse_file(path, GROUPS, load_spectrum("1/E"), [600])
+    chi = data["chi"][0]
+    assert chi.sum() == pytest.approx(1.0)
+    assert chi[2] == 0.0
+    # Only the fast group holds incident energies high enough to emit
+    # neutrons below 1e5 eV
+    assert 0.0 < chi[1] < 0.1
+
+
+def test_watt_distribution(tmp_path, write_neutron_file):
+    path = tmp_path / "U235.h5"
+    write_u235_file(write_neutron_file, path)
+    grid = [1e-5, 2e7]
+    write_distribution(
+        path,
+        "watt",
+        u=-2e7,
+        a=np.array([grid, [0.988e6, 0.988e6]]),
+        b=np.array([grid, [2.249e-6, 2.249e-6]]),
+    )
+    data = collapse_file(path, GROUPS, load_spectrum("1/E"), [600])
+    assert np.allclose(data["chi"][0], watt_spectrum(GROUPS)[::-1])
+
+
+def test_inelastic_warning(tmp_path, write_neutron_file):
+    path = tmp_path / "U238.h5"
+    write_neutron_file(
+        path,
+        name="U238",
+        reactions={2: 10.0, 16: 1.0},
+        products={16: [("neutron", 2.0)]},
+    )
+    with pytest.warns(UserWarning, match="MT=16"):
+        data = collapse_file(path, GROUPS, load_spectrum("flat"))
+    # The (n,2n) neutrons stay in their group
+    assert np.all(np.diag(data["scatter"][0]) > 10.0)
+
+
+def test_watt_spectrum():
+    chi = watt_spectrum(np.array([0.0, 1e6, 2e7]))
+    assert chi.sum() == pytest.approx(1.0, rel=1e-5)
+    # About 30% of fission neutrons are emitted below 1 MeV
+    assert chi[0] == pytest.approx(0.3, abs=0.02)
@@ -0,0 +1,35 @@
+import os
+
+from ndmanager.API.cow import break_link, cow_copy, cow_copytree
+
+
+def test_cow_copytree(tmp_path):
+    source = tmp_path / "source"
+    (source / "neutron").mkdir(parents=True)
+    (source / "neutron" / "H1.h5").write_bytes(b"H1 data")
+    (source / "cross_sections.xml").write_text("<cross_sections />")
+
+    target = tmp_path / "target"
+    cow_copytree(source, target)
+    assert (target / "neutron" / "H1.h5").read_bytes() == b"H1 data"
+    assert (target / "cross_sections.xml").stat().st_nlink == 1
+
+    # Writing to a file after breaking the link leaves the original untouched
+    h5 = target / "neutron" / "H1.h5"
+    break_link(h5)
+    assert h5.stat().st_nlink == 1
+    with open(h5, "r+b") as f:
+        f.write(b"C0")
+    assert (source / "neutron" / "H1.h5").read_bytes() == b"H1 data"
+    assert h5.read_bytes() == b"C0 data"
+
+
+def test_cow_copy(tmp_path):
+    source = tmp_path / "source.h5"
+    source.write_bytes(b"data")
+    target = tmp_path / "target.h5"
+    method = cow_copy(source, target)
+    assert method in ("reflink", "hardlink", "copy")
+    assert target.read_bytes() == b"data"
+    if method == "hardlink":
+        assert os.path.samefile(source, target)
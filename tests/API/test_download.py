@@ -0,0 +1,102 @@
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import ndmanager.API.download as dl
+from ndmanager.API.download import download, download_all, split_segments
+
+CONTENT = os.urandom(3 << 20)
+
+
+class Handler(BaseHTTPRequestHandler):
+    ranges = True
+    requests = []
+
+    def do_GET(self):
+        Handler.requests.append(self.headers.get("Range"))
+        start, end = 0, len(CONTENT) - 1
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        if self.ranges and match:
+            start = int(match[1])
+            end = int(match[2]) if match[2] else end
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(CONTENT)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self.wfile.write(CONTENT[start : end + 1])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(dl, "MIN_SEGMENT_SIZE", 1 << 20)
+    Handler.ranges = True
+    Handler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_split_segments():
+    assert split_segments(10, 4) == [[0, 10, 0]]
+    segments = split_segments(100 << 20, 4)
+    assert len(segments) == 4
+    assert segments[0][0] == 0 and segments[-1][1] == 100 << 20
+    assert all(a[1] == b[0] for a, b in zip(segments[:-1], segments[1:]))
+
+
+def test_download(server, tmp_path):
+    target = download(f"{server}/file", tmp_path / "file", segments=3)
+    assert target.read_bytes() == CONTENT
+    # One probe and one request per segment
+    assert len(Handler.requests) == 4
+    assert not (tmp_path / "file.part").exists()
+    assert not (tmp_path / "file.part.json").exists()
+
+
+def test_download_no_ranges(server, tmp_path):
+    Handler.ranges = False
+    target = download(f"{server}/file", tmp_path / "file", segments=3)
+    assert target.read_bytes() == CONTENT
+    assert len(Handler.requests) == 2
+
+
+def test_resume(server, tmp_path):
+    # An interrupted download, the first segment is complete and half of the
+    # second one was downloaded
+    url = f"{server}/file"
+    segments = split_segments(len(CONTENT), 3)
+    part = bytearray(len(CONTENT))
+    half = segments[1][0] + (segments[1][1] - segments[1][0]) // 2
+    part[: segments[0][1]] = CONTENT[: segments[0][1]]
+    part[segments[1][0] : half] = CONTENT[segments[1][0] : half]
+    segments[0][2] = segments[0][1]
+    segments[1][2] = half - segments[1][0]
+    (tmp_path / "file.part").write_bytes(part)
+    state = {"url": url, "size": len(CONTENT), "segments": segments}
+    (tmp_path / "file.part.json").write_text(json.dumps(state))
+
+    target = download(url, tmp_path / "file", segments=3)
+    assert target.read_bytes() == CONTENT
+    assert sorted(Handler.requests[1:]) == [
+        f"bytes={half}-{segments[1][1] - 1}",
+        f"bytes={segments[2][0]}-{segments[2][1] - 1}",
+    ]
+
+
+def test_download_all(server, tmp_path):
+    files = [(f"{server}/{i}", tmp_path / f"{i}.bin", str(i)) for i in range(3)]
+    paths = download_all(files, processes=3, segments=2)
+    assert paths == [tmp_path / f"{i}.bin" for i in range(3)]
+    assert all(p.read_bytes() == CONTENT for p in paths)
@@ -0,0 +1,72 @@
+import json
+import os
+
+from ndmanager.API.endf6_index import (
+    INDEX_NAME,
+    get_tape_header,
+    list_indexed_tapes,
+    read_header,
+    update_index,
+)
+
+
+def write_tape(path, za, liso, nsub, mat, zsymam):
+    fields = [
+        [za, 2.330248e2, 1, 0, 0, 0],
+        [0.0, 0.0, 0, liso, 0, 6],
+        [1.0, 2.0e7, 0, 0, nsub, 8],
+        [0.0, 0.0, 0, 0, 6, 1],
+    ]
+    lines = [f"{'TPID':66}{1:4d}{0:2d}{0:3d}{0:5d}"]
+    for record in fields:
+        text = "".join(
+            f"{v:11.6e}".replace("e", "") if isinstance(v, float) else f"{v:11d}"
+            for v in record
+        )
+        lines.append(f"{text:66}{mat:4d}{1:2d}{451:3d}{0:5d}")
+    lines.append(f"{zsymam:66}{mat:4d}{1:2d}{451:3d}{0:5d}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_endf6_index(tmp_path):
+    write_tape(tmp_path / "U235.endf6", 92235.0, 0, 10, 9228, " 92-U -235 ")
+    write_tape(tmp_path / "Am242_m1.endf6", 95242.0, 1, 10, 9547, " 95-Am-242M")
+    write_tape(tmp_path / "C.endf6", 6000.0, 0, 3, 600, "  6-C -  0 ")
+
+    header = read_header(tmp_path / "Am242_m1.endf6")
+    assert header["za"] == 95242
+    assert header["liso"] == 1
+    assert header["nsub"] == 10
+    assert header["mat"] == 9547
+    assert header["zsymam"] == " 95-Am-242M"
+    assert header["name"] == "Am242_m1"
+
+    tapes = list_indexed_tapes(tmp_path)
+    assert tapes == {
+        "Am242_m1": tmp_path / "Am242_m1.endf6",
+        "C": tmp_path / "C.endf6",
+        "U235": tmp_path / "U235.endf6",
+    }
+    with open(tmp_path / INDEX_NAME, encoding="utf-8") as f:
+        index = json.load(f)
+    assert index["tapes"]["U235.endf6"]["mat"] == 9228
+    assert len(index["tapes"]["U235.endf6"]["sha1"]) == 40
+
+    # The index is used as is when the directory is not modified
+    index["tapes"]["U235.endf6"]["zsymam"] = "cached"
+    with open(tmp_path / INDEX_NAME, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    mtime = tmp_path.stat().st_mtime_ns
+    os.utime(tmp_path / INDEX_NAME, ns=(mtime, mtime))
+    assert get_tape_header(tmp_path / "U235.endf6")["zsymam"] == "cached"
+
+    # Added and removed tapes are taken into account
+    (tmp_path / "C.endf6").unlink()
+    write_tape(tmp_path / "Pu239.endf6", 94239.0, 0, 10, 9437, " 94-Pu-239 ")
+    assert set(list_indexed_tapes(tmp_path)) == {"Am242_m1", "Pu239", "U235"}
+    assert get_tape_header(tmp_path / "U235.endf6")["zsymam"] == "cached"
+
+    # A full update reads modified tapes again
+    write_tape(tmp_path / "U235.endf6", 92235.0, 0, 10, 9228, " 92-U -235 ")
+    os.utime(tmp_path / "U235.endf6", ns=(0, 0))
+    assert update_index(tmp_path, full=True)["U235.endf6"]["zsymam"] == " 92-U -235 "
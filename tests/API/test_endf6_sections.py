@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from ndmanager.API.endf6_index import (
+    index_path,
+    is_up_to_date,
+    read_header,
+    update_index,
+)
+from ndmanager.API.endf6_sections import (
+    build_section_index,
+    get_section_index,
+    iter_materials,
+    read_section,
+    section_index_path,
+    split_tape,
+)
+
+
+def record(mat, mf, mt, text=""):
+    return f"{text:66}{mat:4d}{mf:2d}{mt:3d}{0:5d}\n"
+
+
+def make_tape(materials):
+    lines = [record(1, 0, 0, "TPID")]
+    for mat, sections in materials.items():
+        for mf in sorted({mf for mf, _ in sections}):
+            for (smf, mt), nlines in sections.items():
+                if smf != mf:
+                    continue
+                lines += [record(mat, mf, mt, f"{mat} {mf} {mt} {i}") for i in range(nlines)]
+                lines.append(record(mat, mf, 0))
+            lines.append(record(mat, 0, 0))
+        lines.append(record(0, 0, 0))
+    lines.append(record(-1, 0, 0))
+    return "".join(lines)
+
+
+def test_build_section_index():
+    tape = make_tape({9228: {(1, 451): 3, (3, 1): 2, (3, 2): 1}, 9437: {(1, 451): 1}})
+    index = build_section_index(tape.encode())
+    assert index["mat"].tolist() == [9228, 9228, 9228, 9437]
+    assert index["mf"].tolist() == [1, 3, 3, 1]
+    assert index["mt"].tolist() == [451, 1, 2, 451]
+    for section in index:
+        start = section["offset"]
+        text = tape[start : start + section["length"]]
+        lines = text.splitlines()
+        assert all(line[66:75] == lines[0][66:75] for line in lines)
+    assert len(build_section_index(b"")) == 0
+
+
+def test_read_section(tmp_path, monkeypatch):
+    monkeypatch.setattr("ndmanager.API.endf6_sections.NDMANAGER_CACHE", tmp_path / "cache")
+    path = tmp_path / "tapes" / "U235.endf6"
+    path.parent.mkdir()
+    path.write_text(make_tape({9228: {(1, 451): 3, (3, 1): 2, (3, 2): 1}}))
+
+    section = read_section(path, 3, 1)
+    assert section.splitlines() == [
+        record(9228, 3, 1, f"9228 3 1 {i}").rstrip("\n") for i in range(2)
+    ]
+    assert section_index_path(path).exists()
+    assert section_index_path(path).is_relative_to(tmp_path / "cache")
+    assert [p.name for p in path.parent.iterdir()] == ["U235.endf6"]
+    with pytest.raises(KeyError):
+        read_section(path, 3, 102)
+
+    # The sidecar index is invalidated when the tape is modified
+    path.write_text(make_tape({9228: {(1, 451): 1, (3, 102): 4}}))
+    index = get_section_index(path)
+    assert np.array_equal(index["mt"], [451, 102])
+    assert len(read_section(path, 3, 102).splitlines()) == 4
+
+
+def material(mat, za, zsymam):
+    head = [
+        f"{za:>11}{'2.330000+2':>11}{0:11d}{0:11d}{0:11d}{0:11d}",
+        f"{'0.000000+0':>11}{'0.000000+0':>11}{0:11d}{0:11d}{0:11d}{6:11d}",
+        f"{'1.000000+0':>11}{'2.000000+7':>11}{0:11d}{0:11d}{10:11d}{8:11d}",
+        f"{'0.000000+0':>11}{'0.000000+0':>11}{0:11d}{0:11d}{1:11d}{1:11d}",
+        zsymam,
+    ]
+    lines = [record(mat, 1, 451, text) for text in head]
+    lines += [record(mat, 1, 0), record(mat, 0, 0)]
+    lines += [record(mat, 3, 1, "xs"), record(mat, 3, 0), record(mat, 0, 0)]
+    return "".join(lines) + record(0, 0, 0)
+
+
+def test_split_tape(tmp_path, monkeypatch):
+    monkeypatch.setattr("ndmanager.API.endf6_sections.NDMANAGER_CACHE", tmp_path / "cache")
+    materials = [
+        material(9228, "9.223500+4", " 92-U -235 "),
+        material(9437, "9.423900+4", " 94-Pu-239 "),
+    ]
+    tape = tmp_path / "decay.endf6"
+    tape.write_text(record(1, 0, 0, "TPID") + "".join(materials) + record(-1, 0, 0))
+
+    assert list(iter_materials(tape)) == materials
+
+    paths = split_tape(tape, tmp_path / "split")
+    assert [p.name for p in paths] == ["U235.endf6", "Pu239.endf6"]
+    assert read_header(paths[1])["zsymam"] == " 94-Pu-239 "
+    assert read_section(paths[1], 3, 1).startswith("xs")
+    # Reading a tape does not index its directory
+    assert not index_path(tmp_path / "split").exists()
+    # Section indexes do not invalidate the header index of the directory
+    update_index(tmp_path / "split")
+    assert read_section(paths[0], 3, 1).startswith("xs")
+    assert is_up_to_date(tmp_path / "split")
+    assert paths[0].read_text().splitlines()[-1][66:70] == "  -1"
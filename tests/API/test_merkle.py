@@ -0,0 +1,139 @@
+import json
+import os
+
+import h5py
+import numpy as np
+import pytest
+
+import ndmanager.API.merkle as merkle
+from ndmanager.API.merkle import MERKLE_NAME, diff_libraries, diff_trees, hash_file
+
+
+def write_library(write_neutron_file, root, name, files):
+    libdir = root / name
+    (libdir / "neutron").mkdir(parents=True)
+    lines = ["<?xml version='1.0' encoding='utf-8'?>", "<cross_sections>"]
+    for nuclide, kwargs in files.items():
+        elastic = kwargs.get("elastic", 10.0)
+        write_neutron_file(
+            libdir / "neutron" / f"{nuclide}.h5", reactions={2: elastic, 102: 1.0}
+        )
+        lines.append(
+            f'  <library materials="{nuclide}" path="neutron/{nuclide}.h5" type="neutron" />'
+        )
+        if "wmp" in kwargs:
+            # WMP entries use the name of the nuclide, as neutron entries do
+            (libdir / "wmp").mkdir(exist_ok=True)
+            with h5py.File(libdir / "wmp" / f"{nuclide}.h5", "w") as f:
+                f[f"{nuclide}/data"] = np.full(4, kwargs["wmp"])
+            lines.append(
+                f'  <library materials="{nuclide}" path="wmp/{nuclide}.h5" type="wmp" />'
+            )
+    lines.append("</cross_sections>")
+    (libdir / "cross_sections.xml").write_text("\n".join(lines))
+
+
+def test_diff_trees(tmp_path, write_neutron_file):
+    write_neutron_file(tmp_path / "a.h5", reactions={2: 10.0, 102: 1.0})
+    write_neutron_file(tmp_path / "b.h5", reactions={2: 10.0, 102: 1.0})
+    assert hash_file(tmp_path / "a.h5") == hash_file(tmp_path / "b.h5")
+    assert diff_trees(hash_file(tmp_path / "a.h5"), hash_file(tmp_path / "b.h5")) == []
+
+    write_neutron_file(tmp_path / "b.h5", reactions={2: 11.0, 102: 1.0})
+    with h5py.File(tmp_path / "b.h5", "r+") as f:
+        f["U235"].attrs["atomic_weight_ratio"] = 234.0
+    assert diff_trees(hash_file(tmp_path / "a.h5"), hash_file(tmp_path / "b.h5")) == [
+        ("/U235", "changed"),
+        ("/U235/reactions/reaction_002/294K/xs", "changed"),
+        ("/U235/reactions/reaction_002/600K/xs", "changed"),
+    ]
+
+    write_neutron_file(tmp_path / "b.h5", reactions={4: 10.0, 102: 1.0})
+    assert diff_trees(hash_file(tmp_path / "a.h5"), hash_file(tmp_path / "b.h5")) == [
+        ("/U235/reactions/reaction_002", "removed"),
+        ("/U235/reactions/reaction_004", "added"),
+    ]
+
+
+@pytest.fixture
+def libraries(tmp_path, monkeypatch, write_neutron_file):
+    monkeypatch.setattr(merkle, "NDMANAGER_HDF5", tmp_path)
+    write_library(
+        write_neutron_file,
+        tmp_path,
+        "lib1",
+        {"U235": {"wmp": 1.0}, "U238": {}, "Pu239": {}},
+    )
+    write_library(
+        write_neutron_file,
+        tmp_path,
+        "lib2",
+        {"U235": {"wmp": 2.0}, "U238": {"elastic": 12.0}, "Pu241": {}},
+    )
+    return tmp_path
+
+
+def test_diff_libraries(libraries):
+    differences = diff_libraries("lib1", "lib2", statistics=True)
+    assert differences == [
+        {"type": "neutron", "material": "Pu239", "node": "/", "status": "removed"},
+        {"type": "neutron", "material": "Pu241", "node": "/", "status": "added"},
+        {
+            "type": "neutron",
+            "material": "U238",
+            "node": "/U235/reactions/reaction_002/294K/xs",
+            "status": "changed",
+            "max_abs": 2.0,
+            "max_rel": pytest.approx(2 / 12),
+        },
+        {
+            "type": "neutron",
+            "material": "U238",
+            "node": "/U235/reactions/reaction_002/600K/xs",
+            "status": "changed",
+            "max_abs": 2.0,
+            "max_rel": pytest.approx(2 / 12),
+        },
+        {
+            "type": "wmp",
+            "material": "U235",
+            "node": "/U235/data",
+            "status": "changed",
+            "max_abs": 1.0,
+            "max_rel": 0.5,
+        },
+    ]
+    assert (libraries / "lib1" / MERKLE_NAME).exists()
+
+
+def test_merkle_cache(libraries, monkeypatch):
+    diff_libraries("lib1", "lib2")
+    cachepath = libraries / "lib2" / MERKLE_NAME
+    with open(cachepath) as f:
+        cache = json.load(f)
+    assert set(cache["files"]) == {
+        "neutron/U235",
+        "neutron/U238",
+        "neutron/Pu241",
+        "wmp/U235",
+    }
+    # Cached trees are reused as long as the files are unchanged
+    cache["files"]["neutron/U235"]["tree"] = cache["files"]["neutron/U238"]["tree"]
+    with open(cachepath, "w") as f:
+        json.dump(cache, f)
+    hashed = []
+    monkeypatch.setattr(merkle, "hash_file", lambda path: hashed.append(path))
+    assert diff_libraries("lib1", "lib2")[2]["material"] == "U235"
+    assert hashed == []
+    monkeypatch.setattr(merkle, "hash_file", hash_file)
+
+    path = libraries / "lib2" / "neutron" / "U235.h5"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert [(d["type"], d["material"]) for d in diff_libraries("lib1", "lib2")] == [
+        ("neutron", "Pu239"),
+        ("neutron", "Pu241"),
+        ("neutron", "U238"),
+        ("neutron", "U238"),
+        ("wmp", "U235"),
+    ]
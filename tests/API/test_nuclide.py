@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from ndmanager.API.nuclide import Nuclide
@@ -66,3 +69,26 @@ def test_nuclide(install):
     assert Nuclide.from_file(tape).M == 1
     assert Nuclide.from_file(tape).name == "Am242_m1"
     assert Nuclide.from_file(tape).zam == 952421
+
+
+def test_nuclide_interning():
+    am242m = Nuclide(Z=95, A=242, M=1)
+    assert Nuclide.from_name("Am242_m1") is am242m
+    assert Nuclide.from_zam(952421) is am242m
+    assert Nuclide.from_iaea_name("95-Am-242M") is am242m
+    assert pickle.loads(pickle.dumps(am242m)) is am242m
+    assert copy.deepcopy(am242m) is am242m
+
+    with pytest.raises(AttributeError):
+        am242m.A = 241
+    assert am242m.name == "Am242_m1"
+
+    carbon = Nuclide.from_name("C")
+    assert carbon.A is None and carbon.M is None
+    assert carbon.name == "C"
+    assert carbon.zam == 60000
+
+    nuclides = [Nuclide.from_name(n) for n in ["U235", "Am242_m1", "H1", "Am242"]]
+    assert [n.name for n in sorted(nuclides)] == ["H1", "U235", "Am242", "Am242_m1"]
+    assert {am242m: 1}[Nuclide.from_zam(952421)] == 1
+    assert repr(am242m) == "Nuclide(Z=95, A=242, M=1)"
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from ndmanager.API.nuclide import Nuclide
+from ndmanager.API.nuclide_array import NuclideArray
+
+
+def test_nuclide_array():
+    names = ["U235", "Am242_m1", "C", "H1", "Am242"]
+    array = NuclideArray.from_names(names)
+    assert array.Z.tolist() == [92, 95, 6, 1, 95]
+    assert array.A.tolist() == [235, 242, -1, 1, 242]
+    assert array.M.tolist() == [0, 1, -1, 0, 0]
+    assert array.names.tolist() == names
+    assert array.zams.tolist() == [Nuclide.from_name(n).zam for n in names]
+    assert list(array) == [Nuclide.from_name(n) for n in names]
+    assert array.sorted().names.tolist() == ["H1", "C", "U235", "Am242", "Am242_m1"]
+    assert array[1] is Nuclide.from_name("Am242_m1")
+    assert array[np.array([True, False, True, False, False])].names.tolist() == [
+        "U235",
+        "C",
+    ]
+
+    zams = NuclideArray.from_zams([922350, 952421])
+    assert zams.names.tolist() == ["U235", "Am242_m1"]
+
+    iaea = NuclideArray.from_iaea_names(["92-U-235", "95-Am-242M", "26-FE-56"])
+    assert iaea.names.tolist() == ["U235", "Am242_m1", "Fe56"]
+
+    endf = NuclideArray.from_endf([92235.0, 95242.0, 6000.0], [0, 1, 0])
+    assert endf.names.tolist() == ["U235", "Am242_m1", "C"]
+
+    nuclides = NuclideArray.from_nuclides(Nuclide.from_name(n) for n in names)
+    assert nuclides.names.tolist() == names
+    assert len(NuclideArray.from_names([])) == 0
+
+    with pytest.raises(ValueError):
+        NuclideArray.from_names(["U235", "not a nuclide"])
+    with pytest.raises(KeyError):
+        NuclideArray.from_names(["Xx12"])
+    with pytest.raises(KeyError):
+        NuclideArray.from_iaea_names(["0-nn-1"])
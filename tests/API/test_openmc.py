@@ -4,7 +4,14 @@ from pathlib import Path
 import openmc
 import pytest
 
-from ndmanager.API.openmc import check_nuclear_data, set_nuclear_data, set_xs
+from ndmanager.API.openmc import (
+    check_nuclear_data,
+    get_library,
+    get_library_entry,
+    missing_nuclear_data,
+    set_nuclear_data,
+    set_xs,
+)
 
 
 def test_set_xs(build_lib):
@@ -44,3 +51,41 @@ def test_check_nuclear_data(build_lib):
     assert not check_nuclear_data(
         "pytest-artifacts/hdf5/foo/cross_sections.xml", ["C12", "H1", "Am242_m1"]
     )
+
+
+def write_xs(path, materials, data_type="neutron"):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<?xml version='1.0' encoding='utf-8'?>\n<cross_sections>\n")
+        for material in materials:
+            f.write(
+                f'  <library materials="{material}" path="{material}.h5" '
+                f'type="{data_type}" />\n'
+            )
+        f.write("</cross_sections>\n")
+
+
+def test_missing_nuclear_data(tmp_path):
+    path = tmp_path / "cross_sections.xml"
+    write_xs(path, ["C12", "H1"])
+    assert missing_nuclear_data(str(path), ["C12", "H1", "Am242_m1"]) == {"Am242_m1"}
+    assert missing_nuclear_data(str(path), "C12") == set()
+    assert get_library_entry(str(path), "H1")["path"].endswith("H1.h5")
+    assert get_library_entry(str(path), "U235") is None
+    assert get_library(str(path)) is get_library(str(path))
+
+    # The cache is invalidated when the file is modified
+    lib = get_library(str(path))
+    write_xs(path, ["C12", "H1", "Am242_m1"])
+    mtime = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+    assert check_nuclear_data(str(path), ["C12", "H1", "Am242_m1"])
+    assert get_library(str(path)) is not lib
+
+
+def test_missing_nuclear_data_types(tmp_path):
+    # Only neutron entries provide the data of a nuclide
+    path = tmp_path / "cross_sections.xml"
+    write_xs(path, ["H", "U235"], "photon")
+    assert missing_nuclear_data(str(path), ["H", "U235"]) == {"H", "U235"}
+    assert get_library_entry(str(path), "H") is None
+    assert get_library_entry(str(path), "H", "photon")["path"].endswith("H.h5")
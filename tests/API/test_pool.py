@@ -0,0 +1,70 @@
+import logging
+import os
+import warnings
+
+import pytest
+
+from ndmanager.API.pool import get_pool, imap, isolated, shutdown, starmap
+
+
+def square(x):
+    return x * x
+
+
+def fail(x):
+    if x == 3:
+        raise ValueError("Failure")
+    return x
+
+
+def pid(_):
+    return os.getpid()
+
+
+def configure(name):
+    logger = logging.getLogger(name)
+    logger.addHandler(logging.NullHandler())
+    warnings.showwarning = lambda *args, **kwargs: None
+    warnings.simplefilter("ignore")
+    return len(logger.handlers)
+
+
+def test_isolated():
+    showwarning = warnings.showwarning
+    filters = list(warnings.filters)
+    assert isolated(configure, "ndmanager-test") == 1
+    assert isolated(configure, "ndmanager-test") == 1
+    assert logging.getLogger("ndmanager-test").handlers == []
+    assert warnings.showwarning is showwarning
+    assert warnings.filters == filters
+
+
+def test_imap():
+    assert list(imap(square, range(10), 2)) == [x * x for x in range(10)]
+    assert sorted(imap(square, range(10), 2, unordered=True)) == [x * x for x in range(10)]
+    assert list(starmap(pow, [(2, 3), (3, 2)], 2)) == [8, 9]
+
+    # The pool is reused across calls
+    pool = get_pool(2)
+    workers = set(imap(pid, range(20), 2))
+    assert get_pool(2) is pool
+    assert len(workers | set(imap(pid, range(20), 2))) <= 2
+
+    with pytest.raises(ValueError):
+        list(imap(fail, range(10), 2))
+    assert get_pool(2) is not pool
+
+    # A single pool is kept, and replaced when its size changes
+    pool = get_pool(2)
+    assert len(set(imap(pid, range(20), 3))) <= 3
+    assert get_pool(3) is not pool
+    with pytest.raises(ValueError):
+        pool.apply(square, (2,))
+    shutdown()
+
+
+def test_imap_in_process():
+    assert list(imap(pid, range(3))) == [os.getpid()] * 3
+    assert list(starmap(pow, [(2, 3), (3, 2)])) == [8, 9]
+    with pytest.raises(ValueError):
+        list(imap(fail, range(10)))
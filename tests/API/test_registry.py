@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import h5py
+import pytest
+
+import ndmanager.API.registry as registry
+from ndmanager.API.registry import (
+    find_libraries,
+    load_registry,
+    read_registry,
+    register_library,
+    rescan,
+    unregister_library,
+)
+
+
+def make_library(root, name, nuclides, temperatures, summary=None):
+    libdir = root / name
+    (libdir / "neutron").mkdir(parents=True)
+    lines = ["<?xml version='1.0' encoding='utf-8'?>", "<cross_sections>"]
+    for nuclide in nuclides:
+        with h5py.File(libdir / "neutron" / f"{nuclide}.h5", "w") as f:
+            for t in temperatures:
+                f.create_dataset(f"{nuclide}/kTs/{t}K", data=0.0)
+        lines.append(
+            f'  <library materials="{nuclide}" path="neutron/{nuclide}.h5" '
+            'type="neutron" />'
+        )
+    lines.append("</cross_sections>")
+    (libdir / "cross_sections.xml").write_text("\n".join(lines))
+    if summary is not None:
+        (libdir / "input.yml").write_text(f"name: {name}\nsummary: {summary}\n")
+
+
+@pytest.fixture
+def hdf5(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, "NDMANAGER_HDF5", tmp_path)
+    make_library(tmp_path, "official/endfb8", ["H1", "O16"], [294, 600])
+    make_library(tmp_path, "custom", ["U235"], [294], summary="A custom library")
+    return tmp_path
+
+
+def test_find_libraries(hdf5):
+    # Libraries nested in other libraries are not found, the walk stops at
+    # the first cross_sections.xml file
+    make_library(hdf5, "custom/nested", ["H1"], [294])
+    (hdf5 / ".hidden").mkdir()
+    assert find_libraries(hdf5, 2) == ["custom", "official/endfb8"]
+
+
+def test_registry(hdf5):
+    assert load_registry() is None
+    libraries = rescan(2)
+    assert load_registry() == libraries
+    assert libraries["custom"]["summary"] == "A custom library"
+    assert libraries["official/endfb8"]["nuclides"] == {"neutron": 2}
+    assert libraries["official/endfb8"]["temperatures"] == [294, 600]
+    assert libraries["official/endfb8"]["status"] == "complete"
+    assert libraries["custom"]["size"] > 0
+
+    make_library(hdf5, "other", ["C12"], [900])
+    (hdf5 / "other/neutron/C12.h5").unlink()
+    register_library("other")
+    assert load_registry()["other"]["status"] == "incomplete"
+
+    unregister_library("custom")
+    assert set(load_registry()) == {"official/endfb8", "other"}
+
+
+def test_register_without_registry(hdf5, monkeypatch):
+    # Registering a library does not walk the other libraries
+    monkeypatch.setattr(registry, "rescan", None)
+    register_library("custom")
+    assert set(read_registry()["libraries"]) == {"custom"}
+    # The registry is incomplete until the next rescan
+    assert load_registry() is None
+    monkeypatch.undo()
+    monkeypatch.setattr(registry, "NDMANAGER_HDF5", hdf5)
+    rescan(2)
+    register_library("custom")
+    assert set(load_registry()) == {"custom", "official/endfb8"}
+
+
+def test_concurrent_registration(hdf5):
+    names = [f"lib{i}" for i in range(16)]
+    for name in names:
+        make_library(hdf5, name, ["H1"], [294])
+    rescan(2)
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(register_library, names))
+    assert set(names) < set(load_registry())
@@ -0,0 +1,180 @@
+import os
+import shutil
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import ndmanager.API.store as store
+from ndmanager.API.store import (
+    add_library,
+    blob_path,
+    locked_refs,
+    prune_store,
+    read_manifest,
+    release_library,
+    restore_library,
+    track_library,
+)
+
+
+def make_library(root, name, files):
+    libdir = root / name
+    libdir.mkdir(parents=True, exist_ok=True)
+    lines = ["<?xml version='1.0' encoding='utf-8'?>", "<cross_sections>"]
+    for nuclide, (kind, content) in files.items():
+        (libdir / kind).mkdir(parents=True, exist_ok=True)
+        (libdir / kind / f"{nuclide}.h5").write_bytes(content)
+        lines.append(
+            f'  <library materials="{nuclide}" path="{kind}/{nuclide}.h5" '
+            f'type="{kind}" />'
+        )
+    lines.append("</cross_sections>")
+    (libdir / "cross_sections.xml").write_text("\n".join(lines))
+
+
+def paths(root, name, relative=False):
+    xspath = root / name / "cross_sections.xml"
+    nodes = ET.parse(xspath).getroot().findall("library")
+    if relative:
+        return {node.get("materials"): node.get("path") for node in nodes}
+    return {node.get("materials"): xspath.parent / node.get("path") for node in nodes}
+
+
+def refs():
+    with locked_refs() as r:
+        return {sha1: sorted(names) for sha1, names in r.items()}
+
+
+@pytest.fixture
+def hdf5(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "NDMANAGER_HDF5", tmp_path)
+    make_library(
+        tmp_path,
+        "official/endfb8",
+        {"H1": ("neutron", b"H1 endfb8"), "H": ("photon", b"H photo")},
+    )
+    make_library(
+        tmp_path,
+        "custom",
+        {"H1": ("neutron", b"H1 custom"), "H": ("photon", b"H photo")},
+    )
+    return tmp_path
+
+
+def test_add_library(hdf5):
+    assert add_library("official/endfb8") == 0
+    assert add_library("custom") == len(b"H photo")
+
+    # Files stay in their library, as hardlinks to the blobs
+    endfb8, custom = paths(hdf5, "official/endfb8"), paths(hdf5, "custom")
+    assert paths(hdf5, "custom", relative=True) == {
+        "H1": "neutron/H1.h5",
+        "H": "photon/H.h5",
+    }
+    assert os.path.samefile(endfb8["H"], custom["H"])
+    assert not os.path.samefile(endfb8["H1"], custom["H1"])
+    assert custom["H1"].read_bytes() == b"H1 custom"
+    assert os.access(custom["H1"], os.W_OK)
+    assert len(list((hdf5 / ".store/objects").glob("*/*.h5"))) == 3
+
+    manifest = read_manifest("custom")
+    assert set(manifest) == {"neutron/H1.h5", "photon/H.h5"}
+    assert os.path.samefile(blob_path(manifest["photon/H.h5"]), custom["H"])
+    assert refs()[manifest["photon/H.h5"]] == ["custom", "official/endfb8"]
+
+    # Adding a library twice changes nothing
+    assert add_library("custom") == 0
+    assert paths(hdf5, "custom") == custom
+    assert read_manifest("custom") == manifest
+
+
+def test_release_library(hdf5):
+    add_library("official/endfb8")
+    add_library("custom")
+    shared = paths(hdf5, "custom")["H"]
+
+    # The data of blobs is only freed once the files of the library are
+    # removed
+    shutil.rmtree(hdf5 / "official/endfb8")
+    assert release_library("official/endfb8") == len(b"H1 endfb8")
+    assert shared.exists()
+    assert release_library("custom") == 0
+    assert not list((hdf5 / ".store/objects").glob("*/*.h5"))
+    assert refs() == {}
+    assert shared.read_bytes() == b"H photo"
+
+
+def test_reuse(hdf5):
+    # Libraries pointing to the files of another library, as with the reuse
+    # keyword, keep working when the other library is added to the store
+    for name in ["reuse", "before"]:
+        make_library(hdf5, name, {})
+        (hdf5 / name / "cross_sections.xml").write_text(
+            "<cross_sections>"
+            f'<library materials="H1" path="{hdf5}/custom/neutron/H1.h5" '
+            'type="neutron" />'
+            "</cross_sections>"
+        )
+    add_library("custom")
+    assert paths(hdf5, "before")["H1"].read_bytes() == b"H1 custom"
+
+    # A library added to the store points to the blobs of the files of other
+    # libraries, relative to its directory
+    add_library("reuse")
+    sha1 = read_manifest("custom")["neutron/H1.h5"]
+    assert paths(hdf5, "reuse", relative=True)["H1"] == os.path.relpath(
+        blob_path(sha1), hdf5 / "reuse"
+    )
+    shutil.rmtree(hdf5 / "custom")
+    release_library("custom")
+    assert paths(hdf5, "reuse")["H1"].read_bytes() == b"H1 custom"
+
+
+def test_restore_library(hdf5):
+    add_library("official/endfb8")
+    add_library("custom")
+    restore_library("custom")
+
+    custom = paths(hdf5, "custom")
+    assert custom["H"] == hdf5 / "custom/photon/H.h5"
+    assert custom["H"].read_bytes() == b"H photo"
+    assert custom["H"].stat().st_nlink == 1
+    assert os.access(custom["H"], os.W_OK)
+    assert custom["H1"].read_bytes() == b"H1 custom"
+    assert read_manifest("custom") == {}
+    assert all("custom" not in names for names in refs().values())
+    assert paths(hdf5, "official/endfb8")["H"].exists()
+
+
+def test_prune_store(hdf5):
+    add_library("official/endfb8")
+    add_library("custom")
+    shutil.rmtree(hdf5 / "custom")
+    assert prune_store() == len(b"H1 custom")
+    assert len(refs()) == 2
+
+
+def test_track_library(hdf5):
+    # A library pointing to the blobs of the store, e.g. built with the reuse
+    # keyword from a library that does, keeps them until it is removed
+    add_library("custom")
+    blob = blob_path(read_manifest("custom")["neutron/H1.h5"])
+    make_library(hdf5, "reuse", {})
+    (hdf5 / "reuse/cross_sections.xml").write_text(
+        "<cross_sections>"
+        f'<library materials="H1" path="{blob.absolute()}" type="neutron" />'
+        "</cross_sections>"
+    )
+    track_library("reuse")
+    assert paths(hdf5, "reuse", relative=True)["H1"] == os.path.relpath(
+        blob, hdf5 / "reuse"
+    )
+    assert prune_store() == 0
+
+    shutil.rmtree(hdf5 / "custom")
+    assert release_library("custom") == len(b"H photo")
+    assert prune_store() == 0
+    assert paths(hdf5, "reuse")["H1"].read_bytes() == b"H1 custom"
+
+    assert release_library("reuse") == len(b"H1 custom")
+    assert refs() == {}
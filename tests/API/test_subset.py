@@ -0,0 +1,118 @@
+import xml.etree.ElementTree as ET
+
+import h5py
+import numpy as np
+import pytest
+
+import ndmanager.API.subset as subset
+from ndmanager.API.subset import read_materials, select_temperatures, subset_library
+from ndmanager.API.utils import get_temperatures
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch, write_neutron_file):
+    monkeypatch.setattr(subset, "NDMANAGER_HDF5", tmp_path)
+    libdir = tmp_path / "lib"
+    files = {
+        "U235": ("neutron", [294, 600, 900, 1200]),
+        "U238": ("neutron", [294, 600, 900, 1200]),
+        "O16": ("neutron", [294, 600]),
+        "c_H_in_H2O": ("thermal", [294, 600, 900]),
+        "U": ("photon", None),
+        "O": ("photon", None),
+    }
+    lines = ["<?xml version='1.0' encoding='utf-8'?>", "<cross_sections>"]
+    for name, (kind, temperatures) in files.items():
+        (libdir / kind).mkdir(parents=True, exist_ok=True)
+        path = libdir / kind / f"{name}.h5"
+        if temperatures is None:
+            path.write_bytes(name.encode())
+        else:
+            write_neutron_file(
+                path,
+                name,
+                temperatures,
+                np.logspace(-5, 7, 10),
+                {2: 1.0},
+                awr=1.0,
+                zero_kelvin=True,
+            )
+        lines.append(
+            f'  <library materials="{name}" path="{kind}/{name}.h5" type="{kind}" />'
+        )
+    lines.append("</cross_sections>")
+    (libdir / "cross_sections.xml").write_text("\n".join(lines))
+    return tmp_path
+
+
+def test_select_temperatures():
+    available = [294, 600, 900, 1200]
+    assert select_temperatures(available) == {294, 600, 900, 1200}
+    assert select_temperatures(available, 600, 900) == {600, 900}
+    assert select_temperatures(available, 650, 700) == {600, 900}
+    assert select_temperatures(available, 300, 300) == {294, 600}
+    assert select_temperatures(available, 1500, 2000) == {1200}
+
+
+def test_read_materials(tmp_path):
+    (tmp_path / "materials.xml").write_text(
+        """<?xml version='1.0' encoding='utf-8'?>
+<materials>
+  <material id="1" temperature="600">
+    <nuclide name="U235" ao="0.05" />
+    <nuclide name="U238" ao="0.95" />
+  </material>
+  <material id="2" temperature="350.0">
+    <nuclide name="H1" ao="2.0" />
+    <nuclide name="O16" ao="1.0" />
+    <sab name="c_H_in_H2O" />
+  </material>
+</materials>"""
+    )
+    nuclides, thermals, temperatures = read_materials(tmp_path / "materials.xml")
+    assert nuclides == {"U235", "U238", "H1", "O16"}
+    assert thermals == {"c_H_in_H2O"}
+    assert temperatures == {600.0, 350.0}
+
+
+def test_subset_library(library):
+    content = subset_library("lib", "sub", ["U235", "O16"], ["c_H_in_H2O"], 600, 900)
+    assert content == {
+        "U235": {600, 900},
+        "O16": {600},
+        "c_H_in_H2O": {600, 900},
+        "U": None,
+        "O": None,
+    }
+
+    root = ET.parse(library / "sub" / "cross_sections.xml").getroot()
+    materials = {node.get("materials") for node in root.findall("library")}
+    assert materials == {"U235", "O16", "c_H_in_H2O", "U", "O"}
+
+    sub = library / "sub"
+    assert get_temperatures(sub / "neutron/U235.h5") == {600, 900}
+    with h5py.File(sub / "neutron/U235.h5") as f:
+        assert set(f["U235/energy"]) == {"0K", "600K", "900K"}
+        assert set(f["U235/reactions/reaction_002"]) == {"0K", "600K", "900K"}
+        assert f["U235"].attrs["atomic_weight_ratio"] == 1.0
+    with h5py.File(sub / "neutron/O16.h5") as f:
+        assert set(f["O16/kTs"]) == {"600K"}
+
+
+def test_subset_library_untouched(library):
+    content = subset_library("lib", "sub", ["U238"])
+    assert content == {"U238": {294, 600, 900, 1200}, "U": None}
+    # Untouched files are shared with the original library
+    sub, lib = library / "sub", library / "lib"
+    assert (sub / "neutron/U238.h5").read_bytes() == (lib / "neutron/U238.h5").read_bytes()
+    assert (sub / "photon/U.h5").read_bytes() == b"U"
+
+
+def test_subset_library_errors(library):
+    with pytest.raises(KeyError):
+        subset_library("lib", "sub", ["U235", "Pu239"])
+    assert not (library / "sub").exists()
+    with pytest.raises(ValueError):
+        subset_library("nolib", "sub", ["U235"])
+    with pytest.raises(ValueError):
+        subset_library("lib", "lib", ["U235"])
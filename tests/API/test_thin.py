@@ -0,0 +1,58 @@
+import h5py
+import numpy as np
+
+from ndmanager.API.thin import max_relative_error, thin_file, thin_grid
+
+
+def resonance(energy):
+    return 1e3 / (1 + ((energy - 6.67) / 0.05) ** 2) + 10 / np.sqrt(energy) + 5
+
+
+def test_thin_grid():
+    energy = np.logspace(-5, 7, 20000)
+    energy = np.insert(energy, 5000, energy[5000])
+    values = [(0, resonance(energy)), (15000, np.linspace(1.0, 2.0, len(energy) - 15000))]
+    kept = thin_grid(energy, values, rtol=1e-3)
+
+    assert len(kept) < len(energy) / 10
+    assert {0, 5000, 5001, 15000, len(energy) - 1} <= set(kept)
+    assert max_relative_error(energy, values, kept) <= 1e-3
+
+    finer = thin_grid(energy, values, rtol=1e-5)
+    assert len(finer) > len(kept)
+    assert max_relative_error(energy, values, finer) <= 1e-5
+
+
+def test_thin_file(tmp_path, write_neutron_file):
+    energy = np.logspace(-5, 7, 5000)
+    write_neutron_file(
+        tmp_path / "U235.h5",
+        energy=energy,
+        reactions={2: resonance(energy), 16: 2.0},
+        thresholds={16: 100},
+        zero_kelvin=True,
+    )
+    with h5py.File(tmp_path / "U235.h5", "r+") as f:
+        f["U235/total_nu/yield"] = np.ones(3)
+    report = thin_file(tmp_path / "U235.h5", tmp_path / "thin.h5")
+    assert report["nuclide"] == "U235"
+    assert report["points"] == 10000
+    assert report["thinned"] < 1000
+    assert report["error"] <= 1e-3
+
+    with h5py.File(tmp_path / "thin.h5") as f:
+        assert f.attrs["filetype"] == b"data_neutron"
+        g = f["U235"]
+        assert g.attrs["atomic_weight_ratio"] == 233.0
+        assert g["reactions/reaction_002"].attrs["mt"] == 2
+        assert np.array_equal(g["total_nu/yield"][...], np.ones(3))
+        # 0K data is not thinned
+        assert len(g["energy/0K"]) == 5000
+
+        thinned = g["energy/294K"][...]
+        assert report["thinned"] == 2 * len(thinned)
+        xs = g["reactions/reaction_016/294K/xs"]
+        assert thinned[xs.attrs["threshold_idx"]] == energy[100]
+        assert len(xs) == len(thinned) - xs.attrs["threshold_idx"]
+        elastic = g["reactions/reaction_002/294K/xs"][...]
+        assert np.allclose(np.interp(energy, thinned, elastic), resonance(energy), rtol=1e-3)
@@ -1,6 +1,9 @@
+import h5py
+import numpy as np
 import pytest
 
-from ndmanager.API.utils import get_endf6, list_endf6
+from ndmanager.API.utils import (get_endf6, get_temperatures, list_endf6,
+                                 merge_neutron_file)
 
 
 def test_get_endf6(install):
@@ -39,3 +42,67 @@ def test_list_endf6(install):
     params = {"base": "foo", "add": {"bar": "Pu239"}}
     with pytest.raises(ValueError):
         list_endf6("n", params)
+
+
+def write_h1_file(write_neutron_file, path, temperatures):
+    def grid(t):
+        return np.linspace(1e-5, 2e7, 10 + t % 7)
+
+    reactions = {
+        mt: lambda t, mt=mt: np.full(10 + t % 7, mt * t, dtype=float)
+        for mt in (2, 102, 301)
+    }
+    write_neutron_file(path, "H1", temperatures, grid, reactions, awr=0.99916)
+    with h5py.File(path, "r+") as f:
+        g = f["H1"]
+        g.create_dataset("energy/0K", data=np.linspace(1e-5, 2e7, 10))
+        g["total_nu"] = np.ones(3)
+        for t in temperatures:
+            g[f"urr/{t}K/table"] = np.full((3, 3), t, dtype=float)
+
+
+def assert_same_group(a, b):
+    assert set(a.keys()) == set(b.keys())
+    assert dict(a.attrs) == dict(b.attrs)
+    for name, node in a.items():
+        if isinstance(node, h5py.Group):
+            assert_same_group(node, b[name])
+        else:
+            assert np.array_equal(node[()], b[name][()])
+            assert dict(node.attrs) == dict(b[name].attrs)
+
+
+def test_merge_neutron_file(tmp_path, write_neutron_file):
+    write_h1_file(write_neutron_file, tmp_path / "full.h5", [294, 600, 900])
+    write_h1_file(write_neutron_file, tmp_path / "target.h5", [294])
+    write_h1_file(write_neutron_file, tmp_path / "source.h5", [600, 900])
+
+    assert get_temperatures(tmp_path / "target.h5") == {294}
+    added = merge_neutron_file(tmp_path / "source.h5", tmp_path / "target.h5")
+    assert added == {600, 900}
+    assert get_temperatures(tmp_path / "target.h5") == {294, 600, 900}
+
+    with h5py.File(tmp_path / "full.h5") as full:
+        with h5py.File(tmp_path / "target.h5") as merged:
+            assert_same_group(full["H1"], merged["H1"])
+
+
+def test_merge_neutron_file_zero_kelvin(tmp_path, write_neutron_file):
+    # 0K data is carried over if the target file lacks it
+    energy = np.logspace(-5, 7, 100)
+    target = tmp_path / "target.h5"
+    source = tmp_path / "source.h5"
+    write_neutron_file(target, "H1", [294], energy)
+    write_neutron_file(source, "H1", [600], energy, zero_kelvin=True)
+
+    assert merge_neutron_file(source, target) == {600}
+    with h5py.File(source) as s, h5py.File(target) as t:
+        for node in ["energy/0K", "reactions/reaction_002/0K/xs"]:
+            assert np.array_equal(t["H1"][node][()], s["H1"][node][()])
+        assert "0K" not in t["H1/kTs"]
+
+    # 0K data already in the target file is kept
+    write_neutron_file(source, "H1", [900], energy / 2, zero_kelvin=True)
+    merge_neutron_file(source, target)
+    with h5py.File(target) as t:
+        assert np.array_equal(t["H1/energy/0K"][()], energy)
@@ -0,0 +1,90 @@
+import h5py
+import numpy as np
+
+from ndmanager.API.validate import (
+    check_finite,
+    check_library,
+    check_neutron,
+    list_library_files,
+    validate_file,
+)
+
+
+def write_data_file(write_neutron_file, path, name="U235", temperatures=(294, 600), n2n=2.0):
+    # MT16 is the sum of MT875 and MT876
+    write_neutron_file(
+        path,
+        name,
+        temperatures,
+        reactions={2: 10.0, 16: n2n, 875: 0.5, 876: 1.5},
+        thresholds={16: 50, 875: 50, 876: 50},
+        redundant={16},
+    )
+
+
+def write_thermal_file(path, nuclides):
+    with h5py.File(path, "w") as f:
+        g = f.create_group("c_H_in_H2O")
+        g.attrs["nuclides"] = np.array(nuclides, dtype="S")
+        g["kTs/294K"] = 294 * 8.617333262e-5
+        g["294K/elastic/xs"] = np.ones(3)
+
+
+def test_check_neutron(tmp_path, write_neutron_file):
+    write_data_file(write_neutron_file, tmp_path / "ok.h5")
+    assert check_neutron(tmp_path / "ok.h5") == []
+    assert check_finite(tmp_path / "ok.h5") == []
+
+    write_data_file(write_neutron_file, tmp_path / "bad.h5", n2n=2.1)
+    failures = check_neutron(tmp_path / "bad.h5")
+    assert [f["check"] for f in failures] == ["sum", "sum"]
+    assert {f["temperature"] for f in failures} == {"294K", "600K"}
+    assert check_neutron(tmp_path / "bad.h5", rtol=0.1) == []
+
+    with h5py.File(tmp_path / "bad.h5", "r+") as f:
+        f["U235/energy/600K"][10] = 1e8
+        f["U235/reactions/reaction_002/294K/xs"][3] = np.nan
+    assert [f["check"] for f in check_finite(tmp_path / "bad.h5")] == ["finite"]
+    grid = [f for f in check_neutron(tmp_path / "bad.h5") if f["check"] == "grid"]
+    assert [f["temperature"] for f in grid] == ["600K"]
+
+
+def test_check_neutron_capture(tmp_path, write_neutron_file):
+    # MT1 is the sum of MT2, and of MT102 and MT182 through MT3, MT27 and MT101
+    path = tmp_path / "U235.h5"
+    write_neutron_file(
+        path,
+        reactions={1: 11.5, 2: 10.0, 102: 1.0, 182: 0.5},
+        redundant={1},
+    )
+    assert check_neutron(path) == []
+
+
+def test_check_library(tmp_path, write_neutron_file):
+    libdir = tmp_path / "lib"
+    (libdir / "neutron").mkdir(parents=True)
+    (libdir / "thermal").mkdir()
+    write_data_file(write_neutron_file, libdir / "neutron/U235.h5")
+    write_data_file(write_neutron_file, libdir / "neutron/U238.h5", "U238")
+    write_data_file(write_neutron_file, libdir / "neutron/H1.h5", "H1", temperatures=(294,))
+    write_thermal_file(libdir / "thermal/c_H_in_H2O.h5", ["H1", "H2"])
+    (libdir / "cross_sections.xml").write_text(
+        """<?xml version='1.0' encoding='utf-8'?>
+<cross_sections>
+  <library materials="U235" path="neutron/U235.h5" type="neutron" />
+  <library materials="U238" path="neutron/U238.h5" type="neutron" />
+  <library materials="H1" path="neutron/H1.h5" type="neutron" />
+  <library materials="c_H_in_H2O" path="thermal/c_H_in_H2O.h5" type="thermal" />
+  <library materials="Pu239" path="neutron/Pu239.h5" type="neutron" />
+</cross_sections>"""
+    )
+    reports = [validate_file(args) for args in list_library_files(libdir / "cross_sections.xml")]
+    assert [r["failures"] for r in reports[:4]] == [[], [], [], []]
+    assert reports[3]["nuclides"] == ["H1", "H2"]
+    assert [f["check"] for f in reports[4]["failures"]] == ["read"]
+
+    failures = check_library(reports)
+    assert {(f["material"], f["check"]) for f in failures} == {
+        ("H1", "temperatures"),
+        ("c_H_in_H2O", "pairing"),
+    }
@@ -2,6 +2,8 @@ import argparse as ap
 from pathlib import Path
 import shutil
 
+import h5py
+import numpy as np
 import pytest
 
 from ndmanager import IAEA
@@ -67,3 +69,62 @@ tsl:
         print(data, file=f)
     namespace = ap.Namespace(filename=str(p), dryrun=False, clean=False, j=2, temperatures=None)
     build(namespace)
+
+
+def _write_neutron_file(
+    path,
+    name="U235",
+    temperatures=(294, 600),
+    energy=None,
+    reactions=None,
+    thresholds=None,
+    redundant=(),
+    products=None,
+    awr=233.0,
+    zero_kelvin=False,
+):
+    """Write a synthetic OpenMC HDF5 neutron data file. Energy grids and cross
+    sections are either arrays, scalars for cross sections, or functions of
+    the temperature returning them. Cross sections above a threshold only
+    hold the values above the threshold index. Products are given as
+    (particle, multiplicity) pairs."""
+    energy = np.logspace(-5, 7, 100) if energy is None else energy
+    reactions = {2: 10.0} if reactions is None else reactions
+    thresholds = thresholds or {}
+    products = products or {}
+    with h5py.File(path, "w") as f:
+        f.attrs["filetype"] = np.bytes_("data_neutron")
+        g = f.create_group(name)
+        g.attrs["atomic_weight_ratio"] = awr
+        for t in temperatures:
+            grid = energy(t) if callable(energy) else energy
+            g[f"kTs/{t}K"] = t * 8.617333262e-5
+            g[f"energy/{t}K"] = grid
+            for mt, xs in reactions.items():
+                r = g.require_group(f"reactions/reaction_{mt:03d}")
+                r.attrs["mt"] = mt
+                r.attrs["redundant"] = int(mt in redundant)
+                idx = thresholds.get(mt, 0)
+                xs = xs(t) if callable(xs) else xs
+                if np.isscalar(xs):
+                    xs = np.full(len(grid) - idx, float(xs))
+                r[f"{t}K/xs"] = xs
+                r[f"{t}K/xs"].attrs["threshold_idx"] = idx
+        for mt, pairs in products.items():
+            r = g[f"reactions/reaction_{mt:03d}"]
+            for i, (particle, multiplicity) in enumerate(pairs):
+                product = r.create_group(f"product_{i}")
+                product.attrs["particle"] = np.bytes_(particle)
+                product["yield"] = np.array([multiplicity])
+                product["yield"].attrs["type"] = np.bytes_("Polynomial")
+        if zero_kelvin:
+            g["energy/0K"] = g[f"energy/{temperatures[0]}K"][...]
+            g["reactions/reaction_002/0K/xs"] = g[
+                f"reactions/reaction_002/{temperatures[0]}K/xs"
+            ][...]
+
+
+@pytest.fixture
+def write_neutron_file():
+    """Factory of synthetic OpenMC HDF5 neutron data files"""
+    return _write_neutron_file